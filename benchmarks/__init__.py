@@ -0,0 +1,60 @@
+"""Benchmarks for the data structures in the library."""
+
+import time
+import tracemalloc
+
+
+def time_call(func, repeat=3):
+    """
+    Time a function call.
+
+    Args:
+        func: The function to time, called without arguments.
+        repeat: The number of times to call the function.
+
+    Returns:
+        The fastest time in seconds taken by a call.
+
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+        if best is None or duration < best:
+            best = duration
+    return best
+
+
+def allocated_bytes(func):
+    """
+    Measure the memory allocated by a function that is still in use on return.
+
+    Args:
+        func: The function to measure, called without arguments.
+
+    Returns:
+        The number of bytes allocated while the return value is alive.
+
+    """
+    tracemalloc.start()
+    result = func()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return allocated
+
+
+def bytes_per_element(build, values):
+    """
+    Measure the memory allocated by a build function per value.
+
+    Args:
+        build: The function that builds the structure from the values.
+        values: The values for the structure.
+
+    Returns:
+        The number of bytes allocated per value while the structure is alive.
+
+    """
+    return allocated_bytes(lambda: build(values)) / len(values)
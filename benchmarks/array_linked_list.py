@@ -0,0 +1,47 @@
+"""
+Benchmark memory and garbage collection cost of the array backed linked list.
+
+Compares the array backed linked list, storing the values in a Python list and in a
+typed array, against the linked list. Run using:
+
+    python -m benchmarks.array_linked_list
+
+"""
+
+import argparse
+import gc
+
+import benchmarks
+from library import linked_list
+
+
+def main():
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**6)
+    args = parser.parse_args()
+    # Values above the small integer cache so that each value is an object
+    values = list(range(1000, 1000 + args.size))
+
+    factories = {
+        "LinkedList": linked_list.LinkedList.from_iterable,
+        "ArrayLinkedList": linked_list.ArrayLinkedList.from_iterable,
+        "ArrayLinkedList(q)": lambda values_: linked_list.ArrayLinkedList.from_iterable(
+            values_, "q"
+        ),
+    }
+
+    print(f"{'list':<20} {'bytes per element':>18} {'tracked objects':>16} {'gc s':>8}")
+    for name, factory in factories.items():
+        memory = benchmarks.bytes_per_element(factory, values)
+        gc.collect()
+        tracked_before = len(gc.get_objects())
+        list_ = factory(values)
+        tracked = len(gc.get_objects()) - tracked_before
+        duration = benchmarks.time_call(gc.collect)
+        print(f"{name:<20} {memory:>18.1f} {tracked:>16,} {duration:>8.3f}")
+        del list_
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark handing values from a producer coroutine to a consumer coroutine.
+
+Compares the async queue and stack with asyncio.Queue for reference. Run using:
+
+    python -m benchmarks.async_handoff
+
+"""
+
+import argparse
+import asyncio
+
+import benchmarks
+from library import asynchronous
+
+
+class AsyncioQueue:
+    """asyncio.Queue with the same interface as the async queue."""
+
+    def __init__(self, length):
+        """Construct."""
+        self._queue = asyncio.Queue(length)
+
+    async def enqueue(self, value):
+        """Add a value to the back of the queue."""
+        await self._queue.put(value)
+
+    async def dequeue(self):
+        """Remove and return the value at the front of the queue."""
+        return await self._queue.get()
+
+
+async def handoff(container, put, get, count):
+    """
+    Pass values from a producer to a consumer coroutine.
+
+    Args:
+        container: The stack or queue to pass the values through.
+        put: Function that adds a value to the container and returns an awaitable.
+        get: Function that removes a value from the container and returns an
+            awaitable.
+        count: The number of values to pass.
+
+    """
+
+    async def produce():
+        """Add the values."""
+        for value in range(count):
+            await put(container, value)
+
+    async def consume():
+        """Remove the values."""
+        for _ in range(count):
+            await get(container)
+
+    await asyncio.gather(produce(), consume())
+
+
+def main():
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=10**6)
+    parser.add_argument("--length", type=int, default=100)
+    args = parser.parse_args()
+
+    containers = {
+        "AsyncQueue": (
+            lambda: asynchronous.AsyncQueue(args.length),
+            asynchronous.AsyncQueue.enqueue,
+            asynchronous.AsyncQueue.dequeue,
+        ),
+        "AsyncStack": (
+            lambda: asynchronous.AsyncStack(args.length),
+            asynchronous.AsyncStack.push,
+            asynchronous.AsyncStack.pop,
+        ),
+        "asyncio.Queue": (
+            lambda: AsyncioQueue(args.length),
+            AsyncioQueue.enqueue,
+            AsyncioQueue.dequeue,
+        ),
+    }
+
+    print(f"{'container':<14} {'handoffs/s':>12}")
+    for name, (create, put, get) in containers.items():
+        duration = benchmarks.time_call(
+            lambda create_=create, put_=put, get_=get: asyncio.run(
+                handoff(create_(), put_, get_, args.count)
+            ),
+            repeat=1,
+        )
+        print(f"{name:<14} {args.count / duration:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark the linked list with and without an index of the values.
+
+Times searching, inserting relative to and deleting random values and reports the
+memory used per element, including the index. Also times searching for and removing
+a value that is in the list many times. Run using:
+
+    python -m benchmarks.linked_list_index
+
+"""
+
+import argparse
+import random
+
+import benchmarks
+from library import linked_list
+
+
+def operations(list_, keys):
+    """
+    Search for, insert relative to and delete each key.
+
+    Args:
+        list_: The list to operate on.
+        keys: The keys that are in the list.
+
+    """
+    for key in keys:
+        list_.search(key)
+        list_.insert_after(key, -1)
+        list_.insert_before(key, -2)
+        list_.delete(-1)
+        list_.delete(-2)
+
+
+def duplicates(list_, searches):
+    """
+    Search for the duplicated value and then remove all its occurrences.
+
+    Args:
+        list_: The list where most values are 0.
+        searches: The number of times to search for 0.
+
+    """
+    for _ in range(searches):
+        list_.search(0)
+    list_.remove_all(0)
+
+
+def main():
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**3, 10**4, 10**5])
+    parser.add_argument("--keys", type=int, default=100)
+    parser.add_argument("--duplicates", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{'size':>9} {'indexed':<8} {'ops/s':>12} {'bytes per element':>18}")
+    for size in args.sizes:
+        values = list(range(size))
+        keys = random.Random(0).sample(values, min(args.keys, size))
+        for indexed in (False, True):
+            list_ = linked_list.LinkedList.from_iterable(values, indexed)
+            duration = benchmarks.time_call(
+                lambda list__=list_, keys_=keys: operations(list__, keys_), repeat=1
+            )
+            memory = benchmarks.bytes_per_element(
+                lambda values_, indexed_=indexed: linked_list.LinkedList.from_iterable(
+                    values_, indexed_
+                ),
+                values,
+            )
+            ops = 5 * len(keys) / duration
+            print(f"{size:>9} {str(indexed):<8} {ops:>12,.0f} {memory:>18.1f}")
+
+    print()
+    print(f"{'duplicates':>10} {'indexed':<8} {'seconds':>10}")
+    values = [0] * args.duplicates + list(range(1, args.duplicates))
+    for indexed in (False, True):
+        list_ = linked_list.LinkedList.from_iterable(values, indexed)
+        duration = benchmarks.time_call(
+            lambda list__=list_: duplicates(list__, args.keys), repeat=1
+        )
+        print(f"{args.duplicates:>10} {str(indexed):<8} {duration:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
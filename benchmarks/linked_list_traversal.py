@@ -0,0 +1,91 @@
+"""
+Benchmark search and traverse of the linked list.
+
+Compares the loop based implementation against the recursive implementation that
+was used previously. Run using:
+
+    python -m benchmarks.linked_list_traversal
+
+"""
+
+import argparse
+
+import benchmarks
+from library import linked_list
+
+
+def recursive_traverse(node, func):
+    """
+    Call function with the value of each node using recursion.
+
+    Args:
+        node: The node to start at.
+        func: The function to call.
+
+    """
+    if node is None:
+        return
+
+    func(node.value)
+    recursive_traverse(node.next_, func)
+
+
+def recursive_search(node, value):
+    """
+    Check whether the value is in the list starting at the node using recursion.
+
+    Args:
+        node: The node to start at.
+        value: The value to search for.
+
+    Returns:
+        Whether the value was found.
+
+    """
+    if node is None:
+        return False
+
+    if node.value == value:
+        return True
+
+    return recursive_search(node.next_, value)
+
+
+def run(size):
+    """
+    Run the benchmark for a list of a size and print the results.
+
+    Args:
+        size: The number of nodes in the list.
+
+    """
+    list_ = linked_list.LinkedList()
+    for value in range(size):
+        list_.add_last(value)
+
+    cases = {
+        "search loop": lambda: list_.search(-1),
+        "search recursive": lambda: recursive_search(list_.head, -1),
+        "traverse loop": lambda: list_.traverse(id),
+        "traverse recursive": lambda: recursive_traverse(list_.head, id),
+    }
+    for name, func in cases.items():
+        try:
+            duration = benchmarks.time_call(func)
+        except RecursionError:
+            print(f"{size:>9} {name:<20} RecursionError")
+            continue
+        print(f"{size:>9} {name:<20} {size / duration:>14,.0f} nodes/s")
+
+
+def main():
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[900, 10**6])
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmark iterating over a window of a linked list using a view and using a copy.
+
+Times summing the values of a window of the list and reports the memory allocated
+for the window. Run using:
+
+    python -m benchmarks.linked_list_view
+
+"""
+
+import argparse
+import itertools
+
+import benchmarks
+from library import linked_list
+
+
+def copy_window(list_, start, stop):
+    """Copy the values of a window of the list into a new list."""
+    return linked_list.LinkedList.from_iterable(itertools.islice(list_, start, stop))
+
+
+def main():
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**5)
+    parser.add_argument("--start", type=int, default=1000)
+    parser.add_argument("--stop", type=int, default=2000)
+    args = parser.parse_args()
+
+    list_ = linked_list.LinkedList.from_iterable(range(args.size))
+    windows = {
+        "copy": lambda: copy_window(list_, args.start, args.stop),
+        "view": lambda: list_.view(args.start, args.stop),
+    }
+
+    print(f"{'window':<8} {'seconds':>10} {'bytes':>10}")
+    for name, window in windows.items():
+        duration = benchmarks.time_call(lambda window_=window: sum(window_()))
+        memory = benchmarks.allocated_bytes(window)
+        print(f"{name:<8} {duration:>10.6f} {memory:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Report the memory used per element by the linked structures.
+
+Compares nodes using __slots__ against equivalent nodes with a per instance
+dictionary, which is how the nodes were defined previously. Run using:
+
+    python -m benchmarks.node_memory
+
+"""
+
+import argparse
+
+import benchmarks
+from library import binary_tree
+from library import linked_list
+from library import stack
+
+
+class DictNode:
+    """Node for a list or stack with a per instance dictionary."""
+
+    def __init__(self, value, next_=None):
+        """Construct."""
+        self.value = value
+        self.next_ = next_
+
+
+class DictTreeNode:
+    """Node for a binary tree with a per instance dictionary."""
+
+    def __init__(self, value, left=None, right=None):
+        """Construct."""
+        self.value = value
+        self.left = left
+        self.right = right
+
+
+def build_chain(values):
+    """
+    Link nodes with a per instance dictionary for each value.
+
+    Args:
+        values: The values for the nodes.
+
+    Returns:
+        The first node.
+
+    """
+    head = None
+    for value in reversed(values):
+        head = DictNode(value, head)
+    return head
+
+
+def build_linked_list(values):
+    """
+    Build a linked list with the values.
+
+    Args:
+        values: The values for the list.
+
+    Returns:
+        The linked list.
+
+    """
+    list_ = linked_list.LinkedList()
+    for value in values:
+        list_.add_last(value)
+    return list_
+
+
+def build_stack(values):
+    """
+    Build a stack with the values.
+
+    Args:
+        values: The values for the stack.
+
+    Returns:
+        The stack.
+
+    """
+    stack_ = stack.Stack()
+    for value in values:
+        stack_.push(value)
+    return stack_
+
+
+def build_balanced_tree(node_class, values):
+    """
+    Build a balanced tree using a node class.
+
+    Args:
+        node_class: The class for the nodes.
+        values: The sorted values for the tree.
+
+    Returns:
+        The root node.
+
+    """
+
+    def build(start, stop):
+        if start >= stop:
+            return None
+        middle = (start + stop) // 2
+        return node_class(values[middle], build(start, middle), build(middle + 1, stop))
+
+    return build(0, len(values))
+
+
+def main():
+    """Parse the arguments and print the memory report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**6)
+    args = parser.parse_args()
+    values = list(range(args.size))
+
+    cases = {
+        "linked list": (build_chain, build_linked_list),
+        "stack": (build_chain, build_stack),
+        "binary tree": (
+            lambda values_: build_balanced_tree(DictTreeNode, values_),
+            lambda values_: binary_tree.BinaryTree(
+                build_balanced_tree(binary_tree.Node, values_)
+            ),
+        ),
+    }
+    print(f"{'structure':<12} {'before':>8} {'after':>8} (bytes per element)")
+    for name, (before, after) in cases.items():
+        before_bytes = benchmarks.bytes_per_element(before, values)
+        after_bytes = benchmarks.bytes_per_element(after, values)
+        print(f"{name:<12} {before_bytes:>8.1f} {after_bytes:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Benchmark the cost of a snapshot of a list.
+
+Compares cloning the linked list, which copies every node, against cloning the
+persistent list and adding a value to the front of the snapshot. Run using:
+
+    python -m benchmarks.persistent_list
+
+"""
+
+import argparse
+
+import benchmarks
+from library import linked_list
+
+
+def main():
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**5, 10**6])
+    args = parser.parse_args()
+
+    print(f"{'size':>9} {'operation':<28} {'seconds':>12} {'bytes':>12}")
+    for size in args.sizes:
+        values = range(size)
+        list_ = linked_list.LinkedList.from_iterable(values)
+        persistent_list = linked_list.PersistentList.from_iterable(values)
+        cases = {
+            "LinkedList.clone": list_.clone,
+            "PersistentList.clone": persistent_list.clone,
+            "PersistentList.clone+cons": (
+                lambda list__=persistent_list: list__.clone().cons(-1)
+            ),
+        }
+        for name, func in cases.items():
+            duration = benchmarks.time_call(func)
+            memory = benchmarks.allocated_bytes(func)
+            print(f"{size:>9} {name:<28} {duration:>12.6f} {memory:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark moving batches of values through the queue.
+
+Compares enqueueing and dequeueing each value with enqueue_many and dequeue_many.
+The batch size does not divide the length of the queue so that batches wrap
+around the end of the array. Run using:
+
+    python -m benchmarks.queue_batch
+
+"""
+
+import argparse
+
+import benchmarks
+from library import queue
+
+
+def one_by_one(test_queue, batch, rounds):
+    """
+    Enqueue and dequeue batches of values one value at a time.
+
+    Args:
+        test_queue: The queue to use.
+        batch: The values to enqueue in each round.
+        rounds: The number of rounds.
+
+    """
+    for _ in range(rounds):
+        for value in batch:
+            test_queue.enqueue(value)
+        for _ in batch:
+            test_queue.dequeue()
+
+
+def batched(test_queue, batch, rounds):
+    """
+    Enqueue and dequeue batches of values using enqueue_many and dequeue_many.
+
+    Args:
+        test_queue: The queue to use.
+        batch: The values to enqueue in each round.
+        rounds: The number of rounds.
+
+    """
+    for _ in range(rounds):
+        test_queue.enqueue_many(batch)
+        test_queue.dequeue_many(len(batch))
+
+
+def main():
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=1000)
+    args = parser.parse_args()
+
+    batch = list(range(args.batch))
+    print(f"{'method':<11} {'ns per value':>13}")
+    for name, run in (("one by one", one_by_one), ("batched", batched)):
+        duration = benchmarks.time_call(
+            lambda run_=run: run_(queue.Queue(3 * args.batch - 1), batch, args.rounds)
+        )
+        print(f"{name:<11} {duration / (args.batch * args.rounds) * 1e9:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
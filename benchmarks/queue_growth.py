@@ -0,0 +1,62 @@
+"""
+Benchmark the queue with a fixed length against the queue in growth mode.
+
+A burst of values is enqueued and then most of them are dequeued. The fixed queue
+has to be constructed with the length of the burst. Reports the time per enqueue
+and dequeue and the memory the queue still uses after the burst. Run using:
+
+    python -m benchmarks.queue_growth
+
+"""
+
+import argparse
+
+import benchmarks
+from library import queue
+
+
+def burst(test_queue, size, remaining):
+    """
+    Enqueue a number of values and dequeue all but some of them.
+
+    Args:
+        test_queue: The queue to use.
+        size: The number of values to enqueue.
+        remaining: The number of values to leave in the queue.
+
+    Returns:
+        The queue.
+
+    """
+    for value in range(size):
+        test_queue.enqueue(value)
+    for _ in range(size - remaining):
+        test_queue.dequeue()
+    return test_queue
+
+
+def main():
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**6)
+    parser.add_argument("--remaining", type=int, default=10)
+    args = parser.parse_args()
+
+    queues = {
+        "fixed": lambda: queue.Queue(args.size),
+        "grow": lambda: queue.Queue(16, grow=True),
+    }
+    print(f"{'queue':<6} {'ns per value':>13} {'bytes after burst':>18}")
+    for name, create in queues.items():
+        duration = benchmarks.time_call(
+            lambda create_=create: burst(create_(), args.size, args.remaining),
+            repeat=1,
+        )
+        memory = benchmarks.allocated_bytes(
+            lambda create_=create: burst(create_(), args.size, args.remaining)
+        )
+        print(f"{name:<6} {duration / args.size * 1e9:>13.1f} {memory:>18,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark search of the self organizing linked list with skewed lookups.
+
+The values that are searched for follow a Zipf distribution, which means that a few
+values are searched for most of the time. The values are shuffled in the list so
+that frequently searched values do not start near the front. Run using:
+
+    python -m benchmarks.self_organizing_list
+
+"""
+
+import argparse
+import itertools
+import random
+
+import benchmarks
+from library import linked_list
+
+
+def zipf_keys(values, count, exponent, generator):
+    """
+    Sample keys from values with a Zipf distribution.
+
+    Args:
+        values: The values to sample from, the first value is the most frequent.
+        count: The number of keys to sample.
+        exponent: The exponent of the distribution.
+        generator: The random generator to use.
+
+    Returns:
+        The list of keys.
+
+    """
+    weights = (1 / rank**exponent for rank in range(1, len(values) + 1))
+    return generator.choices(
+        values, cum_weights=list(itertools.accumulate(weights)), k=count
+    )
+
+
+def search_all(list_, keys):
+    """
+    Search for each key in the list.
+
+    Args:
+        list_: The list to search.
+        keys: The keys to search for.
+
+    """
+    for key in keys:
+        list_.search(key)
+
+
+def main():
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**4)
+    parser.add_argument("--searches", type=int, default=10**5)
+    parser.add_argument("--exponent", type=float, default=1.0)
+    args = parser.parse_args()
+
+    generator = random.Random(0)
+    values = list(range(args.size))
+    keys = zipf_keys(values, args.searches, args.exponent, generator)
+    generator.shuffle(values)
+
+    print(f"{'mode':<14} {'searches/s':>12}")
+    for organize in (None, linked_list.MOVE_TO_FRONT, linked_list.TRANSPOSE):
+        list_ = linked_list.LinkedList.from_iterable(values, organize=organize)
+        duration = benchmarks.time_call(
+            lambda list__=list_: search_all(list__, keys), repeat=1
+        )
+        print(f"{str(organize):<14} {args.searches / duration:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
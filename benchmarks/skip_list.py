@@ -0,0 +1,66 @@
+"""
+Benchmark the skip list against the binary tree.
+
+Inserts values in random and in sorted order and then searches for every value. The
+binary tree is not balanced which means that it degenerates into a linked list for
+sorted values. Run using:
+
+    python -m benchmarks.skip_list
+
+"""
+
+import argparse
+import random
+import sys
+
+import benchmarks
+from library import binary_tree
+from library import linked_list
+
+
+def insert_search(structure, values):
+    """
+    Insert all values into a structure and then search for each value.
+
+    Args:
+        structure: The skip list or binary tree.
+        values: The values to insert and search for.
+
+    """
+    for value in values:
+        structure.insert(value)
+    for value in values:
+        structure.search(value)
+
+
+def main():
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=5000)
+    args = parser.parse_args()
+
+    # The binary tree uses recursion to the depth of the tree
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), args.size + 1000))
+
+    random_values = list(range(args.size))
+    random.Random(0).shuffle(random_values)
+    orders = {"random": random_values, "sorted": sorted(random_values)}
+    factories = {
+        "SkipList": linked_list.SkipList,
+        "BinaryTree": binary_tree.BinaryTree,
+    }
+
+    print(f"{'order':<8} {'structure':<12} {'insert and search ops/s':>24}")
+    for order, values in orders.items():
+        for name, factory in factories.items():
+            duration = benchmarks.time_call(
+                lambda factory_=factory, values_=values: insert_search(
+                    factory_(), values_
+                ),
+                repeat=1,
+            )
+            print(f"{order:<8} {name:<12} {2 * args.size / duration:>24,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark the stack that spills to a file against the array backed stack.
+
+Reports the time per push and pop and the memory in use once all values have been
+pushed. Run using:
+
+    python -m benchmarks.spilling_stack
+
+"""
+
+import argparse
+import functools
+
+import benchmarks
+from library import stack
+
+
+def push_pop(create, values):
+    """
+    Push the values onto a new stack and pop them all.
+
+    Args:
+        create: Function that creates an empty stack.
+        values: The values to push.
+
+    """
+    test_stack = create()
+    for value in values:
+        test_stack.push(value)
+    while not test_stack.is_empty():
+        test_stack.pop()
+
+
+def build(create, values):
+    """
+    Push the values onto a new stack.
+
+    Args:
+        create: Function that creates an empty stack.
+        values: The values to push.
+
+    Returns:
+        The stack.
+
+    """
+    test_stack = create()
+    for value in values:
+        test_stack.push(value)
+    return test_stack
+
+
+def main():
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**6)
+    parser.add_argument("--segment-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    values = [(index, str(index)) for index in range(args.size)]
+    stacks = {
+        "array": stack.ArrayStack,
+        "spilling": functools.partial(
+            stack.SpillingStack, segment_size=args.segment_size
+        ),
+    }
+    print(f"{'stack':<10} {'ns per push and pop':>20} {'bytes in memory':>16}")
+    for name, create in stacks.items():
+        duration = benchmarks.time_call(
+            lambda create_=create: push_pop(create_, values), repeat=1
+        )
+        memory = benchmarks.allocated_bytes(
+            lambda create_=create: build(create_, values)
+        )
+        print(f"{name:<10} {duration / args.size * 1e9:>20.1f} {memory:>16,}")
+
+
+if __name__ == "__main__":
+    main()
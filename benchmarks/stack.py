@@ -0,0 +1,129 @@
+"""
+Benchmark the linked and the array backed stack.
+
+Reports the time per push and pop and the memory used per value, and the time per
+value to push and pop batches of values one by one and using push_many and
+pop_many. Run using:
+
+    python -m benchmarks.stack
+
+"""
+
+import argparse
+import functools
+
+import benchmarks
+from library import stack
+
+STACKS = {
+    "linked": stack.Stack,
+    "array": stack.ArrayStack,
+    "array shrink": functools.partial(stack.ArrayStack, shrink=True),
+}
+
+
+def build(create, values):
+    """
+    Push the values onto a new stack.
+
+    Args:
+        create: Function that creates an empty stack.
+        values: The values to push.
+
+    Returns:
+        The stack.
+
+    """
+    test_stack = create()
+    for value in values:
+        test_stack.push(value)
+    return test_stack
+
+
+def pop_all(test_stack):
+    """
+    Pop all the values from a stack.
+
+    Args:
+        test_stack: The stack to pop from.
+
+    """
+    while not test_stack.is_empty():
+        test_stack.pop()
+
+
+def one_by_one(test_stack, batch, rounds):
+    """
+    Push and pop batches of values one value at a time.
+
+    Args:
+        test_stack: The stack to push onto and pop from.
+        batch: The values to push in each round.
+        rounds: The number of rounds.
+
+    """
+    for _ in range(rounds):
+        for value in batch:
+            test_stack.push(value)
+        for _ in batch:
+            test_stack.pop()
+
+
+def batched(test_stack, batch, rounds):
+    """
+    Push and pop batches of values using push_many and pop_many.
+
+    Args:
+        test_stack: The stack to push onto and pop from.
+        batch: The values to push in each round.
+        rounds: The number of rounds.
+
+    """
+    for _ in range(rounds):
+        test_stack.push_many(batch)
+        test_stack.pop_many(len(batch))
+
+
+def main():
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**6)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+
+    values = list(range(args.size))
+    print(f"{'stack':<14} {'push ns':>8} {'pop ns':>8} {'bytes per element':>18}")
+    for name, create in STACKS.items():
+        push = benchmarks.time_call(
+            lambda create_=create: build(create_, values), repeat=1
+        )
+        test_stack = build(create, values)
+        pop = benchmarks.time_call(
+            lambda test_stack_=test_stack: pop_all(test_stack_), repeat=1
+        )
+        memory = benchmarks.bytes_per_element(
+            lambda values_, create_=create: build(create_, values_), values
+        )
+        print(
+            f"{name:<14} {push / args.size * 1e9:>8.1f} {pop / args.size * 1e9:>8.1f} "
+            f"{memory:>18.1f}"
+        )
+
+    batch = list(range(args.batch))
+    rounds = args.size // args.batch
+    print()
+    print(f"{'stack':<14} {'one by one ns':>14} {'batched ns':>11}")
+    for name, create in STACKS.items():
+        durations = [
+            benchmarks.time_call(
+                lambda run_=run, create_=create: run_(create_(), batch, rounds)
+            )
+            / (rounds * args.batch)
+            * 1e9
+            for run in (one_by_one, batched)
+        ]
+        print(f"{name:<14} {durations[0]:>14.1f} {durations[1]:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
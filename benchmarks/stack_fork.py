@@ -0,0 +1,96 @@
+"""
+Benchmark forking the linked stack during a backtracking search.
+
+At each level of a random dive down a search tree the stack is forked once for
+each branch and a value is pushed onto each fork, then the dive continues with a
+random branch. Compares fork, which shares the nodes, with copying the values.
+Reports the time per dive and the memory used by the stacks of a dive. Run using:
+
+    python -m benchmarks.stack_fork
+
+"""
+
+import argparse
+import random
+
+import benchmarks
+from library import stack
+
+
+def copy(test_stack):
+    """
+    Copy a stack by popping all of its values and pushing them onto both stacks.
+
+    Args:
+        test_stack: The stack to copy.
+
+    Returns:
+        The copy of the stack.
+
+    """
+    values = test_stack.pop_many(len(test_stack))
+    values.reverse()
+    test_stack.push_many(values)
+    copied = stack.Stack()
+    copied.push_many(values)
+    return copied
+
+
+def dive(test_stack, fork, branching, depth, generator):
+    """
+    Dive down a search tree, forking the stack at each level.
+
+    Args:
+        test_stack: The stack at the root of the tree.
+        fork: Function that returns an independent copy of a stack.
+        branching: The number of branches at each level.
+        depth: The number of levels.
+        generator: The random number generator used to pick a branch.
+
+    Returns:
+        The stacks of all the branches.
+
+    """
+    stacks = []
+    for level in range(depth):
+        branches = []
+        for branch in range(branching):
+            branch_stack = fork(test_stack)
+            branch_stack.push((level, branch))
+            branches.append(branch_stack)
+        stacks.extend(branches)
+        test_stack = generator.choice(branches)
+    return stacks
+
+
+def main():
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**4)
+    parser.add_argument("--branching", type=int, default=4)
+    parser.add_argument("--depth", type=int, default=20)
+    parser.add_argument("--dives", type=int, default=10)
+    args = parser.parse_args()
+
+    root = stack.Stack()
+    root.push_many(range(args.size))
+    print(f"{'method':<8} {'ms per dive':>12} {'bytes per dive':>15}")
+    for name, fork in (("fork", stack.Stack.fork), ("copy", copy)):
+
+        def run(fork_=fork):
+            """Run the dives."""
+            generator = random.Random(0)
+            for _ in range(args.dives):
+                dive(root, fork_, args.branching, args.depth, generator)
+
+        duration = benchmarks.time_call(run, repeat=1) / args.dives
+        memory = benchmarks.allocated_bytes(
+            lambda fork_=fork: dive(
+                root, fork_, args.branching, args.depth, random.Random(0)
+            )
+        )
+        print(f"{name:<8} {duration * 1e3:>12.3f} {memory:>15,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark iteration and memory of the unrolled linked list.
+
+Compares the unrolled linked list with different chunk sizes against the linked list.
+Run using:
+
+    python -m benchmarks.unrolled_linked_list
+
+"""
+
+import argparse
+import collections
+
+import benchmarks
+from library import linked_list
+
+
+def build(list_, values):
+    """
+    Add the values to the end of a list.
+
+    Args:
+        list_: The list to add the values to.
+        values: The values to add.
+
+    Returns:
+        The list.
+
+    """
+    for value in values:
+        list_.add_last(value)
+    return list_
+
+
+def main():
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10**6)
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[16, 64, 256])
+    args = parser.parse_args()
+    values = list(range(args.size))
+
+    factories = {"LinkedList": linked_list.LinkedList}
+    for chunk_size in args.chunk_sizes:
+        factories[f"Unrolled({chunk_size})"] = (
+            lambda chunk_size_=chunk_size: linked_list.UnrolledLinkedList(chunk_size_)
+        )
+
+    print(f"{'list':<16} {'iterate values/s':>18} {'bytes per element':>18}")
+    for name, factory in factories.items():
+        list_ = build(factory(), values)
+        duration = benchmarks.time_call(
+            lambda list__=list_: collections.deque(list__, maxlen=0)
+        )
+        memory = benchmarks.bytes_per_element(
+            lambda values_, factory_=factory: build(factory_(), values_), values
+        )
+        print(f"{name:<16} {args.size / duration:>18,.0f} {memory:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
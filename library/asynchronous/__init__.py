@@ -0,0 +1,232 @@
+"""Stack and queue for passing values between asyncio coroutines."""
+
+import asyncio
+import collections
+
+from library import queue
+from library import stack
+
+
+class _Waiters:
+    """Coroutines waiting for a change, woken one at a time in the order they waited."""
+
+    def __init__(self):
+        """Construct."""
+        self._futures = collections.deque()
+
+    async def wait(self):
+        """Wait until woken by a call to wake."""
+        future = asyncio.get_running_loop().create_future()
+        self._futures.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Passing on a wake up that arrived just before the cancellation
+            if not future.cancelled():
+                self.wake()
+            raise
+
+    def wake(self):
+        """Wake the coroutine that has waited the longest, if any."""
+        while self._futures:
+            future = self._futures.popleft()
+            # Skipping waiters that have been cancelled
+            if not future.done():
+                future.set_result(None)
+                return
+
+
+class AsyncStack:
+    """
+    Stack for coroutines where pop waits for a value and push waits for space.
+
+    A coroutine that has to wait adds a future to a queue of waiters and awaits it.
+    The operation that makes a value or space available completes the future of the
+    first waiter, which means that waiting coroutines do not poll the stack.
+    """
+
+    def __init__(self, maxsize=0):
+        """
+        Construct.
+
+        Args:
+            maxsize: The maximum number of values on the stack, the stack is
+                unbounded if it is 0 or less.
+
+        """
+        self.maxsize = maxsize
+        self._stack = stack.ArrayStack()
+        self._poppers = _Waiters()
+        self._pushers = _Waiters()
+
+    def is_full(self):
+        """
+        Check whether the stack is full.
+
+        Returns:
+            Whether the stack has maxsize values.
+
+        """
+        return 0 < self.maxsize <= len(self._stack)
+
+    def push_nowait(self, value):
+        """
+        Add a new value to the stack without waiting.
+
+        Raises StackFullError if the stack is full.
+
+        Args:
+            value: The value to add to the stack.
+
+        """
+        if self.is_full():
+            raise stack.StackFullError
+        self._stack.push(value)
+        self._poppers.wake()
+
+    async def push(self, value):
+        """
+        Add a new value to the stack, waiting for space if it is full.
+
+        Args:
+            value: The value to add to the stack.
+
+        """
+        while self.is_full():
+            await self._pushers.wait()
+        self.push_nowait(value)
+
+    def pop_nowait(self):
+        """
+        Remove the most recently added value from the stack without waiting.
+
+        Raises StackEmptyError if the stack is empty.
+
+        Returns:
+            The most recently added value.
+
+        """
+        value = self._stack.pop()
+        self._pushers.wake()
+        return value
+
+    async def pop(self):
+        """
+        Remove the most recently added value, waiting for one if the stack is empty.
+
+        Returns:
+            The most recently added value.
+
+        """
+        while self._stack.is_empty():
+            await self._poppers.wait()
+        return self.pop_nowait()
+
+    def is_empty(self):
+        """
+        Check whether the stack is empty.
+
+        Returns:
+            Whether the stack is empty.
+
+        """
+        return self._stack.is_empty()
+
+    def __len__(self):
+        """Get the number of values on the stack."""
+        return len(self._stack)
+
+
+class AsyncQueue:
+    """
+    Queue for coroutines where dequeue waits for a value and enqueue waits for space.
+
+    Waiting works the same way as for the AsyncStack.
+    """
+
+    def __init__(self, length=10):
+        """
+        Construct.
+
+        Args:
+            length: The maximum number of values in the queue.
+
+        """
+        self._queue = queue.Queue(length)
+        self._dequeuers = _Waiters()
+        self._enqueuers = _Waiters()
+
+    def is_full(self):
+        """
+        Check whether the queue is full.
+
+        Returns:
+            Whether the queue has length values.
+
+        """
+        return self._queue.size == self._queue.length
+
+    def enqueue_nowait(self, value):
+        """
+        Add a value to the back of the queue without waiting.
+
+        Raises QueueFullError if the queue is full.
+
+        Args:
+            value: The value to add to the queue.
+
+        """
+        self._queue.enqueue(value)
+        self._dequeuers.wake()
+
+    async def enqueue(self, value):
+        """
+        Add a value to the back of the queue, waiting for space if it is full.
+
+        Args:
+            value: The value to add to the queue.
+
+        """
+        while self.is_full():
+            await self._enqueuers.wait()
+        self.enqueue_nowait(value)
+
+    def dequeue_nowait(self):
+        """
+        Remove and return the value at the front of the queue without waiting.
+
+        Raises QueueEmptyError if the queue is empty.
+
+        Returns:
+            The value from the front of the queue.
+
+        """
+        value = self._queue.dequeue()
+        self._enqueuers.wake()
+        return value
+
+    async def dequeue(self):
+        """
+        Remove and return the value at the front, waiting for one if it is empty.
+
+        Returns:
+            The value from the front of the queue.
+
+        """
+        while self._queue.is_empty():
+            await self._dequeuers.wait()
+        return self.dequeue_nowait()
+
+    def is_empty(self):
+        """
+        Check whether the queue is empty.
+
+        Returns:
+            Whether the queue is empty.
+
+        """
+        return self._queue.is_empty()
+
+    def __len__(self):
+        """Get the number of values in the queue."""
+        return self._queue.size
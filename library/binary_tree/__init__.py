@@ -4,6 +4,8 @@
 class Node:
     """A node in the binary search tree."""
 
+    __slots__ = ("value", "left", "right")
+
     def __init__(self, value, left=None, right=None):
         """Construct."""
         self.value = value
@@ -2,10 +2,39 @@
 
 import typing
 
+from . import cursor
+from . import views
+from .array_backed import ArrayLinkedList
+from .doubly import DoublyLinkedList
+from .persistent import ListEmptyError
+from .persistent import PersistentList
+from .skip_list import SkipList
+from .unrolled import UnrolledLinkedList
+
+# Self organizing modes that reorder the list when a value is found by search
+MOVE_TO_FRONT = "move_to_front"
+TRANSPOSE = "transpose"
+
+
+def _identity(value):
+    """
+    Return the value.
+
+    Args:
+        value: The value to return.
+
+    Returns:
+        The value.
+
+    """
+    return value
+
 
 class Node:
     """Represents an node in the linked list."""
 
+    __slots__ = ("value", "next_")
+
     def __init__(self, value, next_=None):
         """
         Construct.
@@ -19,12 +48,154 @@ class Node:
         self.next_ = next_
 
 
-class LinkedList:
-    """Singly linked list."""
+class LinkedList:  # pylint: disable=too-many-public-methods
+    """
+    Singly linked list.
+
+    In indexed mode the list keeps a hash map from each value to its nodes and from
+    each node to the node before it. Searching for, inserting relative to and
+    deleting a value are then O(1) rather than O(n), at the cost of extra memory per
+    node and requiring the values to be hashable. If a value is in the list more
+    than once, the first occurrence is still found by a search from the head that
+    stops at the first node with the value, which is as fast as without the index.
 
-    def __init__(self):
-        """Construct."""
+    In a self organizing mode, a value found by search is moved towards the front of
+    the list, either all the way to the front (MOVE_TO_FRONT) or by swapping it with
+    the value before it (TRANSPOSE). Values that are searched for often then end up
+    near the front where they are found quickly.
+    """
+
+    def __init__(self, indexed=False, organize=None):
+        """
+        Construct.
+
+        Args:
+            indexed: Whether to keep an index of the values.
+            organize: The self organizing mode, MOVE_TO_FRONT, TRANSPOSE or None to
+                not reorder the list on search.
+
+        """
+        if organize not in (None, MOVE_TO_FRONT, TRANSPOSE):
+            raise ValueError(f"Unknown self organizing mode {organize}.")
+        self.organize = organize
         self.head = None
+        # The last node in the list
+        self.tail = None
+        # The number of nodes in the list
+        self._size = 0
+        # Changed by every operation that changes the nodes to detect changes while
+        # a view of the list is used
+        self._version = 0
+        # Map from value to its node, or to a dictionary with its nodes as keys if it
+        # is in the list more than once so that a node can be removed in O(1), and
+        # from node to the node before it
+        self._index = {} if indexed else None
+        self._previous = {} if indexed else None
+
+    @classmethod
+    def from_iterable(cls, iterable, indexed=False, organize=None):
+        """
+        Construct a list with the values of an iterable.
+
+        Args:
+            iterable: The values for the list.
+            indexed: Whether to keep an index of the values.
+            organize: The self organizing mode.
+
+        Returns:
+            The new list.
+
+        """
+        list_ = cls(indexed, organize)
+        list_.extend(iterable)
+        return list_
+
+    @property
+    def indexed(self):
+        """Whether the list keeps an index of the values."""
+        return self._index is not None
+
+    @property
+    def version(self):
+        """Number that changes whenever the nodes of the list change."""
+        return self._version
+
+    def _index_node(self, node, previous):
+        """
+        Add a node that was linked into the list to the index.
+
+        Args:
+            node: The node to add.
+            previous: The node before the node, None if it is the head.
+
+        """
+        self._add_to_index(node)
+        self._previous[node] = previous
+        if node.next_ is not None:
+            self._previous[node.next_] = node
+
+    def _add_to_index(self, node):
+        """
+        Add a node to the map from value to nodes.
+
+        Args:
+            node: The node to add.
+
+        """
+        nodes = self._index.get(node.value)
+        if nodes is None:
+            self._index[node.value] = node
+        elif isinstance(nodes, Node):
+            self._index[node.value] = {nodes: None, node: None}
+        else:
+            nodes[node] = None
+
+    def _unindex_node(self, node, previous):
+        """
+        Remove a node that was unlinked from the list from the index.
+
+        Args:
+            node: The node to remove.
+            previous: The node that was before the node, None if it was the head.
+
+        """
+        nodes = self._index[node.value]
+        if isinstance(nodes, Node):
+            del self._index[node.value]
+        else:
+            del nodes[node]
+            if len(nodes) == 1:
+                self._index[node.value] = next(iter(nodes))
+        del self._previous[node]
+        if node.next_ is not None:
+            self._previous[node.next_] = previous
+
+    def _reindex(self):
+        """Rebuild the index after the nodes have been relinked."""
+        if self._index is None:
+            return
+        self._index = {}
+        self._previous = {}
+        self._index_chain(self.head, None)
+
+    def _index_chain(self, node, previous):
+        """
+        Add a chain of nodes that was linked to the end of the list to the index.
+
+        Args:
+            node: The first node of the chain.
+            previous: The node before the chain, None if the chain starts at the head.
+
+        """
+        while node is not None:
+            self._add_to_index(node)
+            self._previous[node] = previous
+            previous = node
+            node = node.next_
+
+    def __len__(self):
+        """Get the number of values in the list."""
+        return self._size
 
     def add_first(self, value):
         """
@@ -34,7 +205,7 @@ class LinkedList:
             value: The value to add to the front.
 
         """
-        self.head = Node(value, self.head)
+        self.insert_after_node(None, value)
 
     def add_last(self, value):
         """
@@ -44,68 +215,221 @@ class LinkedList:
             value: The value to add to the linked list.
 
         """
-        # Checking for empty list
-        if self.head is None:
-            self.add_first(value)
-            return
+        # Add new node after the tail, which is None for an empty list
+        self.insert_after_node(self.tail, value)
 
-        # Add new node
-        self._add_last(self.head, value)
+    def insert_after_node(self, node, value):
+        """
+        Insert a new value after a node of the list.
 
-    @classmethod
-    def _add_last(cls, node, value):
+        Args:
+            node: The node after which to insert the new value. If it is None, the
+                value is added to the front of the list.
+            value: The new value to insert.
+
+        Returns:
+            The new node.
+
+        """
+        # Checking that the value can be indexed before changing the list
+        if self._index is not None:
+            hash(value)
+
+        if node is None:
+            new_node = Node(value, self.head)
+            self.head = new_node
+        else:
+            new_node = Node(value, node.next_)
+            node.next_ = new_node
+
+        # Checking whether the new node is the last node
+        if new_node.next_ is None:
+            self.tail = new_node
+        self._size += 1
+        self._version += 1
+        if self._index is not None:
+            self._index_node(new_node, node)
+        return new_node
+
+    def delete_after_node(self, node):
         """
-        Recursively add value. Could also be done as a while loop.
+        Delete the node after a node of the list.
 
-        Checks if the node next_ property is None. if it is, it creates a new Node and
-        sets it to the next_ property.
+        Raises ValueError if there is no node after the node.
 
         Args:
-            node: The node to operate on.
-            value: The value to add to the list.
+            node: The node before the node to delete. If it is None, the first node
+                is deleted.
+
+        Returns:
+            The value of the deleted node.
 
         """
-        # Check if element is the last element
-        if node.next_ is None:
-            node.next_ = Node(value)
+        deleted = self.head if node is None else node.next_
+        if deleted is None:
+            raise ValueError("There is no node to delete after the node.")
+
+        if node is None:
+            self.head = deleted.next_
+        else:
+            node.next_ = deleted.next_
+
+        # Checking whether the tail was deleted
+        if deleted is self.tail:
+            self.tail = node
+        self._size -= 1
+        self._version += 1
+        if self._index is not None:
+            self._unindex_node(deleted, node)
+        return deleted.value
+
+    def extend(self, iterable):
+        """
+        Add the values of an iterable to the end of the list.
+
+        The iterable is consumed one value at a time and each node is linked as it is
+        created.
+
+        Args:
+            iterable: The values to add.
+
+        """
+        # Copying values first when extending with itself to avoid an endless loop
+        if iterable is self:
+            iterable = list(self)
+
+        # Each node has to be indexed as it is linked
+        if self._index is not None:
+            for value in iterable:
+                self.add_last(value)
             return
 
-        # Recursively go to next node
-        cls._add_last(node.next_, value)
+        tail = self.tail
+        count = 0
+        try:
+            for value in iterable:
+                node = Node(value)
+                if tail is None:
+                    self.head = node
+                else:
+                    tail.next_ = node
+                tail = node
+                count += 1
+                # Changing the version for each node so that a view of the list that
+                # is being added does not keep running into the new nodes
+                self._version += 1
+        finally:
+            # Keeping the list consistent if the iterable raises
+            self.tail = tail
+            self._size += count
+
+    def extend_left(self, iterable):
+        """
+        Add the values of an iterable to the front of the list.
+
+        Equivalent to calling add_first with each value which means that the values
+        end up in reverse order at the front of the list.
+
+        Args:
+            iterable: The values to add.
 
-    def insert_after(self, key, value):
         """
-        Insert a new value after a key.
+        # Copying values first when extending with itself to avoid an endless loop
+        if iterable is self:
+            iterable = list(self)
+
+        # Each node has to be indexed as it is linked
+        if self._index is not None:
+            for value in iterable:
+                self.add_first(value)
+            return
+
+        head = self.head
+        count = 0
+        try:
+            for value in iterable:
+                head = Node(value, head)
+                if self.tail is None:
+                    self.tail = head
+                count += 1
+        finally:
+            # Keeping the list consistent if the iterable raises
+            self.head = head
+            self._size += count
+            self._version += 1
+
+    def _find(self, key):
+        """
+        Find the first node with the key using a loop.
+
+        A loop is used rather than recursion so that the stack space is constant
+        regardless of the length of the list. In indexed mode, the index is used
+        instead.
 
         Args:
-            key: The value after which to insert the new value.
-            value: The new value to insert.
+            key: The value to search for.
+
+        Returns:
+            Tuple with the node before the matched node and the matched node. The
+            node before is None if the head matched and the matched node is None if
+            the key was not found.
 
         """
-        self._insert_after(self.head, key, value)
+        if self._index is not None:
+            return self._find_indexed(key)
 
-    @classmethod
-    def _insert_after(cls, node, key, value):
+        node = self.head
+        last_node = None
+        while node is not None and node.value != key:
+            last_node = node
+            node = node.next_
+        return last_node, node
+
+    def _find_indexed(self, key):
         """
-        Insert a new value after a key recursively.
+        Find the first node with the key using the index.
+
+        Args:
+            key: The value to search for.
+
+        Returns:
+            Tuple with the node before the matched node and the matched node.
+
+        """
+        try:
+            nodes = self._index.get(key)
+        except TypeError:
+            # A value that cannot be hashed cannot be in the list
+            return None, None
+        if nodes is None:
+            return None, None
+        if isinstance(nodes, Node):
+            return self._previous[nodes], nodes
+
+        # Finding the first of the nodes in the list, the search stops there
+        last_node = None
+        node = self.head
+        while node.value != key:
+            last_node = node
+            node = node.next_
+        return last_node, node
+
+    def insert_after(self, key, value):
+        """
+        Insert a new value after a key.
 
         Args:
-            node: The node to operate on. Can be None.
             key: The value after which to insert the new value.
             value: The new value to insert.
 
         """
-        # End of list base case
-        if node is None:
-            return
+        _, node = self._find(key)
 
-        # Base case for key found
-        if node.value == key:
-            node.next_ = Node(value, node.next_)
+        # Check if the node has been found
+        if node is None:
             return
 
-        # Recursive case
-        cls._insert_after(node.next_, key, value)
+        self.insert_after_node(node, value)
 
     def insert_before(self, key, value):
         """
@@ -116,24 +440,13 @@ class LinkedList:
             value: The new value to insert.
 
         """
-        # Iterating to node that has value
-        node = self.head
-        last_node = None
-        while node is not None and node.value != key:
-            last_node = node
-            node = node.next_
+        last_node, node = self._find(key)
 
         # Check if the node has been found
         if node is None:
             return
 
-        # Checking whether head matched
-        if last_node is None:
-            self.add_first(value)
-            return
-
-        # Inserting new node
-        last_node.next_ = Node(value, node)
+        self.insert_after_node(last_node, value)
 
     def delete(self, value):
         """
@@ -143,53 +456,119 @@ class LinkedList:
             value: The value to remove from the list.
 
         """
-        # Iterating to node that has value
-        node = self.head
-        last_node = None
-        while node is not None and node.value != value:
-            last_node = node
-            node = node.next_
+        last_node, node = self._find(value)
 
         # Check if the node has been found
         if node is None:
             return
 
-        # Checking whether head matched
-        if last_node is None:
-            self.head = node.next_
-            return
+        self.delete_after_node(last_node)
 
-        # Deleting node
-        last_node.next_ = node.next_
+    def remove_if(self, predicate):
+        """
+        Delete all nodes with a value for which a predicate is true.
+
+        The nodes are deleted in a single pass over the list.
+
+        Args:
+            predicate: Function that is called with each value and returns whether to
+                delete it.
+
+        Returns:
+            The number of deleted values.
 
-    def traverse(self, func):
         """
-        Call function on each value in the list.
+        count = 0
+        last_node = None
+        node = self.head
+        while node is not None:
+            next_ = node.next_
+            if predicate(node.value):
+                self.delete_after_node(last_node)
+                count += 1
+            else:
+                last_node = node
+            node = next_
+        return count
+
+    def remove_all(self, value):
+        """
+        Delete all nodes with the value.
 
         Args:
-            func: The function to call each value with.
+            value: The value to remove from the list.
+
+        Returns:
+            The number of deleted values.
 
         """
-        self._traverse(self.head, func)
+        return self.remove_if(lambda element: element == value)
 
-    @classmethod
-    def _traverse(cls, node, func):
+    def retain_if(self, predicate):
+        """
+        Delete all nodes with a value for which a predicate is false.
+
+        Args:
+            predicate: Function that is called with each value and returns whether to
+                keep it.
+
+        Returns:
+            The number of deleted values.
+
+        """
+        return self.remove_if(lambda element: not predicate(element))
+
+    def cursor(self):
         """
-        Call function with the value of the node.
+        Create a cursor for editing the list at a position.
 
-        If the node is NOne the function is not called.
+        Returns:
+            A cursor on the first node of the list.
+
+        """
+        return cursor.Cursor(self)
+
+    def view(self, start=None, stop=None):
+        """
+        Create a lazy view of the values between two indexes without copying them.
 
         Args:
-            node: The node to call the function with.
-            func: The function to call.
+            start: The index of the first value, the start of the list if it is None.
+            stop: The index after the last value, the end of the list if it is None.
+
+        Returns:
+            A view that iterates over the values of the list between the indexes.
 
         """
-        # Checking for last node
-        if node is None:
-            return
+        return views.View(self, start, stop)
 
-        func(node.value)
-        cls._traverse(node.next_, func)
+    def between(self, start, stop):
+        """
+        Create a lazy view of the values from one value up to another value.
+
+        Args:
+            start: The first value of the view.
+            stop: The value after the last value of the view.
+
+        Returns:
+            A view that iterates over the values of the list from the first occurrence
+            of the start value up to the next occurrence of the stop value.
+
+        """
+        return views.Between(self, start, stop)
+
+    def traverse(self, func):
+        """
+        Call function on each value in the list.
+
+        Args:
+            func: The function to call each value with.
+
+        """
+        node = self.head
+        while node is not None:
+            func(node.value)
+            node = node.next_
 
     def search(self, value):
         """
@@ -198,29 +577,372 @@ class LinkedList:
         Args:
             value: The value to search for.
 
+        Returns:
+            Whether the value is in the list.
+
         """
-        return self._search(self.head, value)
+        if self.organize == TRANSPOSE:
+            target, last_node, node = self._find_transpose(value)
+        else:
+            target = None
+            last_node, node = self._find(value)
+        if node is None:
+            return False
+
+        # Moving the node towards the front
+        if self.organize is not None and last_node is not None:
+            self._move_after(last_node, node, target)
+        return True
+
+    def _find_transpose(self, key):
+        """
+        Find the first node with the key and the two nodes before it.
+
+        Args:
+            key: The value to search for.
+
+        Returns:
+            Tuple with the node two before the matched node, the node before the
+            matched node and the matched node. Nodes that do not exist are None.
 
-    @classmethod
-    def _search(cls, node, value):
         """
-        Check whether value is in list using recursion.
+        if self._index is not None:
+            last_node, node = self._find_indexed(key)
+            if last_node is None:
+                return None, last_node, node
+            return self._previous[last_node], last_node, node
 
-        If node is None return False.
-        If node value is equal to value return True.
-        Else recursively call on next_ property.
+        node = self.head
+        last_node = None
+        before_last_node = None
+        while node is not None and node.value != key:
+            before_last_node = last_node
+            last_node = node
+            node = node.next_
+        return before_last_node, last_node, node
+
+    def _move_after(self, last_node, node, target):
+        """
+        Move a node towards the front of the list.
 
         Args:
-            value: The value to search for.
+            last_node: The node before the node to move.
+            node: The node to move, must not be the head.
+            target: The node to move the node after, must be before last_node. None
+                to move the node to the front.
 
         """
+        self._version += 1
+
+        # Unlinking the node
+        last_node.next_ = node.next_
+        if node is self.tail:
+            self.tail = last_node
+        if self._index is not None and node.next_ is not None:
+            self._previous[node.next_] = last_node
+
+        # Linking the node after the target
+        if target is None:
+            node.next_ = self.head
+            self.head = node
+        else:
+            node.next_ = target.next_
+            target.next_ = node
+        if self._index is not None:
+            self._previous[node] = target
+            self._previous[node.next_] = node
+
+    @classmethod
+    def _split(cls, node, count):
+        """
+        Split a chain of nodes after a number of nodes.
+
+        Args:
+            node: The first node of the chain. Can be None.
+            count: The number of nodes to keep in the chain.
+
+        Returns:
+            The first node after the split or None if the chain is not longer than
+            the count.
+
+        """
+        for _ in range(count - 1):
+            if node is None:
+                return None
+            node = node.next_
         if node is None:
-            return False
+            return None
+        rest = node.next_
+        node.next_ = None
+        return rest
+
+    @classmethod
+    def _last_node(cls, node):
+        """
+        Find the last node of a chain of nodes.
+
+        Args:
+            node: A node of the chain.
+
+        Returns:
+            The last node of the chain.
+
+        """
+        while node.next_ is not None:
+            node = node.next_
+        return node
+
+    @classmethod
+    def _merge_nodes(cls, tail, left, right, key, reverse):
+        """
+        Merge two sorted chains of nodes into a single sorted chain after a node.
+
+        The merge is stable, values from the left chain are placed before equal
+        values from the right chain. If a key call or comparison raises, the nodes
+        that have not been merged yet are linked after the merged nodes before the
+        exception is raised again so that no nodes are lost.
+
+        Args:
+            tail: The node to link the merged chain after.
+            left: The first node of the left chain. Can be None.
+            right: The first node of the right chain. Can be None.
+            key: Function that calculates the value to compare for a value.
+            reverse: Whether the chains are sorted in descending order.
+
+        Returns:
+            The last node of the merged chain, the node to link after if both chains
+            are empty.
+
+        """
+        try:
+            while left is not None and right is not None:
+                left_key = key(left.value)
+                right_key = key(right.value)
+                if (left_key < right_key) if reverse else (right_key < left_key):
+                    node = right
+                    right = right.next_
+                else:
+                    node = left
+                    left = left.next_
+                tail.next_ = node
+                tail = node
+        finally:
+            # Adding the remaining nodes, of both chains if the merge stopped early
+            tail.next_ = left
+            cls._last_node(tail).next_ = right
+        return cls._last_node(tail)
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sort the list in place.
+
+        Uses a bottom up merge sort that relinks the existing nodes. The sort is
+        stable, takes O(n log n) time and constant extra memory. If a key call or
+        comparison raises, the list keeps all its values in a partially sorted order.
+
+        Args:
+            key: Function that calculates the value to compare for a value, the value
+                itself is compared if it is None.
+            reverse: Whether to sort in descending order.
+
+        """
+        if key is None:
+            key = _identity
+
+        width = 1
+        try:
+            while width < self._size:
+                # Merging each pair of runs of the width after a node before the head
+                before = Node(None)
+                tail = before
+                remaining = self.head
+                try:
+                    while remaining is not None:
+                        left = remaining
+                        right = self._split(left, width)
+                        remaining = self._split(right, width)
+                        tail = self._merge_nodes(tail, left, right, key, reverse)
+                finally:
+                    # Keeping the runs that have not been merged if a merge raises
+                    tail = self._last_node(tail)
+                    tail.next_ = remaining
+                    self.head = before.next_
+                    self.tail = self._last_node(tail)
+                width *= 2
+        finally:
+            self._version += 1
+            self._reindex()
+
+    def merge(self, other, key=None, reverse=False):
+        """
+        Merge another sorted list into the list.
+
+        The nodes of the other list are moved into the list which leaves the other
+        list empty. Both lists must be sorted with the same key and order. Values
+        from the list are placed before equal values from the other list. Takes
+        O(n + m) time. If a key call or comparison raises, the nodes are still moved
+        and the values that were not merged follow the merged values.
 
-        if node.value == value:
-            return True
+        Args:
+            other: The sorted list to merge into the list.
+            key: Function that calculates the value to compare for a value, the value
+                itself is compared if it is None.
+            reverse: Whether the lists are sorted in descending order.
+
+        """
+        if other is self:
+            raise ValueError("Cannot merge a list with itself.")
+        if key is None:
+            key = _identity
+
+        before = Node(None)
+        tail = before
+        try:
+            tail = self._merge_nodes(before, self.head, other.head, key, reverse)
+        finally:
+            # Moving every node into the list, also if a comparison raises
+            tail = self._last_node(tail)
+            self.head = before.next_
+            self.tail = None if tail is before else tail
+            self._size += len(other)
+            self._version += 1
+            other.clear()
+            self._reindex()
+
+    def concat(self, other):
+        """
+        Move the nodes of another list to the end of the list.
+
+        The nodes are linked rather than copied which leaves the other list empty.
+        Takes O(1) time, or O(m) in indexed mode to index the nodes of the other list.
 
-        return cls._search(node.next_, value)
+        Args:
+            other: The list to add to the end.
+
+        """
+        if other is self:
+            raise ValueError("Cannot concatenate a list with itself.")
+        if other.head is None:
+            return
+
+        previous = self.tail
+        if previous is None:
+            self.head = other.head
+        else:
+            previous.next_ = other.head
+        self.tail = other.tail
+        self._size += len(other)
+        self._version += 1
+        if self._index is not None:
+            self._index_chain(other.head, previous)
+        other.clear()
+
+    def split_at(self, index):
+        """
+        Split the list into two at an index.
+
+        The list keeps the values before the index and the values from the index
+        onwards are moved to a new list without copying the nodes. Takes O(index)
+        time, or O(n) in indexed mode to rebuild the indexes.
+
+        Args:
+            index: The index of the first value to move to the new list.
+
+        Returns:
+            A list with the same settings and the values from the index onwards.
+
+        """
+        if not 0 <= index <= self._size:
+            raise IndexError(f"Index {index} is out of range.")
+
+        if index == self._size:
+            return LinkedList(self.indexed, self.organize)
+        if index == 0:
+            head = self.head
+            last_node = None
+            self.head = None
+        else:
+            last_node = self.head
+            for _ in range(index - 1):
+                last_node = last_node.next_
+            head = last_node.next_
+            last_node.next_ = None
+        rest = self._from_nodes(
+            head, self.tail, self._size - index, self.indexed, self.organize
+        )
+        self.tail = last_node
+        self._size = index
+        self._version += 1
+        self._reindex()
+        return rest
+
+    @classmethod
+    def _from_nodes(cls, head, tail, size, indexed, organize):
+        """
+        Construct a list from a chain of nodes.
+
+        Args:
+            head: The first node of the chain.
+            tail: The last node of the chain.
+            size: The number of nodes in the chain.
+            indexed: Whether to keep an index of the values.
+            organize: The self organizing mode.
+
+        Returns:
+            The new list.
+
+        """
+        list_ = cls(indexed, organize)
+        list_.head = head
+        list_.tail = tail
+        list_._size = size
+        list_._reindex()
+        return list_
+
+    def reverse(self):
+        """Reverse the order of the values by relinking the nodes in O(n) time."""
+        previous = None
+        node = self.head
+        while node is not None:
+            next_ = node.next_
+            node.next_ = previous
+            previous = node
+            node = next_
+        self.head, self.tail = self.tail, self.head
+        self._version += 1
+        self._reindex()
+
+    def rotate(self, steps=1):
+        """
+        Rotate the values to the right, wrapping values from the end to the front.
+
+        Rotating by one moves the last value to the front, a negative number of steps
+        rotates to the left. Takes O(n) time to find the new tail and no nodes are
+        created.
+
+        Args:
+            steps: The number of steps to rotate to the right.
+
+        """
+        if self._size == 0:
+            return
+        # The number of nodes that are moved from the front to the end
+        count = -steps % self._size
+        if count == 0:
+            return
+
+        new_tail = self.head
+        for _ in range(count - 1):
+            new_tail = new_tail.next_
+        old_head = self.head
+        self.tail.next_ = old_head
+        self.head = new_tail.next_
+        new_tail.next_ = None
+        self._version += 1
+        if self._index is not None:
+            self._previous[old_head] = self.tail
+            self._previous[self.head] = None
+        self.tail = new_tail
 
     def __iter__(self):
         """Iterate over list."""
@@ -237,24 +959,7 @@ class LinkedList:
             A new list with the values from the current list.
 
         """
-        new_list = LinkedList()
-
-        # Checking for empty list
-        if self.head is None:
-            return new_list
-
-        # Copying head
-        new_list.add_first(self.head.value)
-
-        # Copying remaining nodes
-        tail = new_list.head
-        node = self.head.next_
-        while node is not None:
-            tail.next_ = Node(node.value)
-            node = node.next_
-            tail = tail.next_
-
-        return new_list
+        return LinkedList.from_iterable(self, self.indexed, self.organize)
 
     def is_empty(self):
         """
@@ -269,3 +974,9 @@ class LinkedList:
     def clear(self):
         """Remove all elements frm the list."""
         self.head = None
+        self.tail = None
+        self._size = 0
+        self._version += 1
+        if self._index is not None:
+            self._index = {}
+            self._previous = {}
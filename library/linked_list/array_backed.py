@@ -0,0 +1,328 @@
+"""Singly linked list stored in arrays with integer references to the next node."""
+
+import array
+
+# Index used for a reference to no node
+_NONE = -1
+
+
+class ArrayLinkedList:
+    """
+    Singly linked list stored in arrays.
+
+    The value and the index of the next node of each node are stored at the index of
+    the node in two parallel arrays rather than in a Python object for each node.
+    The slots of deleted nodes are linked in a free list and reused for new nodes.
+    With a typecode the values are stored in a typed array, which means that the
+    list is a handful of objects regardless of its length.
+    """
+
+    def __init__(self, typecode=None):
+        """
+        Construct.
+
+        Args:
+            typecode: The array typecode for the values, for example "q" for 64 bit
+                integers. If it is None the values are stored in a Python list and can
+                be any object.
+
+        """
+        self.typecode = typecode
+        self._values = self._create_values()
+        # The index of the next node for each node
+        self._next = array.array("q")
+        self._head = _NONE
+        self._tail = _NONE
+        # The first slot in the linked list of free slots
+        self._free = _NONE
+        # The number of values in the list
+        self._size = 0
+
+    @classmethod
+    def from_iterable(cls, iterable, typecode=None):
+        """
+        Construct a list with the values of an iterable.
+
+        Args:
+            iterable: The values for the list.
+            typecode: The array typecode for the values.
+
+        Returns:
+            The new list.
+
+        """
+        list_ = cls(typecode)
+        list_.extend(iterable)
+        return list_
+
+    def _create_values(self):
+        """
+        Create an empty buffer for the values.
+
+        Returns:
+            A typed array if there is a typecode, otherwise a list.
+
+        """
+        if self.typecode is None:
+            return []
+        return array.array(self.typecode)
+
+    def __len__(self):
+        """Get the number of values in the list."""
+        return self._size
+
+    def _allocate(self, value, next_):
+        """
+        Store a new node, reusing a free slot if there is one.
+
+        Args:
+            value: The value for the node.
+            next_: The index of the next node.
+
+        Returns:
+            The index of the new node.
+
+        """
+        # Storing the value first so that the list is unchanged if a typed array
+        # rejects it
+        if self._free == _NONE:
+            self._values.append(value)
+            self._next.append(next_)
+            self._size += 1
+            return len(self._next) - 1
+
+        index = self._free
+        self._values[index] = value
+        self._free = self._next[index]
+        self._next[index] = next_
+        self._size += 1
+        return index
+
+    def _release(self, index):
+        """
+        Add the slot of a node to the free list.
+
+        Args:
+            index: The index of the node.
+
+        """
+        self._size -= 1
+        # Releasing the reference to the value
+        if self.typecode is None:
+            self._values[index] = None
+        self._next[index] = self._free
+        self._free = index
+
+    def _insert_after_index(self, index, value):
+        """
+        Insert a new value after a node.
+
+        Args:
+            index: The index of the node after which to insert, _NONE to insert at
+                the front of the list.
+            value: The new value to insert.
+
+        """
+        if index == _NONE:
+            new_index = self._allocate(value, self._head)
+            self._head = new_index
+        else:
+            new_index = self._allocate(value, self._next[index])
+            self._next[index] = new_index
+        if self._next[new_index] == _NONE:
+            self._tail = new_index
+
+    def _delete_after_index(self, index):
+        """
+        Delete the node after a node.
+
+        Args:
+            index: The index of the node before the node to delete, _NONE to delete
+                the first node.
+
+        """
+        if index == _NONE:
+            deleted = self._head
+            self._head = self._next[deleted]
+        else:
+            deleted = self._next[index]
+            self._next[index] = self._next[deleted]
+        if deleted == self._tail:
+            self._tail = index
+        self._release(deleted)
+
+    def add_first(self, value):
+        """
+        Add value to the front of the list.
+
+        Args:
+            value: The value to add to the front.
+
+        """
+        self._insert_after_index(_NONE, value)
+
+    def add_last(self, value):
+        """
+        Add value to end of the list.
+
+        Args:
+            value: The value to add to the list.
+
+        """
+        self._insert_after_index(self._tail, value)
+
+    def extend(self, iterable):
+        """
+        Add the values of an iterable to the end of the list.
+
+        Args:
+            iterable: The values to add.
+
+        """
+        # Copying values first when extending with itself to avoid an endless loop
+        if iterable is self:
+            iterable = list(self)
+        for value in iterable:
+            self._insert_after_index(self._tail, value)
+
+    def extend_left(self, iterable):
+        """
+        Add the values of an iterable to the front of the list.
+
+        Equivalent to calling add_first with each value which means that the values
+        end up in reverse order at the front of the list.
+
+        Args:
+            iterable: The values to add.
+
+        """
+        # Copying values first when extending with itself to avoid an endless loop
+        if iterable is self:
+            iterable = list(self)
+        for value in iterable:
+            self._insert_after_index(_NONE, value)
+
+    def _find(self, key):
+        """
+        Find the first node with the key.
+
+        Args:
+            key: The value to search for.
+
+        Returns:
+            Tuple with the index of the node before the matched node and the index of
+            the matched node. The index before is _NONE if the head matched and the
+            matched index is _NONE if the key was not found.
+
+        """
+        values = self._values
+        next_ = self._next
+        index = self._head
+        last_index = _NONE
+        while index != _NONE and values[index] != key:
+            last_index = index
+            index = next_[index]
+        return last_index, index
+
+    def insert_after(self, key, value):
+        """
+        Insert a new value after a key.
+
+        Args:
+            key: The value after which to insert the new value.
+            value: The new value to insert.
+
+        """
+        _, index = self._find(key)
+        if index != _NONE:
+            self._insert_after_index(index, value)
+
+    def insert_before(self, key, value):
+        """
+        Insert a new value before a key.
+
+        Args:
+            key: The value before which to insert the new value.
+            value: The new value to insert.
+
+        """
+        last_index, index = self._find(key)
+        if index != _NONE:
+            self._insert_after_index(last_index, value)
+
+    def delete(self, value):
+        """
+        Delete node with the value.
+
+        Args:
+            value: The value to remove from the list.
+
+        """
+        last_index, index = self._find(value)
+        if index != _NONE:
+            self._delete_after_index(last_index)
+
+    def traverse(self, func):
+        """
+        Call function on each value in the list.
+
+        Args:
+            func: The function to call each value with.
+
+        """
+        for value in self:
+            func(value)
+
+    def search(self, value):
+        """
+        Check whether value is in list.
+
+        Args:
+            value: The value to search for.
+
+        Returns:
+            Whether the value is in the list.
+
+        """
+        _, index = self._find(value)
+        return index != _NONE
+
+    def __iter__(self):
+        """Iterate over list."""
+        values = self._values
+        next_ = self._next
+        index = self._head
+        while index != _NONE:
+            yield values[index]
+            index = next_[index]
+
+    def clone(self):
+        """
+        Deep clone the list.
+
+        The nodes of the new list are stored in order without free slots.
+
+        Returns:
+            A new list with the values from the current list.
+
+        """
+        return ArrayLinkedList.from_iterable(self, self.typecode)
+
+    def is_empty(self):
+        """
+        Check whether the list is empty.
+
+        Returns:
+            Whether the list is empty.
+
+        """
+        return self._head == _NONE
+
+    def clear(self):
+        """Remove all elements from the list."""
+        self._values = self._create_values()
+        self._next = array.array("q")
+        self._head = _NONE
+        self._tail = _NONE
+        self._free = _NONE
+        self._size = 0
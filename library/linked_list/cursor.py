@@ -0,0 +1,150 @@
+"""Cursor for editing a linked list at a position without searching."""
+
+
+class Cursor:
+    """
+    Position in a linked list.
+
+    The cursor is either on a node of the list or at the end of the list, after the
+    last node. It keeps a reference to the node before its position so that values
+    can be inserted before and deleted at the position in O(1) time. The cursor is
+    only valid while the list is changed through the cursor, using it after the list
+    has been changed in any other way, including a self organizing search, raises
+    RuntimeError.
+    """
+
+    def __init__(self, list_):
+        """
+        Construct the cursor on the first node of the list.
+
+        Args:
+            list_: The linked list to move over.
+
+        """
+        self._list = list_
+        # The node before the position, None at the front of the list
+        self._previous = None
+        # The node at the position, None at the end of the list
+        self._node = list_.head
+        self.index = 0
+        # The version of the list that the nodes of the cursor are valid for
+        self._version = list_.version
+
+    def _check_version(self):
+        """Raise RuntimeError if the list has been changed other than by the cursor."""
+        if self._list.version != self._version:
+            raise RuntimeError("Linked list changed outside the cursor.")
+
+    def at_end(self):
+        """
+        Check whether the cursor is after the last node of the list.
+
+        Returns:
+            Whether the cursor is at the end.
+
+        """
+        self._check_version()
+        return self._node is None
+
+    def _check_not_end(self):
+        """Raise IndexError if the cursor is at the end of the list."""
+        if self.at_end():
+            raise IndexError("The cursor is at the end of the list.")
+
+    def seek(self, index):
+        """
+        Move the cursor to a position.
+
+        Moving forward starts at the current position, moving backwards starts at
+        the front of the list. Raises IndexError if the index is not between 0 and
+        the length of the list.
+
+        Args:
+            index: The position to move to, the length of the list is the end.
+
+        """
+        self._check_version()
+        if not 0 <= index <= len(self._list):
+            raise IndexError("The index is out of range.")
+        if index < self.index:
+            self._previous = None
+            self._node = self._list.head
+            self.index = 0
+        self.advance(index - self.index)
+
+    def advance(self, steps=1):
+        """
+        Move the cursor forward.
+
+        Raises IndexError if the cursor would move past the end of the list, in
+        which case it is left at the end.
+
+        Args:
+            steps: The number of nodes to move forward by.
+
+        """
+        for _ in range(steps):
+            self._check_not_end()
+            self._previous = self._node
+            self._node = self._node.next_
+            self.index += 1
+
+    def peek(self):
+        """
+        Return the value at the cursor.
+
+        Raises IndexError if the cursor is at the end of the list.
+
+        Returns:
+            The value at the cursor.
+
+        """
+        self._check_not_end()
+        return self._node.value
+
+    def insert_before(self, value):
+        """
+        Insert a value before the cursor.
+
+        The cursor stays on the same node. At the end of the list, the value is added
+        to the end of the list.
+
+        Args:
+            value: The value to insert.
+
+        """
+        self._check_version()
+        self._previous = self._list.insert_after_node(self._previous, value)
+        self._version = self._list.version
+        self.index += 1
+
+    def insert_after(self, value):
+        """
+        Insert a value after the cursor.
+
+        The cursor stays on the same node. Raises IndexError if the cursor is at the
+        end of the list.
+
+        Args:
+            value: The value to insert.
+
+        """
+        self._check_not_end()
+        self._list.insert_after_node(self._node, value)
+        self._version = self._list.version
+
+    def delete(self):
+        """
+        Delete the value at the cursor and move the cursor to the next node.
+
+        Raises IndexError if the cursor is at the end of the list.
+
+        Returns:
+            The deleted value.
+
+        """
+        self._check_not_end()
+        self._node = self._node.next_
+        value = self._list.delete_after_node(self._previous)
+        self._version = self._list.version
+        return value
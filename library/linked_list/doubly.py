@@ -0,0 +1,262 @@
+"""Doubly linked list where nodes can be removed and moved without a search."""
+
+
+class Node:
+    """Represents a node in the doubly linked list."""
+
+    __slots__ = ("value", "previous", "next_")
+
+    def __init__(self, value, previous=None, next_=None):
+        """
+        Construct.
+
+        Args:
+            value: The value for the node.
+            previous: The node to set to previous.
+            next_: The node to set to next.
+
+        """
+        self.value = value
+        self.previous = previous
+        self.next_ = next_
+
+
+class DoublyLinkedList:
+    """
+    Doubly linked list.
+
+    The operations that add values return the new node which can be used as a handle
+    to remove, move or insert relative to the node in O(1) time. A node is only valid
+    for the list it was returned by and only until it is removed from the list, using
+    a removed node raises ValueError.
+    """
+
+    def __init__(self):
+        """Construct."""
+        self.head = None
+        self.tail = None
+        # The number of nodes in the list
+        self._size = 0
+
+    def __len__(self):
+        """Get the number of values in the list."""
+        return self._size
+
+    def _link(self, node, previous, next_):
+        """
+        Link a node between two nodes.
+
+        Args:
+            node: The node to link into the list.
+            previous: The node to link before the node, None if the node becomes the
+                head.
+            next_: The node to link after the node, None if the node becomes the
+                tail.
+
+        """
+        node.previous = previous
+        node.next_ = next_
+        if previous is None:
+            self.head = node
+        else:
+            previous.next_ = node
+        if next_ is None:
+            self.tail = node
+        else:
+            next_.previous = node
+        self._size += 1
+
+    def _check_linked(self, node):
+        """
+        Check that a node has not been removed from the list.
+
+        Raises ValueError if the node has been removed. A removed node has no
+        previous node but is not the head.
+
+        Args:
+            node: The node to check.
+
+        """
+        if node.previous is None and node is not self.head:
+            raise ValueError("The node is not in the list.")
+
+    def _unlink(self, node):
+        """
+        Unlink a node from the list.
+
+        Raises ValueError if the node has already been removed.
+
+        Args:
+            node: The node to unlink.
+
+        """
+        self._check_linked(node)
+        if node.previous is None:
+            self.head = node.next_
+        else:
+            node.previous.next_ = node.next_
+        if node.next_ is None:
+            self.tail = node.previous
+        else:
+            node.next_.previous = node.previous
+        node.previous = None
+        node.next_ = None
+        self._size -= 1
+
+    def add_first(self, value):
+        """
+        Add value to the front of the list.
+
+        Args:
+            value: The value to add to the front.
+
+        Returns:
+            The node with the value.
+
+        """
+        node = Node(value)
+        self._link(node, None, self.head)
+        return node
+
+    def add_last(self, value):
+        """
+        Add value to the end of the list.
+
+        Args:
+            value: The value to add to the end.
+
+        Returns:
+            The node with the value.
+
+        """
+        node = Node(value)
+        self._link(node, self.tail, None)
+        return node
+
+    def insert_after(self, node, value):
+        """
+        Insert a new value after a node.
+
+        Raises ValueError if the node has been removed.
+
+        Args:
+            node: The node after which to insert the new value.
+            value: The new value to insert.
+
+        Returns:
+            The node with the new value.
+
+        """
+        self._check_linked(node)
+        new_node = Node(value)
+        self._link(new_node, node, node.next_)
+        return new_node
+
+    def insert_before(self, node, value):
+        """
+        Insert a new value before a node.
+
+        Raises ValueError if the node has been removed.
+
+        Args:
+            node: The node before which to insert the new value.
+            value: The new value to insert.
+
+        Returns:
+            The node with the new value.
+
+        """
+        self._check_linked(node)
+        new_node = Node(value)
+        self._link(new_node, node.previous, node)
+        return new_node
+
+    def remove(self, node):
+        """
+        Remove a node from the list.
+
+        Raises ValueError if the node has already been removed.
+
+        Args:
+            node: The node to remove.
+
+        Returns:
+            The value of the node.
+
+        """
+        self._unlink(node)
+        return node.value
+
+    def move_to_front(self, node):
+        """
+        Move a node to the front of the list.
+
+        Raises ValueError if the node has been removed.
+
+        Args:
+            node: The node to move.
+
+        """
+        if node is self.head:
+            return
+        self._unlink(node)
+        self._link(node, None, self.head)
+
+    def find(self, value):
+        """
+        Find the first node with the value.
+
+        Args:
+            value: The value to search for.
+
+        Returns:
+            The node with the value or None if the value is not in the list.
+
+        """
+        node = self.head
+        while node is not None and node.value != value:
+            node = node.next_
+        return node
+
+    def search(self, value):
+        """
+        Check whether value is in list.
+
+        Args:
+            value: The value to search for.
+
+        Returns:
+            Whether the value is in the list.
+
+        """
+        return self.find(value) is not None
+
+    def __iter__(self):
+        """Iterate over list."""
+        node = self.head
+        while node is not None:
+            yield node.value
+            node = node.next_
+
+    def __reversed__(self):
+        """Iterate over list from the back to the front."""
+        node = self.tail
+        while node is not None:
+            yield node.value
+            node = node.previous
+
+    def is_empty(self):
+        """
+        Check whether the list is empty.
+
+        Returns:
+            Whether the list is empty.
+
+        """
+        return self.head is None
+
+    def clear(self):
+        """Remove all elements from the list."""
+        self.head = None
+        self.tail = None
+        self._size = 0
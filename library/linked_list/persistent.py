@@ -0,0 +1,160 @@
+"""Immutable singly linked list that shares nodes between versions."""
+
+
+class ListEmptyError(Exception):
+    """Raised when an operation fails because the list is empty."""
+
+
+class Node:
+    """Represents an immutable node in the persistent list."""
+
+    __slots__ = ("value", "next_", "size")
+
+    def __init__(self, value, next_=None):
+        """
+        Construct.
+
+        Args:
+            value: The value for the node.
+            next_: The node to set to next.
+
+        """
+        self.value = value
+        self.next_ = next_
+        # The number of nodes starting at this node
+        self.size = 1 if next_ is None else next_.size + 1
+
+
+class PersistentList:
+    """
+    Persistent singly linked list.
+
+    The list is never changed after it is constructed. Operations that would change
+    it return a new list instead which shares the nodes of the original list. Adding
+    to the front, removing from the front and cloning are O(1).
+    """
+
+    __slots__ = ("head",)
+
+    def __init__(self, head=None):
+        """
+        Construct.
+
+        Args:
+            head: The first node of the list, None for an empty list.
+
+        """
+        self.head = head
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """
+        Construct a list with the values of an iterable.
+
+        Args:
+            iterable: The values for the list.
+
+        Returns:
+            The new list.
+
+        """
+        head = None
+        for value in reversed(list(iterable)):
+            head = Node(value, head)
+        return cls(head)
+
+    def __len__(self):
+        """Get the number of values in the list."""
+        if self.head is None:
+            return 0
+        return self.head.size
+
+    def _check_empty(self):
+        """Raise ListEmptyError if the list is empty."""
+        if self.head is None:
+            raise ListEmptyError
+
+    def cons(self, value):
+        """
+        Create a list with a value added to the front of the list.
+
+        Args:
+            value: The value to add to the front.
+
+        Returns:
+            The new list which shares all nodes of the list.
+
+        """
+        return PersistentList(Node(value, self.head))
+
+    def first(self):
+        """
+        Return the first value of the list.
+
+        Raises ListEmptyError if the list is empty.
+
+        Returns:
+            The first value.
+
+        """
+        self._check_empty()
+        return self.head.value
+
+    def tail(self):
+        """
+        Create a list without the first value of the list.
+
+        Raises ListEmptyError if the list is empty.
+
+        Returns:
+            The new list which shares all but the first node of the list.
+
+        """
+        self._check_empty()
+        return PersistentList(self.head.next_)
+
+    def search(self, value):
+        """
+        Check whether value is in list.
+
+        Args:
+            value: The value to search for.
+
+        Returns:
+            Whether the value is in the list.
+
+        """
+        node = self.head
+        while node is not None and node.value != value:
+            node = node.next_
+        return node is not None
+
+    def __iter__(self):
+        """Iterate over list."""
+        node = self.head
+        while node is not None:
+            yield node.value
+            node = node.next_
+
+    def clone(self):
+        """
+        Clone the list.
+
+        Since the list can not be changed, the list itself is a snapshot of its
+        values.
+
+        Returns:
+            The list.
+
+        """
+        return self
+
+    def is_empty(self):
+        """
+        Check whether the list is empty.
+
+        Returns:
+            Whether the list is empty.
+
+        """
+        return self.head is None
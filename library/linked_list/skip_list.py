@@ -0,0 +1,268 @@
+"""Skip list that keeps values in sorted order."""
+
+import random
+
+
+class Node:
+    """
+    Represents a node in the skip list.
+
+    The node has a reference to the next node and the number of nodes it skips over
+    for each of its levels.
+    """
+
+    __slots__ = ("value", "next_", "width")
+
+    def __init__(self, value, level):
+        """
+        Construct.
+
+        Args:
+            value: The value for the node.
+            level: The number of levels of the node.
+
+        """
+        self.value = value
+        self.next_ = [None] * level
+        self.width = [1] * level
+
+
+class SkipList:
+    """
+    Skip list.
+
+    The nodes are linked in sorted order at the lowest level and each higher level
+    skips over a random selection of the nodes at the level below. Search, insert,
+    delete and rank queries are O(log n) expected time.
+    """
+
+    def __init__(self, probability=0.5, max_level=32, seed=None):
+        """
+        Construct.
+
+        Args:
+            probability: The probability that a node on a level is also on the next
+                level.
+            max_level: The maximum number of levels.
+            seed: The seed for the random generator that selects the levels.
+
+        """
+        if not 0 < probability < 1:
+            raise ValueError("Probability should be between 0 and 1.")
+        if max_level < 1:
+            raise ValueError("Maximum level should be at least 1.")
+        self._probability = probability
+        self._max_level = max_level
+        self._random = random.Random(seed)
+        # Node before the first node that is on all levels
+        self._head = Node(None, max_level)
+        # The number of levels in use
+        self._level = 1
+        # The number of values in the list
+        self._size = 0
+
+    def __len__(self):
+        """Get the number of values in the list."""
+        return self._size
+
+    def _random_level(self):
+        """
+        Select the number of levels for a new node.
+
+        Returns:
+            The number of levels.
+
+        """
+        level = 1
+        while level < self._max_level and self._random.random() < self._probability:
+            level += 1
+        return level
+
+    def insert(self, value):
+        """
+        Insert value into the list.
+
+        Equal values are inserted after the values already in the list.
+
+        Args:
+            value: The value to insert.
+
+        """
+        level = self._random_level()
+
+        # Starting to use more levels
+        for i in range(self._level, level):
+            self._head.next_[i] = None
+            self._head.width[i] = self._size + 1
+        self._level = max(self._level, level)
+
+        # Finding the last node on each level before the new node and its position
+        update = [None] * self._level
+        positions = [0] * self._level
+        node = self._head
+        position = 0
+        for i in reversed(range(self._level)):
+            while node.next_[i] is not None and node.next_[i].value <= value:
+                position += node.width[i]
+                node = node.next_[i]
+            update[i] = node
+            positions[i] = position
+
+        # Linking the new node
+        new_node = Node(value, level)
+        new_position = position + 1
+        for i in range(self._level):
+            if i < level:
+                new_node.next_[i] = update[i].next_[i]
+                update[i].next_[i] = new_node
+                new_node.width[i] = positions[i] + update[i].width[i] + 1 - new_position
+                update[i].width[i] = new_position - positions[i]
+            else:
+                update[i].width[i] += 1
+        self._size += 1
+
+    def _find_before(self, value):
+        """
+        Find the last node before the value on each level.
+
+        Args:
+            value: The value to search for.
+
+        Returns:
+            List with the last node with a value less than the value for each level.
+
+        """
+        update = [None] * self._level
+        node = self._head
+        for i in reversed(range(self._level)):
+            while node.next_[i] is not None and node.next_[i].value < value:
+                node = node.next_[i]
+            update[i] = node
+        return update
+
+    def search(self, value):
+        """
+        Search for the value in the list.
+
+        Args:
+            value: The value to search for.
+
+        Returns:
+            The value if found or None.
+
+        """
+        node = self._find_before(value)[0].next_[0]
+        if node is None or node.value != value:
+            return None
+        return node.value
+
+    def delete(self, value):
+        """
+        Delete the first occurrence of the value from the list.
+
+        Raises ValueError if the value is not in the list.
+
+        Args:
+            value: The value to delete.
+
+        """
+        update = self._find_before(value)
+        node = update[0].next_[0]
+        if node is None or node.value != value:
+            raise ValueError(f"{value} not found in the list")
+
+        # Unlinking the node
+        for i in range(self._level):
+            if update[i].next_[i] is node:
+                update[i].width[i] += node.width[i] - 1
+                update[i].next_[i] = node.next_[i]
+            else:
+                update[i].width[i] -= 1
+        self._size -= 1
+
+        # Removing levels that are no longer in use
+        while self._level > 1 and self._head.next_[self._level - 1] is None:
+            self._level -= 1
+
+    def rank(self, value):
+        """
+        Get the number of values in the list that are less than the value.
+
+        Args:
+            value: The value to calculate the rank for.
+
+        Returns:
+            The number of values less than the value.
+
+        """
+        node = self._head
+        position = 0
+        for i in reversed(range(self._level)):
+            while node.next_[i] is not None and node.next_[i].value < value:
+                position += node.width[i]
+                node = node.next_[i]
+        return position
+
+    def __getitem__(self, index):
+        """
+        Get the value at an index in sorted order.
+
+        Raises IndexError if the index is out of range.
+
+        Args:
+            index: The index of the value, negative indexes count from the end.
+
+        Returns:
+            The value at the index.
+
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("The index is out of range.")
+
+        # Positions start at 1 for the first node
+        remaining = index + 1
+        node = self._head
+        for i in reversed(range(self._level)):
+            while node.next_[i] is not None and node.width[i] <= remaining:
+                remaining -= node.width[i]
+                node = node.next_[i]
+        return node.value
+
+    def range(self, start=None, stop=None):
+        """
+        Iterate over the values from start up to but not including stop.
+
+        Args:
+            start: The smallest value to include, None to start at the first value.
+            stop: The value to stop before, None to stop after the last value.
+
+        """
+        if start is None:
+            node = self._head.next_[0]
+        else:
+            node = self._find_before(start)[0].next_[0]
+        while node is not None and (stop is None or node.value < stop):
+            yield node.value
+            node = node.next_[0]
+
+    def __iter__(self):
+        """Iterate over the values in sorted order."""
+        return self.range()
+
+    def is_empty(self):
+        """
+        Check whether the list is empty.
+
+        Returns:
+            Whether the list is empty.
+
+        """
+        return self._size == 0
+
+    def clear(self):
+        """Remove all values from the list."""
+        self._head = Node(None, self._max_level)
+        self._level = 1
+        self._size = 0
@@ -0,0 +1,274 @@
+"""Unrolled linked list that stores multiple values in each node."""
+
+import itertools
+
+
+class Node:
+    """Represents a node with a chunk of values in the unrolled linked list."""
+
+    __slots__ = ("values", "next_")
+
+    def __init__(self, values, next_=None):
+        """
+        Construct.
+
+        Args:
+            values: The list of values for the node.
+            next_: The node to set to next.
+
+        """
+        self.values = values
+        self.next_ = next_
+
+
+class UnrolledLinkedList:
+    """
+    Unrolled linked list.
+
+    Each node stores up to chunk_size values in a list. Iterating over the values of
+    a node does not have to follow a reference for each value and the overhead of a
+    node is shared between the values in the node.
+    """
+
+    def __init__(self, chunk_size=64):
+        """
+        Construct.
+
+        Args:
+            chunk_size: The maximum number of values in each node. Must be at least
+                1.
+
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size should be at least 1.")
+        self.chunk_size = chunk_size
+        self.head = None
+        self.tail = None
+        # The number of values in the list
+        self._size = 0
+
+    def __len__(self):
+        """Get the number of values in the list."""
+        return self._size
+
+    def add_first(self, value):
+        """
+        Add value to the front of the list.
+
+        Args:
+            value: The value to add to the front.
+
+        """
+        if self.head is None or len(self.head.values) >= self.chunk_size:
+            self.head = Node([value], self.head)
+            if self.tail is None:
+                self.tail = self.head
+        else:
+            self.head.values.insert(0, value)
+        self._size += 1
+
+    def add_last(self, value):
+        """
+        Add value to end of the list.
+
+        Args:
+            value: The value to add to the list.
+
+        """
+        if self.tail is None:
+            self.add_first(value)
+            return
+
+        if len(self.tail.values) >= self.chunk_size:
+            self.tail.next_ = Node([value])
+            self.tail = self.tail.next_
+        else:
+            self.tail.values.append(value)
+        self._size += 1
+
+    def _find(self, key):
+        """
+        Find the first occurrence of the key.
+
+        Args:
+            key: The value to search for.
+
+        Returns:
+            Tuple with the node before the node with the key, the node with the key
+            and the index of the key in the values of the node. The node before is
+            None if the head matched and the node is None if the key was not found.
+
+        """
+        node = self.head
+        last_node = None
+        while node is not None:
+            try:
+                return last_node, node, node.values.index(key)
+            except ValueError:
+                last_node = node
+                node = node.next_
+        return last_node, None, None
+
+    def _insert(self, node, index, value):
+        """
+        Insert a value into a node, splitting the node if it is over capacity.
+
+        Args:
+            node: The node to insert the value into.
+            index: The index in the values of the node to insert at.
+            value: The value to insert.
+
+        """
+        node.values.insert(index, value)
+        self._size += 1
+
+        # Checking whether the node has to be split
+        if len(node.values) <= self.chunk_size:
+            return
+        middle = len(node.values) // 2
+        node.next_ = Node(node.values[middle:], node.next_)
+        del node.values[middle:]
+        if node is self.tail:
+            self.tail = node.next_
+
+    def insert_after(self, key, value):
+        """
+        Insert a new value after a key.
+
+        Args:
+            key: The value after which to insert the new value.
+            value: The new value to insert.
+
+        """
+        _, node, index = self._find(key)
+        if node is not None:
+            self._insert(node, index + 1, value)
+
+    def insert_before(self, key, value):
+        """
+        Insert a new value before a key.
+
+        Args:
+            key: The value before which to insert the new value.
+            value: The new value to insert.
+
+        """
+        _, node, index = self._find(key)
+        if node is not None:
+            self._insert(node, index, value)
+
+    def delete(self, value):
+        """
+        Delete the first occurrence of the value.
+
+        If a node drops below half capacity and fits together with the next node in
+        a single node, the next node is merged into it.
+
+        Args:
+            value: The value to remove from the list.
+
+        """
+        last_node, node, index = self._find(value)
+
+        # Check if the value has been found
+        if node is None:
+            return
+        del node.values[index]
+        self._size -= 1
+
+        # Removing empty node
+        if not node.values:
+            if last_node is None:
+                self.head = node.next_
+            else:
+                last_node.next_ = node.next_
+            if node is self.tail:
+                self.tail = last_node
+            return
+
+        # Merging with the next node
+        next_ = node.next_
+        if (
+            next_ is not None
+            and len(node.values) < self.chunk_size / 2
+            and len(node.values) + len(next_.values) <= self.chunk_size
+        ):
+            node.values.extend(next_.values)
+            node.next_ = next_.next_
+            if next_ is self.tail:
+                self.tail = node
+
+    def traverse(self, func):
+        """
+        Call function on each value in the list.
+
+        Args:
+            func: The function to call each value with.
+
+        """
+        node = self.head
+        while node is not None:
+            for value in node.values:
+                func(value)
+            node = node.next_
+
+    def search(self, value):
+        """
+        Check whether value is in list.
+
+        Args:
+            value: The value to search for.
+
+        Returns:
+            Whether the value is in the list.
+
+        """
+        node = self.head
+        while node is not None:
+            if value in node.values:
+                return True
+            node = node.next_
+        return False
+
+    def _chunks(self):
+        """Iterate over the lists of values of the nodes."""
+        node = self.head
+        while node is not None:
+            yield node.values
+            node = node.next_
+
+    def __iter__(self):
+        """Iterate over list."""
+        # Chaining the lists of values iterates over the values of a node in C
+        return itertools.chain.from_iterable(self._chunks())
+
+    def clone(self):
+        """
+        Deep clone the list.
+
+        The values are packed into full nodes in the new list.
+
+        Returns:
+            A new list with the values from the current list.
+
+        """
+        new_list = UnrolledLinkedList(self.chunk_size)
+        for value in self:
+            new_list.add_last(value)
+        return new_list
+
+    def is_empty(self):
+        """
+        Check whether the list is empty.
+
+        Returns:
+            Whether the list is empty.
+
+        """
+        return self.head is None
+
+    def clear(self):
+        """Remove all elements from the list."""
+        self.head = None
+        self.tail = None
+        self._size = 0
@@ -0,0 +1,103 @@
+"""Lazy views of part of a linked list that do not copy the values."""
+
+
+class _View:
+    """
+    Base for views of a linked list.
+
+    A view iterates over the nodes of the list each time it is iterated over, which
+    means that it reflects the values of the list when iteration starts. If the list
+    is changed while the view is being iterated over, RuntimeError is raised on the
+    next step rather than following nodes that may no longer be in the list.
+    """
+
+    def __init__(self, list_):
+        """
+        Construct.
+
+        Args:
+            list_: The linked list to view.
+
+        """
+        self._list = list_
+
+    def _nodes(self):
+        """Iterate over the nodes of the list, checking that the list is not changed."""
+        version = self._list.version
+        node = self._list.head
+        while node is not None:
+            yield node
+            if self._list.version != version:
+                raise RuntimeError("Linked list changed during iteration.")
+            node = node.next_
+
+
+class View(_View):
+    """View of the values of a linked list between two indexes."""
+
+    def __init__(self, list_, start=None, stop=None):
+        """
+        Construct.
+
+        Args:
+            list_: The linked list to view.
+            start: The index of the first value, the start of the list if it is None.
+                Negative indexes count from the end of the list.
+            stop: The index after the last value, the end of the list if it is None.
+                Negative indexes count from the end of the list.
+
+        """
+        super().__init__(list_)
+        self._slice = slice(start, stop)
+
+    def _range(self):
+        """Calculate the start and stop index for the current length of the list."""
+        start, stop, _ = self._slice.indices(len(self._list))
+        return start, max(start, stop)
+
+    def __len__(self):
+        """Get the number of values in the view."""
+        start, stop = self._range()
+        return stop - start
+
+    def __iter__(self):
+        """Iterate over the values of the view."""
+        start, stop = self._range()
+        if start == stop:
+            return
+        for index, node in enumerate(self._nodes()):
+            if index >= start:
+                yield node.value
+                if index + 1 == stop:
+                    return
+
+
+class Between(_View):
+    """View of the values of a linked list from one value up to another value."""
+
+    def __init__(self, list_, start, stop):
+        """
+        Construct.
+
+        Args:
+            list_: The linked list to view.
+            start: The value to start at, the view starts at its first occurrence and
+                is empty if it is not in the list.
+            stop: The value to stop before, the view stops at its first occurrence
+                after the start and runs to the end of the list if it is not found.
+
+        """
+        super().__init__(list_)
+        self._start = start
+        self._stop = stop
+
+    def __iter__(self):
+        """Iterate over the values of the view."""
+        started = False
+        for node in self._nodes():
+            if not started:
+                started = node.value == self._start
+            elif node.value == self._stop:
+                return
+            if started:
+                yield node.value
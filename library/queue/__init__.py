@@ -10,17 +10,39 @@ class QueueFullError(Exception):
 
 
 class Queue:
-    """Queue implemented using a linked list."""
+    """
+    Queue implemented using a linked list.
 
-    def __init__(self, length=10):
+    In growth mode the queue doubles its length instead of raising QueueFullError
+    when it is full, and halves its length when the fraction of the length that is
+    used drops below the shrink threshold. The values are copied to the start of
+    the new array using at most two slices. Since the length doubles, each value is
+    copied O(1) times on average which means that enqueue and dequeue are amortized
+    O(1).
+    """
+
+    def __init__(self, length=10, grow=False, shrink_threshold=0.25):
         """
         Construct.
 
         Args:
-            length: The length of the queue.
+            length: The length of the queue. In growth mode this is the initial and
+                the minimum length.
+            grow: Whether to grow and shrink the queue as needed.
+            shrink_threshold: In growth mode, the fraction of the length below
+                which the queue shrinks. Must be less than a half so that the queue
+                is not full after shrinking, 0 to never shrink.
 
         """
+        if not 0 <= shrink_threshold < 0.5:
+            raise ValueError(
+                "The shrink threshold must be at least 0 and less than 0.5, got "
+                f"{shrink_threshold}."
+            )
         self.length = length
+        self.grow = grow
+        self.shrink_threshold = shrink_threshold
+        self._min_length = length
         self.size = 0
         self._list = [None for _ in range(length)]
         self.front = 0
@@ -49,6 +71,8 @@ class Queue:
             value: The value to add to the queue.
 
         """
+        if self.grow and self.size == self.length:
+            self._resize(max(1, 2 * self.length))
         self._check_full()
 
         new_back = self._increment_position(self.back)
@@ -67,10 +91,144 @@ class Queue:
         self._check_empty()
 
         value = self._list[self.front]
+        # Releasing the reference so that the value can be garbage collected
+        self._list[self.front] = None
         self.front = self._increment_position(self.front)
         self.size -= 1
+        if (
+            self.grow
+            and self.size < self.length * self.shrink_threshold
+            and self.length // 2 >= self._min_length
+        ):
+            self._resize(self.length // 2)
         return value
 
+    def enqueue_many(self, iterable):
+        """
+        Add the values of an iterable to the back of the queue in one call.
+
+        The values are copied into the array using at most two slices, one up to the
+        end of the array and one from its start. Raises QueueFullError without
+        adding any values if they do not fit and the queue is not in growth mode.
+
+        Args:
+            iterable: The values to add, a list, tuple or range is copied without
+                first converting it to a list.
+
+        """
+        # Other sequences, such as a deque, may not support slicing
+        values = (
+            iterable if isinstance(iterable, (list, tuple, range)) else list(iterable)
+        )
+        count = len(values)
+        if count == 0:
+            return
+        if self.size + count > self.length:
+            if not self.grow:
+                raise QueueFullError
+            length = max(1, self.length)
+            while length < self.size + count:
+                length *= 2
+            self._resize(length)
+
+        start = self._increment_position(self.back)
+        first_count = min(count, self.length - start)
+        if first_count == count:
+            self._list[start : start + count] = values
+        else:
+            self._list[start:] = values[:first_count]
+            self._list[: count - first_count] = values[first_count:]
+        self.back = (start + count - 1) % self.length
+        self.size += count
+
+    def dequeue_many(self, count):
+        """
+        Remove and return a number of values from the front of the queue.
+
+        The values are copied out of the array using at most two slices. Raises
+        QueueEmptyError without removing any values if the queue has fewer values.
+
+        Args:
+            count: The number of values to dequeue.
+
+        Returns:
+            The values from the front to the back.
+
+        """
+        if count < 0:
+            raise ValueError(
+                f"Cannot dequeue a negative number of values, got {count}."
+            )
+        if count > self.size:
+            raise QueueEmptyError
+        if count == 0:
+            return []
+
+        values = self._values(count)
+        # Releasing the references so that the values can be garbage collected
+        end = self.front + count
+        if end <= self.length:
+            self._list[self.front : end] = [None] * count
+        else:
+            self._list[self.front :] = [None] * (self.length - self.front)
+            self._list[: end - self.length] = [None] * (end - self.length)
+        self.front = end % self.length
+        self.size -= count
+
+        if self.grow:
+            length = self.length
+            while (
+                self.size < length * self.shrink_threshold
+                and length // 2 >= self._min_length
+            ):
+                length //= 2
+            if length != self.length:
+                self._resize(length)
+        return values
+
+    def drain(self):
+        """
+        Remove and return all the values in the queue.
+
+        Returns:
+            The values from the front to the back.
+
+        """
+        return self.dequeue_many(self.size)
+
+    def _values(self, count=None):
+        """
+        Copy values in the queue starting at the front.
+
+        Args:
+            count: The number of values to copy, all values if it is None.
+
+        Returns:
+            A list with the values, copied using at most two slices.
+
+        """
+        if count is None:
+            count = self.size
+        end = self.front + count
+        if end <= self.length:
+            return self._list[self.front : end]
+        return self._list[self.front :] + self._list[: end - self.length]
+
+    def _resize(self, length):
+        """
+        Move the values to the start of a new array with a length.
+
+        Args:
+            length: The new length, at least the size of the queue.
+
+        """
+        values = self._values()
+        values.extend([None] * (length - self.size))
+        self._list = values
+        self.length = length
+        self.front = 0
+        self.back = self.size - 1
+
     def get_front(self):
         """
         Return the value from the front of the queue without dequeueing it.
@@ -107,3 +265,6 @@ class Queue:
         self.front = 0
         self.back = -1
         self.size = 0
+        # Releasing the memory of a queue that has grown
+        if self.grow:
+            self._resize(self._min_length)
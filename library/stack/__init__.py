@@ -1,9 +1,18 @@
 """Stack implemented using a linked list."""
 
+from .aggregate import AggregateStack
+from .array_backed import ArrayStack
+from .blocking import BlockingStack
+from .errors import StackEmptyError
+from .errors import StackFullError
+from .spilling import SpillingStack
+
 
 class _Node:
     """Node for the linked list."""
 
+    __slots__ = ("value", "next_")
+
     def __init__(self, value, next_=None):
         """
         Construct.
@@ -17,16 +26,14 @@ class _Node:
         self.next_ = next_
 
 
-class StackEmptyError(Exception):
-    """Raised when pop is called on an empty stack."""
-
-
 class _LinkedList:
     """Linked list for the stack."""
 
     def __init__(self):
         """Construct."""
         self.head = None
+        # The number of nodes in the list
+        self.size = 0
 
     def add_first(self, value):
         """
@@ -37,6 +44,26 @@ class _LinkedList:
 
         """
         self.head = _Node(value, self.head)
+        self.size += 1
+
+    def add_many_first(self, iterable):
+        """
+        Add the values of an iterable to the front of the linked list one by one.
+
+        The nodes are only linked into the list once all values have been added so
+        that the list is unchanged if the iterable raises.
+
+        Args:
+            iterable: The values to add, the last value ends up first.
+
+        """
+        head = self.head
+        count = 0
+        for value in iterable:
+            head = _Node(value, head)
+            count += 1
+        self.head = head
+        self.size += count
 
     def remove_first(self):
         """
@@ -52,21 +79,88 @@ class _LinkedList:
 
         node = self.head
         self.head = self.head.next_
+        self.size -= 1
         return node.value
 
+    def remove_many_first(self, count):
+        """
+        Remove a number of nodes from the front of the list and return their values.
+
+        Raises StackEmptyError without removing any nodes if the list has fewer
+        nodes.
+
+        Args:
+            count: The number of nodes to remove.
+
+        Returns:
+            The values of the removed nodes, starting with the first node.
+
+        """
+        if count < 0:
+            raise ValueError(f"Cannot remove a negative number of nodes, got {count}.")
+        if count > self.size:
+            raise StackEmptyError
+
+        values = []
+        node = self.head
+        for _ in range(count):
+            values.append(node.value)
+            node = node.next_
+        self.head = node
+        self.size -= count
+        return values
+
     def raise_empty(self):
         """Raise StackEmptyError if the stack is empty."""
         if self.head is None:
             raise StackEmptyError
 
+    def copy(self):
+        """
+        Create a list that starts at the same node.
+
+        The nodes are never changed once they have been added, the list only moves
+        its head, which means that the lists can share the nodes.
+
+        Returns:
+            A list with the same nodes.
+
+        """
+        list_ = _LinkedList()
+        list_.head = self.head
+        list_.size = self.size
+        return list_
+
 
 class Stack:
-    """Implementation of a stack."""
+    """
+    Implementation of a stack.
+
+    A value is pushed by adding a node in front of the top node and popped by moving
+    the top to the next node, the nodes themselves are never changed. Stacks can
+    therefore share the nodes below their top, which makes forking a stack O(1).
+    """
 
     def __init__(self):
         """Construct."""
         self._list = _LinkedList()
 
+    @classmethod
+    def _from_list(cls, list_):
+        """
+        Construct a stack using a linked list.
+
+        Args:
+            list_: The linked list for the stack.
+
+        Returns:
+            The new stack.
+
+        """
+        stack = cls()
+        stack._list = list_
+        return stack
+
     def push(self, value):
         """
         Add a new value to the stack.
@@ -77,6 +171,19 @@ class Stack:
         """
         self._list.add_first(value)
 
+    def push_many(self, iterable):
+        """
+        Add the values of an iterable to the stack in one call.
+
+        Equivalent to pushing each value which means that the last value ends up at
+        the top of the stack.
+
+        Args:
+            iterable: The values to add to the stack.
+
+        """
+        self._list.add_many_first(iterable)
+
     def pop(self):
         """
         Remove the most recently added value from the list and return it.
@@ -89,6 +196,22 @@ class Stack:
         """
         return self._list.remove_first()
 
+    def pop_many(self, count):
+        """
+        Remove a number of the most recently added values and return them.
+
+        Raises StackEmptyError without removing any values if the stack has fewer
+        values.
+
+        Args:
+            count: The number of values to pop.
+
+        Returns:
+            The values in the order that they would have been popped one by one.
+
+        """
+        return self._list.remove_many_first(count)
+
     def peek(self):
         """
         Return the value at the top of the stack without popping it.
@@ -111,3 +234,33 @@ class Stack:
 
         """
         return self._list.head is None
+
+    def __len__(self):
+        """Get the number of values on the stack."""
+        return self._list.size
+
+    def fork(self):
+        """
+        Create an independent stack with the same values in O(1) time and memory.
+
+        The stacks share the nodes with the values that are on both stacks. Pushing
+        onto or popping from either stack does not change the other stack.
+
+        Returns:
+            The new stack.
+
+        """
+        return self._from_list(self._list.copy())
+
+    def snapshot(self):
+        """
+        Record the values of the stack in O(1) time and memory.
+
+        The snapshot is a fork of the stack, changing the stack afterwards does not
+        change the snapshot. To return to the snapshot, fork it again.
+
+        Returns:
+            A stack with the current values.
+
+        """
+        return self.fork()
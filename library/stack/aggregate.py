@@ -0,0 +1,128 @@
+"""Stack that keeps the minimum, maximum and an aggregate of its values."""
+
+from .array_backed import ArrayStack
+
+
+class AggregateStack:
+    """
+    Stack that can return the minimum, maximum and an aggregate of its values in O(1).
+
+    Each entry stores the minimum, maximum and aggregate of the values up to and
+    including its value. Since values are only added and removed at the top, the
+    entries below the top are not affected by a push or pop which means that the
+    results for the values that remain after a pop are already stored.
+    """
+
+    def __init__(self, function=None):
+        """
+        Construct.
+
+        Args:
+            function: Function that combines the aggregate of the values below a
+                value with the value, for example operator.add for the sum. The
+                first value is the aggregate of a single value. If it is None, only
+                the minimum and maximum are kept.
+
+        """
+        self.function = function
+        # Tuples with the value, minimum, maximum and aggregate
+        self._stack = ArrayStack()
+
+    def push(self, value):
+        """
+        Add a new value to the stack.
+
+        Args:
+            value: The value to add to the stack.
+
+        """
+        if self._stack.is_empty():
+            self._stack.push((value, value, value, value))
+            return
+
+        _, minimum, maximum, aggregate = self._stack.peek()
+        self._stack.push(
+            (
+                value,
+                value if value < minimum else minimum,
+                value if value > maximum else maximum,
+                None if self.function is None else self.function(aggregate, value),
+            )
+        )
+
+    def pop(self):
+        """
+        Remove the most recently added value from the stack and return it.
+
+        Raises StackEmptyError if the stack is empty.
+
+        Returns:
+            The most recently added value.
+
+        """
+        return self._stack.pop()[0]
+
+    def peek(self):
+        """
+        Return the value at the top of the stack without popping it.
+
+        Raises StackEmptyError if the stack is empty.
+
+        Returns:
+            The top value.
+
+        """
+        return self._stack.peek()[0]
+
+    def minimum(self):
+        """
+        Return the smallest value on the stack.
+
+        Raises StackEmptyError if the stack is empty.
+
+        Returns:
+            The smallest value, the first one pushed if several are equal.
+
+        """
+        return self._stack.peek()[1]
+
+    def maximum(self):
+        """
+        Return the largest value on the stack.
+
+        Raises StackEmptyError if the stack is empty.
+
+        Returns:
+            The largest value, the first one pushed if several are equal.
+
+        """
+        return self._stack.peek()[2]
+
+    def aggregate(self):
+        """
+        Return the aggregate of the values on the stack.
+
+        Raises StackEmptyError if the stack is empty and ValueError if the stack has
+        no aggregate function.
+
+        Returns:
+            The values combined with the function from the bottom to the top.
+
+        """
+        if self.function is None:
+            raise ValueError("The stack has no aggregate function.")
+        return self._stack.peek()[3]
+
+    def is_empty(self):
+        """
+        Check whether the stack is empty.
+
+        Returns:
+            Whether the stack is empty.
+
+        """
+        return self._stack.is_empty()
+
+    def __len__(self):
+        """Get the number of values on the stack."""
+        return len(self._stack)
@@ -0,0 +1,161 @@
+"""Stack stored in a growable array."""
+
+from .errors import StackEmptyError
+
+
+class ArrayStack:
+    """
+    Stack stored in a contiguous array.
+
+    The values are stored in a preallocated array with the top of the stack at the
+    highest used index. When the array is full its capacity is doubled, which
+    means that pushing is amortized O(1) and that no object is created for each
+    value. With shrink, the capacity is halved when no more than a quarter of the
+    array is used so that memory is returned after the stack has been large. Waiting
+    until a quarter rather than half is used means that alternating pushes and pops
+    at the boundary do not resize the array each time.
+    """
+
+    def __init__(self, capacity=16, shrink=False):
+        """
+        Construct.
+
+        Args:
+            capacity: The initial number of values that can be stored before the
+                array is grown. The array is never shrunk below it.
+            shrink: Whether to shrink the array when few of its slots are used.
+
+        """
+        if capacity < 1:
+            raise ValueError(f"The capacity must be at least 1, got {capacity}.")
+        self._min_capacity = capacity
+        self.shrink = shrink
+        self._values = [None] * capacity
+        # The number of values on the stack and the index after the top value
+        self._size = 0
+
+    @property
+    def capacity(self):
+        """The number of values that can be stored before the array is grown."""
+        return len(self._values)
+
+    def push(self, value):
+        """
+        Add a new value to the stack.
+
+        Args:
+            value: The value to add to the stack.
+
+        """
+        values = self._values
+        if self._size == len(values):
+            values.extend([None] * len(values))
+        values[self._size] = value
+        self._size += 1
+
+    def push_many(self, iterable):
+        """
+        Add the values of an iterable to the stack in one call.
+
+        The values are copied into the array using a single slice assignment after
+        growing the array once if needed. The last value ends up at the top.
+
+        Args:
+            iterable: The values to add to the stack.
+
+        """
+        new_values = list(iterable)
+        size = self._size + len(new_values)
+        capacity = len(self._values)
+        if size > capacity:
+            while capacity < size:
+                capacity *= 2
+            self._values.extend([None] * (capacity - len(self._values)))
+        self._values[self._size : size] = new_values
+        self._size = size
+
+    def pop(self):
+        """
+        Remove the most recently added value from the stack and return it.
+
+        Raises StackEmptyError if the stack is empty.
+
+        Returns:
+            The most recently added value.
+
+        """
+        if self._size == 0:
+            raise StackEmptyError
+        self._size -= 1
+        values = self._values
+        value = values[self._size]
+        # Releasing the reference so that the value can be garbage collected
+        values[self._size] = None
+        if self.shrink and self._size <= len(values) // 4:
+            self._shrink()
+        return value
+
+    def pop_many(self, count):
+        """
+        Remove a number of the most recently added values and return them.
+
+        Raises StackEmptyError without removing any values if the stack has fewer
+        values.
+
+        Args:
+            count: The number of values to pop.
+
+        Returns:
+            The values in the order that they would have been popped one by one.
+
+        """
+        if count < 0:
+            raise ValueError(f"Cannot pop a negative number of values, got {count}.")
+        if count > self._size:
+            raise StackEmptyError
+
+        start = self._size - count
+        values = self._values[start : self._size]
+        values.reverse()
+        # Releasing the references so that the values can be garbage collected
+        self._values[start : self._size] = [None] * count
+        self._size = start
+        if self.shrink:
+            self._shrink()
+        return values
+
+    def _shrink(self):
+        """Halve the capacity while no more than a quarter of the array is used."""
+        values = self._values
+        capacity = len(values)
+        while self._size <= capacity // 4 and capacity // 2 >= self._min_capacity:
+            capacity //= 2
+        del values[capacity:]
+
+    def peek(self):
+        """
+        Return the value at the top of the stack without popping it.
+
+        Raises StackEmptyError if the stack is empty.
+
+        Returns:
+            The top value.
+
+        """
+        if self._size == 0:
+            raise StackEmptyError
+        return self._values[self._size - 1]
+
+    def is_empty(self):
+        """
+        Check whether the stack is empty.
+
+        Returns:
+            Whether the stack is empty.
+
+        """
+        return self._size == 0
+
+    def __len__(self):
+        """Get the number of values on the stack."""
+        return self._size
@@ -0,0 +1,144 @@
+"""Stack that can be shared between threads."""
+
+import threading
+
+from .array_backed import ArrayStack
+from .errors import StackEmptyError
+from .errors import StackFullError
+
+
+class BlockingStack:
+    """
+    Thread safe stack where pop waits for a value and push waits for space.
+
+    Every operation holds a lock while it changes the stack. Threads that wait for
+    a value or for space sleep on a condition variable that is notified by the
+    operation that makes a value or space available, rather than repeatedly
+    checking the stack.
+    """
+
+    def __init__(self, maxsize=0):
+        """
+        Construct.
+
+        Args:
+            maxsize: The maximum number of values on the stack, the stack is
+                unbounded if it is 0 or less.
+
+        """
+        self.maxsize = maxsize
+        self._stack = ArrayStack()
+        self._lock = threading.Lock()
+        # Notified when a value is pushed and when a value is popped
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    @staticmethod
+    def _wait(condition, predicate, block, timeout):
+        """
+        Wait until a predicate is true while holding the lock of a condition.
+
+        Args:
+            condition: The condition that is notified when the predicate may change.
+            predicate: Function that returns whether to stop waiting.
+            block: Whether to wait, if it is False the predicate is only checked.
+            timeout: The maximum number of seconds to wait, None to wait forever.
+
+        Returns:
+            Whether the predicate is true.
+
+        """
+        if not block:
+            return predicate()
+        if timeout is not None and timeout < 0:
+            raise ValueError(f"The timeout must not be negative, got {timeout}.")
+        return condition.wait_for(predicate, timeout)
+
+    def _is_full(self):
+        """Check whether the stack is full while holding the lock."""
+        return 0 < self.maxsize <= len(self._stack)
+
+    def push(self, value, block=True, timeout=None):
+        """
+        Add a new value to the stack.
+
+        Raises StackFullError if the stack is full and is not popped from in time.
+
+        Args:
+            value: The value to add to the stack.
+            block: Whether to wait for space if the stack is full.
+            timeout: The maximum number of seconds to wait for space, None to wait
+                until there is space.
+
+        """
+        with self._lock:
+            if not self._wait(
+                self._not_full, lambda: not self._is_full(), block, timeout
+            ):
+                raise StackFullError
+            self._stack.push(value)
+            self._not_empty.notify()
+
+    def pop(self, block=True, timeout=None):
+        """
+        Remove the most recently added value from the stack and return it.
+
+        Raises StackEmptyError if the stack is empty and is not pushed to in time.
+
+        Args:
+            block: Whether to wait for a value if the stack is empty.
+            timeout: The maximum number of seconds to wait for a value, None to wait
+                until there is a value.
+
+        Returns:
+            The most recently added value.
+
+        """
+        with self._lock:
+            if not self._wait(
+                self._not_empty, lambda: not self._stack.is_empty(), block, timeout
+            ):
+                raise StackEmptyError
+            value = self._stack.pop()
+            self._not_full.notify()
+            return value
+
+    def peek(self):
+        """
+        Return the value at the top of the stack without popping it.
+
+        Raises StackEmptyError if the stack is empty.
+
+        Returns:
+            The top value.
+
+        """
+        with self._lock:
+            return self._stack.peek()
+
+    def is_empty(self):
+        """
+        Check whether the stack is empty.
+
+        Returns:
+            Whether the stack is empty.
+
+        """
+        with self._lock:
+            return self._stack.is_empty()
+
+    def is_full(self):
+        """
+        Check whether the stack is full.
+
+        Returns:
+            Whether the stack has maxsize values.
+
+        """
+        with self._lock:
+            return self._is_full()
+
+    def __len__(self):
+        """Get the number of values on the stack."""
+        with self._lock:
+            return len(self._stack)
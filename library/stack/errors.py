@@ -0,0 +1,9 @@
+"""Exceptions raised by the stacks."""
+
+
+class StackEmptyError(Exception):
+    """Raised when pop is called on an empty stack."""
+
+
+class StackFullError(Exception):
+    """Raised when push is called on a full stack."""
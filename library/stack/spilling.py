@@ -0,0 +1,181 @@
+"""Stack that keeps its top in memory and spills the rest to a temporary file."""
+
+import pickle
+import tempfile
+
+from .errors import StackEmptyError
+
+
+class SpillingStack:
+    """
+    Stack for more values than fit in memory.
+
+    The values are kept in segments of up to segment_size values. Only the top
+    memory_segments segments are kept in memory. When another segment is needed,
+    the lowest segment in memory is written to the end of a temporary file as a
+    single pickled block. Since the values below the segments in memory are only
+    needed once those segments have been popped, the file is used as a stack of
+    segments. The segment written last is read back when the memory is empty and
+    the file is truncated to where it started. Values must be picklable.
+
+    The stack should be closed to remove the temporary file, for example by using
+    it as a context manager.
+    """
+
+    def __init__(self, segment_size=10_000, memory_segments=2, directory=None):
+        """
+        Construct.
+
+        Args:
+            segment_size: The number of values written to and read from the file at a
+                time.
+            memory_segments: The maximum number of segments kept in memory.
+            directory: The directory for the temporary file, the default temporary
+                directory if it is None.
+
+        """
+        if segment_size < 1:
+            raise ValueError(
+                f"The segment size must be at least 1, got {segment_size}."
+            )
+        if memory_segments < 1:
+            raise ValueError(
+                "The number of memory segments must be at least 1, got "
+                f"{memory_segments}."
+            )
+        self.segment_size = segment_size
+        self.memory_segments = memory_segments
+        self.directory = directory
+        # The segments in memory from the lowest to the top segment
+        self._segments = []
+        # The temporary file, created when the first segment is spilled
+        self._file = None
+        # The offset of each segment in the file from the first to the last
+        self._offsets = []
+        self._size = 0
+        self._spilled = 0
+
+    @property
+    def spilled(self):
+        """The number of values that are stored in the file."""
+        return self._spilled
+
+    def _spill(self):
+        """
+        Write the lowest segment in memory to the end of the file.
+
+        The segment is pickled before anything is written and only removed from
+        memory once it has been written, so the stack is unchanged if a value cannot
+        be pickled or the write fails.
+        """
+        data = pickle.dumps(self._segments[0], pickle.HIGHEST_PROTOCOL)
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self.directory)
+        offset = self._file.seek(0, 2)
+        try:
+            self._file.write(data)
+        except OSError:
+            # Removing a partially written segment
+            self._file.truncate(offset)
+            raise
+        segment = self._segments.pop(0)
+        self._offsets.append(offset)
+        self._spilled += len(segment)
+
+    def _restore(self):
+        """Read the last segment from the file into memory."""
+        offset = self._offsets.pop()
+        self._file.seek(offset)
+        segment = pickle.load(self._file)
+        self._file.truncate(offset)
+        self._segments.append(segment)
+        self._spilled -= len(segment)
+
+    def _top_segment(self):
+        """
+        Get the top segment in memory, reading a segment from the file if needed.
+
+        Raises StackEmptyError if the stack is empty.
+
+        Returns:
+            The top segment.
+
+        """
+        if not self._segments:
+            if not self._offsets:
+                raise StackEmptyError
+            self._restore()
+        return self._segments[-1]
+
+    def push(self, value):
+        """
+        Add a new value to the stack.
+
+        Args:
+            value: The value to add to the stack.
+
+        """
+        if not self._segments or len(self._segments[-1]) == self.segment_size:
+            # Spilling before adding the segment leaves the stack unchanged if it fails
+            if len(self._segments) == self.memory_segments:
+                self._spill()
+            self._segments.append([])
+        self._segments[-1].append(value)
+        self._size += 1
+
+    def pop(self):
+        """
+        Remove the most recently added value from the stack and return it.
+
+        Raises StackEmptyError if the stack is empty.
+
+        Returns:
+            The most recently added value.
+
+        """
+        segment = self._top_segment()
+        value = segment.pop()
+        if not segment:
+            self._segments.pop()
+        self._size -= 1
+        return value
+
+    def peek(self):
+        """
+        Return the value at the top of the stack without popping it.
+
+        Raises StackEmptyError if the stack is empty.
+
+        Returns:
+            The top value.
+
+        """
+        return self._top_segment()[-1]
+
+    def is_empty(self):
+        """
+        Check whether the stack is empty.
+
+        Returns:
+            Whether the stack is empty.
+
+        """
+        return self._size == 0
+
+    def __len__(self):
+        """Get the number of values on the stack."""
+        return self._size
+
+    def close(self):
+        """Remove the temporary file, the stack should not be used afterwards."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        """Use the stack as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *_):
+        """Close the stack."""
+        self.close()
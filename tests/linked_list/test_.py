@@ -0,0 +1,1912 @@
+"""Tests for linked list."""
+# pylint: disable=redefined-outer-name,unused-argument
+
+import random
+from unittest import mock
+
+import pytest
+
+from library import linked_list
+
+
+@pytest.fixture
+def empty_list():
+    """Linked list with empty value."""
+    list_ = linked_list.LinkedList()
+    return list_
+
+
+@pytest.fixture
+def single_list(empty_list):
+    """Linked list with single value."""
+    empty_list.add_last("value 1")
+    return empty_list
+
+
+@pytest.fixture
+def multiple_list(single_list):
+    """Linked list with multiple values."""
+    single_list.add_last("value 2")
+    return single_list
+
+
+@pytest.fixture
+def duplicate_list(single_list):
+    """Linked list with duplicate values."""
+    single_list.add_last("value 1")
+    return single_list
+
+
+def test_node_construct_no_next():
+    """
+    GIVEN value for node
+    WHEN node is constructed with the value
+    THEN the value is copied into the node and next_ is None.
+    """
+    value = "value 1"
+
+    node = linked_list.Node(value)
+
+    assert node.value == value
+    assert node.next_ is None
+
+
+def test_node_construct_with_next():
+    """
+    GIVEN value for node and next node
+    WHEN node is constructed with the value and the next node
+    THEN the value is copied into the node and next_ is the next node.
+    """
+    next_node = linked_list.Node("value 1")
+    value = "value 2"
+
+    node = linked_list.Node(value, next_node)
+
+    assert node.value == value
+    assert node.next_ is not linked_list.Node
+    assert node.next_.value == "value 1"
+
+
+def test_node_slots():
+    """
+    GIVEN node
+    WHEN the attributes of the node are checked
+    THEN the node has no per instance dictionary.
+    """
+    node = linked_list.Node("value 1")
+
+    assert not hasattr(node, "__dict__")
+
+
+def test_construct():
+    """
+    GIVEN
+    WHEN linked list is constructed
+    THEN head is None.
+    """
+    list_ = linked_list.LinkedList()
+
+    assert list_.head is None
+
+
+def test_add_empty(empty_list):
+    """
+    GIVEN empty linked list value to add
+    WHEN add is called with the value
+    THEN head is replaced with a Node with value set to input value and next_ set to
+        None.
+    """
+    list_ = linked_list.LinkedList()
+    value = "value 1"
+
+    list_.add_first(value)
+
+    assert list_.head.value == value
+    assert list_.head.next_ is None
+
+
+def test_add_single(single_list):
+    """
+    GIVEN linked list with single node and a value
+    WHEN add is called with the value
+    THEN head is changed to the new value referencing the old value.
+    """
+    value = "value 2"
+
+    single_list.add_first(value)
+
+    assert single_list.head.value == value
+    assert single_list.head.next_ is not None
+    assert single_list.head.next_.value == "value 1"
+    assert single_list.head.next_.next_ is None
+
+
+def test_add_multiple(multiple_list):
+    """
+    GIVEN linked list with two nodes and a value
+    WHEN add is called with the value
+    THEN the second node has the value.
+    """
+    value = "value 3"
+
+    multiple_list.add_first(value)
+
+    assert multiple_list.head.value == value
+
+
+def test_add_last_empty(empty_list):
+    """
+    GIVEN empty linked list value to add_last
+    WHEN add_last is called with the value
+    THEN head is replaced with a Node with value set to input value and next_ set to
+        None.
+    """
+    list_ = linked_list.LinkedList()
+    value = "value 1"
+
+    list_.add_last(value)
+
+    assert list_.head.value == value
+    assert list_.head.next_ is None
+
+
+def test_add_last_single(single_list):
+    """
+    GIVEN linked list with single node and a value
+    WHEN add_last is called with the value
+    THEN head references a Node with the value and None for next_.
+    """
+    value = "value 2"
+
+    single_list.add_last(value)
+
+    assert single_list.head.next_ is not None
+    assert single_list.head.next_.value == value
+    assert single_list.head.next_.next_ is None
+
+
+def test_add_last_multiple(multiple_list):
+    """
+    GIVEN linked list with two nodes and a value
+    WHEN add_last is called with the value
+    THEN the second node has the value.
+    """
+    value = "value 3"
+
+    multiple_list.add_last(value)
+
+    assert multiple_list.head.next_.next_.value == value
+
+
+def test_traverse_empty(empty_list):
+    """
+    GIVEN empty list and mock function
+    WHEN traverse is called with the mock function
+    THEN the mock function is not called.
+    """
+    func = mock.MagicMock()
+
+    empty_list.traverse(func)
+
+    func.assert_not_called()
+
+
+def test_traverse_single(single_list):
+    """
+    GIVEN single list and mock function
+    WHEN traverse is called with the mock function
+    THEN the mock function is called with a single value.
+    """
+    func = mock.MagicMock()
+
+    single_list.traverse(func)
+
+    func.assert_called_once_with("value 1")
+
+
+def test_traverse_multiple(multiple_list):
+    """
+    GIVEN multiple list and mock function
+    WHEN traverse is called with the mock function
+    THEN the mock function is called with all values.
+    """
+    func = mock.MagicMock()
+
+    multiple_list.traverse(func)
+
+    assert func.call_count == 2
+    func.assert_any_call("value 1")
+    func.assert_called_with("value 2")
+
+
+def test_search_empty(empty_list):
+    """
+    GIVEN empty list
+    WHEN search is called
+    THEN False is returned.
+    """
+    found = empty_list.search("value 1")
+
+    assert not found
+
+
+@pytest.mark.parametrize(
+    "value, expected_found",
+    [("value 2", False), ("value 1", True)],
+    ids=["not in list", "in list"],
+)
+def test_found_single(single_list, value, expected_found):
+    """
+    GIVEN single list, value to search for and expected found value
+    WHEN search is called with the value
+    THEN the expected found value is returned
+    """
+    found = single_list.search(value)
+
+    assert found == expected_found
+
+
+@pytest.mark.parametrize(
+    "value, expected_found",
+    [("value 3", False), ("value 2", True), ("value 1", True)],
+    ids=["not in list", "in list", "in list"],
+)
+def test_found_multiple(multiple_list, value, expected_found):
+    """
+    GIVEN multiple list, value to search for and expected found value
+    WHEN search is called with the value
+    THEN the expected found value is returned
+    """
+    found = multiple_list.search(value)
+
+    assert found == expected_found
+
+
+def test_iter_empty(empty_list):
+    """
+    GIVEN empty list
+    WHEN list is iterated
+    THEN empty generator is returned.
+    """
+    assert list(iter(empty_list)) == []
+
+
+def test_iter_single(single_list):
+    """
+    GIVEN single list
+    WHEN list is iterated
+    THEN generator with single item is returned.
+    """
+    assert list(iter(single_list)) == ["value 1"]
+
+
+def test_iter_multiple(multiple_list):
+    """
+    GIVEN multiple list
+    WHEN list is iterated
+    THEN generator with multiple items is returned.
+    """
+    assert list(iter(multiple_list)) == ["value 1", "value 2"]
+
+
+def test_insert_after_empty(empty_list):
+    """
+    GIVEN empty list and value
+    WHEN insert_after is called with the value
+    THEN value is not added.
+    """
+    value = "value 1"
+
+    empty_list.insert_after(value, value)
+
+    assert list(iter(empty_list)) == []
+
+
+@pytest.mark.parametrize(
+    "key, expected_list",
+    [("value 2", ["value 1"]), ("value 1", ["value 1", "value 2"])],
+    ids=["value not in list", "value in list"],
+)
+def test_insert_after_single(single_list, key, expected_list):
+    """
+    GIVEN single item list, value, key and expected list
+    WHEN insert_after is called with the value and key
+    THEN the linked list contains the expected values in the expected order.
+    """
+    value = "value 2"
+
+    single_list.insert_after(key, value)
+
+    assert list(iter(single_list)) == expected_list
+
+
+@pytest.mark.parametrize(
+    "key, expected_list",
+    [
+        ("value 3", ["value 1", "value 2"]),
+        ("value 2", ["value 1", "value 2", "value 3"]),
+        ("value 1", ["value 1", "value 3", "value 2"]),
+    ],
+    ids=["value not in list", "value in list last", "value in list first"],
+)
+def test_insert_after_multiple(multiple_list, key, expected_list):
+    """
+    GIVEN multiple item list, value, key and expected list
+    WHEN insert_after is called with the value and key
+    THEN the linked list contains the expected values in the expected order.
+    """
+    value = "value 3"
+
+    multiple_list.insert_after(key, value)
+
+    assert list(iter(multiple_list)) == expected_list
+
+
+def test_insert_after_duplicate(duplicate_list):
+    """
+    GIVEN duplicate item list, value and key that is equal to the duplicate value
+    WHEN insert_after is called with the value and key
+    THEN new value is inserted after the first matched item.
+    """
+    value = "value 2"
+
+    duplicate_list.insert_after("value 1", value)
+
+    assert list(iter(duplicate_list)) == ["value 1", "value 2", "value 1"]
+
+
+def test_insert_before_empty(empty_list):
+    """
+    GIVEN empty list and value
+    WHEN insert_before is called with the value
+    THEN value is not added.
+    """
+    value = "value 1"
+
+    empty_list.insert_before(value, value)
+
+    assert list(iter(empty_list)) == []
+
+
+@pytest.mark.parametrize(
+    "key, expected_list",
+    [("value 2", ["value 1"]), ("value 1", ["value 2", "value 1"])],
+    ids=["value not in list", "value in list"],
+)
+def test_insert_before_single(single_list, key, expected_list):
+    """
+    GIVEN single item list, value, key and expected list
+    WHEN insert_before is called with the value and key
+    THEN the linked list contains the expected values in the expected order.
+    """
+    value = "value 2"
+
+    single_list.insert_before(key, value)
+
+    assert list(iter(single_list)) == expected_list
+
+
+@pytest.mark.parametrize(
+    "key, expected_list",
+    [
+        ("value 3", ["value 1", "value 2"]),
+        ("value 2", ["value 1", "value 3", "value 2"]),
+        ("value 1", ["value 3", "value 1", "value 2"]),
+    ],
+    ids=["value not in list", "value in list last", "value in list first"],
+)
+def test_insert_before_multiple(multiple_list, key, expected_list):
+    """
+    GIVEN multiple item list, value, key and expected list
+    WHEN insert_before is called with the value and key
+    THEN the linked list contains the expected values in the expected order.
+    """
+    value = "value 3"
+
+    multiple_list.insert_before(key, value)
+
+    assert list(iter(multiple_list)) == expected_list
+
+
+def test_insert_before_duplicate(duplicate_list):
+    """
+    GIVEN duplicate item list, value and key that is equal to the duplicate value
+    WHEN insert_before is called with the value and key
+    THEN new value is inserted before the first matched item.
+    """
+    value = "value 2"
+
+    duplicate_list.insert_before("value 1", value)
+
+    assert list(iter(duplicate_list)) == ["value 2", "value 1", "value 1"]
+
+
+def test_delete_empty(empty_list):
+    """
+    GIVEN empty list and key
+    WHEN delete is called with the key
+    THEN list stays empty.
+    """
+    key = "value 1"
+
+    empty_list.delete(key)
+
+    assert list(iter(empty_list)) == []
+
+
+@pytest.mark.parametrize(
+    "key, expected_list",
+    [("value 2", ["value 1"]), ("value 1", [])],
+    ids=["value not in list", "value in list"],
+)
+def test_delete_single(single_list, key, expected_list):
+    """
+    GIVEN single item list, key and expected list
+    WHEN delete is called with the key
+    THEN the linked list contains the expected values in the expected order.
+    """
+    single_list.delete(key)
+
+    assert list(iter(single_list)) == expected_list
+
+
+@pytest.mark.parametrize(
+    "key, expected_list",
+    [
+        ("value 3", ["value 1", "value 2"]),
+        ("value 2", ["value 1"]),
+        ("value 1", ["value 2"]),
+    ],
+    ids=["value not in list", "value in list last", "value in list first"],
+)
+def test_delete_multiple(multiple_list, key, expected_list):
+    """
+    GIVEN multiple item list, key and expected list
+    WHEN delete is called with the key
+    THEN the linked list contains the expected values in the expected order.
+    """
+    multiple_list.delete(key)
+
+    assert list(iter(multiple_list)) == expected_list
+
+
+def test_delete_duplicate(duplicate_list):
+    """
+    GIVEN duplicate item list and value that is equal to the duplicate value
+    WHEN delete is called with the value
+    THEN the first matched value is removed from the list.
+    """
+    value = "value 1"
+
+    duplicate_list.delete(value)
+
+    assert list(iter(duplicate_list)) == ["value 1"]
+
+
+def test_clone_empty(empty_list):
+    """
+    GIVEN empty list
+    WHEN clone is called
+    THEN a new empty list is returned.
+    """
+    new_list = empty_list.clone()
+
+    assert list(iter(new_list)) == list(iter(empty_list))
+    assert id(new_list) != id(empty_list)
+
+
+def test_clone_single(single_list):
+    """
+    GIVEN single list
+    WHEN clone is called
+    THEN a new single list is returned with all nodes copied.
+    """
+    new_list = single_list.clone()
+
+    assert list(iter(new_list)) == list(iter(single_list))
+    assert id(new_list) != id(single_list)
+    node = single_list.head
+    new_node = new_list.head
+    while node is not None:
+        assert id(node) != id(new_node)
+        node = node.next_
+        new_node = new_node.next_
+
+
+def test_clone_multiple(multiple_list):
+    """
+    GIVEN multiple list
+    WHEN clone is called
+    THEN a new multiple list is returned with all nodes copied.
+    """
+    new_list = multiple_list.clone()
+
+    assert list(iter(new_list)) == list(iter(multiple_list))
+    assert id(new_list) != id(multiple_list)
+    node = multiple_list.head
+    new_node = new_list.head
+    while node is not None:
+        assert id(node) != id(new_node)
+        node = node.next_
+        new_node = new_node.next_
+
+
+def test_clone_duplicate(duplicate_list):
+    """
+    GIVEN duplicate list
+    WHEN clone is called
+    THEN a new duplicate list is returned with all nodes copied.
+    """
+    new_list = duplicate_list.clone()
+
+    assert list(iter(new_list)) == list(iter(duplicate_list))
+    assert id(new_list) != id(duplicate_list)
+    node = duplicate_list.head
+    new_node = new_list.head
+    while node is not None:
+        assert id(node) != id(new_node)
+        node = node.next_
+        new_node = new_node.next_
+
+
+def test_is_empty_empty(empty_list):
+    """
+    GIVEN empty list
+    WHEN is_empty is called
+    THEN True is returned.
+    """
+    assert empty_list.is_empty() is True
+
+
+def test_is_empty_single(single_list):
+    """
+    GIVEN single item list
+    WHEN is_empty is called
+    THEN False is returned.
+    """
+    assert single_list.is_empty() is False
+
+
+def test_is_empty_multiple(multiple_list):
+    """
+    GIVEN multiple item list
+    WHEN is_empty is called
+    THEN False is returned.
+    """
+    assert multiple_list.is_empty() is False
+
+
+def test_clear_empty(empty_list):
+    """
+    GIVEN empty list
+    WHEN clear is called
+    THEN list is empty.
+    """
+    empty_list.clear()
+
+    assert empty_list.is_empty() is True
+
+
+def test_clear_single(single_list):
+    """
+    GIVEN single item list
+    WHEN clear is called
+    THEN list is empty.
+    """
+    single_list.clear()
+
+    assert single_list.is_empty() is True
+
+
+def test_clear_multiple(multiple_list):
+    """
+    GIVEN multiple item list
+    WHEN clear is called
+    THEN list is empty.
+    """
+    multiple_list.clear()
+
+    assert multiple_list.is_empty() is True
+
+
+def test_construct_tail_len():
+    """
+    GIVEN
+    WHEN linked list is constructed
+    THEN tail is None and the length is 0.
+    """
+    list_ = linked_list.LinkedList()
+
+    assert list_.tail is None
+    assert len(list_) == 0
+
+
+@pytest.mark.parametrize(
+    "operations, expected_list",
+    [
+        ([("add_first", ("value 1",))], ["value 1"]),
+        ([("add_last", ("value 1",))], ["value 1"]),
+        (
+            [("add_first", ("value 2",)), ("add_first", ("value 1",))],
+            ["value 1", "value 2"],
+        ),
+        (
+            [("add_last", ("value 1",)), ("add_last", ("value 2",))],
+            ["value 1", "value 2"],
+        ),
+        (
+            [
+                ("add_last", ("value 1",)),
+                ("insert_after", ("value 1", "value 2")),
+            ],
+            ["value 1", "value 2"],
+        ),
+        (
+            [
+                ("add_last", ("value 1",)),
+                ("add_last", ("value 3",)),
+                ("insert_after", ("value 1", "value 2")),
+            ],
+            ["value 1", "value 2", "value 3"],
+        ),
+        (
+            [
+                ("add_last", ("value 1",)),
+                ("insert_after", ("value 3", "value 2")),
+            ],
+            ["value 1"],
+        ),
+        (
+            [
+                ("add_last", ("value 2",)),
+                ("insert_before", ("value 2", "value 1")),
+            ],
+            ["value 1", "value 2"],
+        ),
+        (
+            [
+                ("add_last", ("value 1",)),
+                ("add_last", ("value 3",)),
+                ("insert_before", ("value 3", "value 2")),
+            ],
+            ["value 1", "value 2", "value 3"],
+        ),
+        (
+            [
+                ("add_last", ("value 1",)),
+                ("insert_before", ("value 3", "value 2")),
+            ],
+            ["value 1"],
+        ),
+        ([("add_last", ("value 1",)), ("delete", ("value 1",))], []),
+        (
+            [
+                ("add_last", ("value 1",)),
+                ("add_last", ("value 2",)),
+                ("delete", ("value 2",)),
+            ],
+            ["value 1"],
+        ),
+        (
+            [
+                ("add_last", ("value 1",)),
+                ("add_last", ("value 2",)),
+                ("delete", ("value 1",)),
+            ],
+            ["value 2"],
+        ),
+        (
+            [
+                ("add_last", ("value 1",)),
+                ("add_last", ("value 2",)),
+                ("add_last", ("value 3",)),
+                ("delete", ("value 2",)),
+            ],
+            ["value 1", "value 3"],
+        ),
+        ([("add_last", ("value 1",)), ("delete", ("value 2",))], ["value 1"]),
+        (
+            [
+                ("add_last", ("value 1",)),
+                ("delete", ("value 1",)),
+                ("add_last", ("value 2",)),
+            ],
+            ["value 2"],
+        ),
+        ([("add_last", ("value 1",)), ("clear", ())], []),
+        (
+            [("add_last", ("value 1",)), ("clear", ()), ("add_last", ("value 2",))],
+            ["value 2"],
+        ),
+    ],
+    ids=[
+        "add_first",
+        "add_last",
+        "add_first multiple",
+        "add_last multiple",
+        "insert_after last",
+        "insert_after middle",
+        "insert_after not found",
+        "insert_before first",
+        "insert_before middle",
+        "insert_before not found",
+        "delete only",
+        "delete last",
+        "delete first",
+        "delete middle",
+        "delete not found",
+        "delete then add_last",
+        "clear",
+        "clear then add_last",
+    ],
+)
+def test_tail_len(empty_list, operations, expected_list):
+    """
+    GIVEN empty list, operations to perform and expected list
+    WHEN the operations are performed
+    THEN the list contains the expected values, tail references the last node and
+        the length is the number of values.
+    """
+    for name, args in operations:
+        getattr(empty_list, name)(*args)
+
+    assert list(iter(empty_list)) == expected_list
+    assert len(empty_list) == len(expected_list)
+    if expected_list:
+        assert empty_list.tail.value == expected_list[-1]
+        assert empty_list.tail.next_ is None
+    else:
+        assert empty_list.tail is None
+
+
+@pytest.mark.parametrize(
+    "values",
+    [[], ["value 1"], ["value 1", "value 2"]],
+    ids=["empty", "single", "multiple"],
+)
+def test_clone_tail_len(values):
+    """
+    GIVEN list with values
+    WHEN clone is called
+    THEN the new list has a tail and length matching the values and can be appended
+        to without changing the original list.
+    """
+    list_ = linked_list.LinkedList()
+    for value in values:
+        list_.add_last(value)
+
+    new_list = list_.clone()
+
+    assert len(new_list) == len(values)
+    if values:
+        assert new_list.tail.value == values[-1]
+        assert new_list.tail is not list_.tail
+    else:
+        assert new_list.tail is None
+    new_list.add_last("value 3")
+    assert list(iter(new_list)) == values + ["value 3"]
+    assert list(iter(list_)) == values
+
+
+def test_add_last_long():
+    """
+    GIVEN empty list
+    WHEN more values are added with add_last than the recursion limit
+    THEN all values are in the list in order.
+    """
+    list_ = linked_list.LinkedList()
+    values = list(range(5000))
+
+    for value in values:
+        list_.add_last(value)
+
+    assert list(iter(list_)) == values
+    assert len(list_) == len(values)
+
+
+@pytest.fixture
+def long_list():
+    """Linked list with more values than the recursion limit."""
+    list_ = linked_list.LinkedList()
+    for value in range(5000):
+        list_.add_last(value)
+    return list_
+
+
+def test_long_traverse(long_list):
+    """
+    GIVEN list longer than the recursion limit and mock function
+    WHEN traverse is called with the mock function
+    THEN the mock function is called with all values.
+    """
+    func = mock.MagicMock()
+
+    long_list.traverse(func)
+
+    assert func.call_count == 5000
+    func.assert_called_with(4999)
+
+
+@pytest.mark.parametrize(
+    "value, expected_found", [(4999, True), (5000, False)], ids=["last", "not in list"]
+)
+def test_long_search(long_list, value, expected_found):
+    """
+    GIVEN list longer than the recursion limit, value and expected found value
+    WHEN search is called with the value
+    THEN the expected found value is returned.
+    """
+    assert long_list.search(value) == expected_found
+
+
+def test_long_insert_after_delete(long_list):
+    """
+    GIVEN list longer than the recursion limit
+    WHEN insert_after is called with the last value and delete with the new value
+    THEN the value is added to the end and then removed.
+    """
+    long_list.insert_after(4999, 5000)
+
+    assert long_list.tail.value == 5000
+    assert len(long_list) == 5001
+
+    long_list.delete(5000)
+
+    assert long_list.tail.value == 4999
+    assert len(long_list) == 5000
+
+
+@pytest.mark.parametrize(
+    "values",
+    [[], ["value 1"], ["value 1", "value 2", "value 3"]],
+    ids=["empty", "single", "multiple"],
+)
+def test_from_iterable(values):
+    """
+    GIVEN generator with values
+    WHEN from_iterable is called with the generator
+    THEN a list with the values in order is returned.
+    """
+    list_ = linked_list.LinkedList.from_iterable(value for value in values)
+
+    assert list(iter(list_)) == values
+    assert len(list_) == len(values)
+    if values:
+        assert list_.tail.value == values[-1]
+    else:
+        assert list_.tail is None
+
+
+@pytest.mark.parametrize(
+    "initial, values, expected_list",
+    [
+        ([], [], []),
+        ([], ["value 1", "value 2"], ["value 1", "value 2"]),
+        (["value 1"], [], ["value 1"]),
+        (["value 1"], ["value 2", "value 3"], ["value 1", "value 2", "value 3"]),
+    ],
+    ids=["empty-empty", "empty-multiple", "single-empty", "single-multiple"],
+)
+def test_extend(initial, values, expected_list):
+    """
+    GIVEN list with initial values, values to extend with and expected list
+    WHEN extend is called with a generator of the values
+    THEN the list has the expected values, tail and length.
+    """
+    list_ = linked_list.LinkedList.from_iterable(initial)
+
+    list_.extend(value for value in values)
+
+    assert list(iter(list_)) == expected_list
+    assert len(list_) == len(expected_list)
+    if expected_list:
+        assert list_.tail.value == expected_list[-1]
+    list_.add_last("value 4")
+    assert list(iter(list_)) == expected_list + ["value 4"]
+
+
+@pytest.mark.parametrize(
+    "initial, values, expected_list",
+    [
+        ([], [], []),
+        ([], ["value 1", "value 2"], ["value 2", "value 1"]),
+        (["value 1"], [], ["value 1"]),
+        (["value 1"], ["value 2", "value 3"], ["value 3", "value 2", "value 1"]),
+    ],
+    ids=["empty-empty", "empty-multiple", "single-empty", "single-multiple"],
+)
+def test_extend_left(initial, values, expected_list):
+    """
+    GIVEN list with initial values, values to extend with and expected list
+    WHEN extend_left is called with a generator of the values
+    THEN the list has the expected values, tail and length.
+    """
+    list_ = linked_list.LinkedList.from_iterable(initial)
+
+    list_.extend_left(value for value in values)
+
+    assert list(iter(list_)) == expected_list
+    assert len(list_) == len(expected_list)
+    if expected_list:
+        assert list_.tail.value == expected_list[-1]
+    list_.add_last("value 4")
+    assert list(iter(list_)) == expected_list + ["value 4"]
+
+
+@pytest.mark.parametrize(
+    "method, expected_list",
+    [
+        ("extend", ["value 1", "value 2", "value 1", "value 2"]),
+        ("extend_left", ["value 2", "value 1", "value 1", "value 2"]),
+    ],
+    ids=["extend", "extend_left"],
+)
+def test_extend_self(multiple_list, method, expected_list):
+    """
+    GIVEN multiple list, extend method and expected list
+    WHEN the method is called with the list itself
+    THEN the list has the expected values.
+    """
+    getattr(multiple_list, method)(multiple_list)
+
+    assert list(iter(multiple_list)) == expected_list
+    assert len(multiple_list) == 4
+
+
+@pytest.mark.parametrize(
+    "method, expected_list",
+    [
+        ("extend", ["value 1", "value 2", "value 3"]),
+        ("extend_left", ["value 3", "value 1", "value 2"]),
+    ],
+    ids=["extend", "extend_left"],
+)
+def test_extend_raises(multiple_list, method, expected_list):
+    """
+    GIVEN multiple list, extend method and expected list
+    WHEN the method is called with a generator that raises after a value
+    THEN the exception is raised and the list is consistent with the value added.
+    """
+
+    def values():
+        yield "value 3"
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        getattr(multiple_list, method)(values())
+
+    assert list(iter(multiple_list)) == expected_list
+    assert len(multiple_list) == 3
+    assert multiple_list.tail.value == expected_list[-1]
+
+
+@pytest.mark.parametrize(
+    "index, expected_list",
+    [
+        (None, ["value 3", "value 1", "value 2"]),
+        (0, ["value 1", "value 3", "value 2"]),
+        (1, ["value 1", "value 2", "value 3"]),
+    ],
+    ids=["none", "first", "last"],
+)
+def test_insert_after_node(multiple_list, index, expected_list):
+    """
+    GIVEN multiple list, index of node and expected list
+    WHEN insert_after_node is called with the node at the index
+    THEN the new node is returned and the list has the expected values.
+    """
+    nodes = [multiple_list.head, multiple_list.tail]
+    node = None if index is None else nodes[index]
+
+    new_node = multiple_list.insert_after_node(node, "value 3")
+
+    assert new_node.value == "value 3"
+    assert list(iter(multiple_list)) == expected_list
+    assert multiple_list.tail.value == expected_list[-1]
+    assert len(multiple_list) == 3
+
+
+@pytest.mark.parametrize(
+    "index, expected_value, expected_list",
+    [(None, "value 1", ["value 2"]), (0, "value 2", ["value 1"])],
+    ids=["none", "first"],
+)
+def test_delete_after_node(multiple_list, index, expected_value, expected_list):
+    """
+    GIVEN multiple list, index of node, expected value and expected list
+    WHEN delete_after_node is called with the node at the index
+    THEN the expected value is returned and the list has the expected values.
+    """
+    node = None if index is None else multiple_list.head
+
+    value = multiple_list.delete_after_node(node)
+
+    assert value == expected_value
+    assert list(iter(multiple_list)) == expected_list
+    assert multiple_list.tail.value == expected_list[-1]
+    assert len(multiple_list) == 1
+
+
+@pytest.mark.parametrize("tail", [False, True], ids=["empty", "tail"])
+def test_delete_after_node_invalid(empty_list, tail):
+    """
+    GIVEN list and whether to delete after the tail or the front of the empty list
+    WHEN delete_after_node is called
+    THEN ValueError is raised.
+    """
+    if tail:
+        empty_list.add_last("value 1")
+
+    with pytest.raises(ValueError):
+        empty_list.delete_after_node(empty_list.tail)
+
+
+def assert_sorted_list(list_, expected_list):
+    """Check the values, tail and length of the list."""
+    assert list(iter(list_)) == expected_list
+    assert len(list_) == len(expected_list)
+    if expected_list:
+        assert list_.tail.value == expected_list[-1]
+        assert list_.tail.next_ is None
+    else:
+        assert list_.head is None
+        assert list_.tail is None
+
+
+@pytest.mark.parametrize(
+    "values",
+    [[], [1], [2, 1], [3, 1, 2], [5, 1, 4, 2, 3, 1, 5], list(range(20, 0, -1))],
+    ids=["empty", "single", "two", "three", "duplicates", "reversed"],
+)
+@pytest.mark.parametrize("reverse", [False, True], ids=["ascending", "descending"])
+def test_sort(values, reverse):
+    """
+    GIVEN list with values and sort order
+    WHEN sort is called with the order
+    THEN the list is sorted and contains the same nodes.
+    """
+    list_ = linked_list.LinkedList.from_iterable(values)
+    nodes = set()
+    node = list_.head
+    while node is not None:
+        nodes.add(id(node))
+        node = node.next_
+
+    list_.sort(reverse=reverse)
+
+    assert_sorted_list(list_, sorted(values, reverse=reverse))
+    node = list_.head
+    while node is not None:
+        assert id(node) in nodes
+        node = node.next_
+
+
+@pytest.mark.parametrize("reverse", [False, True], ids=["ascending", "descending"])
+def test_sort_key_stable(reverse):
+    """
+    GIVEN list with values with equal keys and sort order
+    WHEN sort is called with the key and order
+    THEN the list is sorted by the key and equal keys are in the original order.
+    """
+    values = [(2, "a"), (1, "b"), (2, "c"), (1, "d"), (3, "e"), (1, "f")]
+    list_ = linked_list.LinkedList.from_iterable(values)
+
+    list_.sort(key=lambda value: value[0], reverse=reverse)
+
+    assert_sorted_list(
+        list_, sorted(values, key=lambda value: value[0], reverse=reverse)
+    )
+
+
+def test_sort_long():
+    """
+    GIVEN list longer than the recursion limit with random values
+    WHEN sort is called
+    THEN the list is sorted.
+    """
+    generator = random.Random(0)
+    values = [generator.randrange(1000) for _ in range(5000)]
+    list_ = linked_list.LinkedList.from_iterable(values)
+
+    list_.sort()
+
+    assert_sorted_list(list_, sorted(values))
+
+
+@pytest.mark.parametrize(
+    "values, other_values, expected_list",
+    [
+        ([], [], []),
+        ([1, 3], [], [1, 3]),
+        ([], [1, 3], [1, 3]),
+        ([1, 3, 5], [2, 4], [1, 2, 3, 4, 5]),
+        ([4, 5], [1, 2], [1, 2, 4, 5]),
+        ([1, 2], [4, 5], [1, 2, 4, 5]),
+    ],
+    ids=["empty", "other empty", "list empty", "interleaved", "other first", "last"],
+)
+def test_merge(values, other_values, expected_list):
+    """
+    GIVEN sorted list, other sorted list and expected list
+    WHEN merge is called with the other list
+    THEN the list has the expected values and the other list is empty.
+    """
+    list_ = linked_list.LinkedList.from_iterable(values)
+    other = linked_list.LinkedList.from_iterable(other_values)
+
+    list_.merge(other)
+
+    assert_sorted_list(list_, expected_list)
+    assert_sorted_list(other, [])
+
+
+def test_merge_key_reverse_stable():
+    """
+    GIVEN lists sorted in descending order by a key with equal keys
+    WHEN merge is called with the key and reverse
+    THEN the values are merged in descending order with equal keys of the list first.
+    """
+    list_ = linked_list.LinkedList.from_iterable([(3, "a"), (2, "b"), (1, "c")])
+    other = linked_list.LinkedList.from_iterable([(2, "d"), (1, "e")])
+
+    list_.merge(other, key=lambda value: value[0], reverse=True)
+
+    assert_sorted_list(list_, [(3, "a"), (2, "b"), (2, "d"), (1, "c"), (1, "e")])
+
+
+def test_merge_self(multiple_list):
+    """
+    GIVEN list
+    WHEN merge is called with the list itself
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        multiple_list.merge(multiple_list)
+
+
+def _raising_key(value):
+    """Key that raises ZeroDivisionError for 0."""
+    return 1 / value
+
+
+@pytest.mark.parametrize(
+    "values, key, expected_error",
+    [
+        ([5, 4, 3, 2, "a", 1, 0], None, TypeError),
+        ([5, 4, 3, 2, 0, 1, 6], _raising_key, ZeroDivisionError),
+    ],
+    ids=["incomparable", "key raises"],
+)
+@pytest.mark.parametrize("indexed", [False, True], ids=["plain", "indexed"])
+def test_sort_raises(values, key, expected_error, indexed):
+    """
+    GIVEN list with a value that cannot be compared or key raises for
+    WHEN sort is called
+    THEN the error is raised and the list still has all the values.
+    """
+    list_ = linked_list.LinkedList.from_iterable(values, indexed=indexed)
+
+    with pytest.raises(expected_error):
+        list_.sort(key=key)
+
+    assert sorted(map(str, list_)) == sorted(map(str, values))
+    assert_sorted_list(list_, list(list_))
+    if indexed:
+        assert_index(list_)
+
+
+@pytest.mark.parametrize(
+    "values, other_values, key, expected_error",
+    [
+        ([1, 3, 5], [2, "x", 6], None, TypeError),
+        ([1, 3, 5], [2, 0, 6], _raising_key, ZeroDivisionError),
+        ([0, 3], [1, 2], _raising_key, ZeroDivisionError),
+    ],
+    ids=["incomparable", "key raises", "first comparison"],
+)
+@pytest.mark.parametrize("indexed", [False, True], ids=["plain", "indexed"])
+def test_merge_raises(values, other_values, key, expected_error, indexed):
+    """
+    GIVEN sorted lists where a value cannot be compared or key raises for
+    WHEN merge is called
+    THEN the error is raised, the list has all the values and the other list is
+        empty.
+    """
+    list_ = linked_list.LinkedList.from_iterable(values, indexed=indexed)
+    other = linked_list.LinkedList.from_iterable(other_values, indexed=indexed)
+
+    with pytest.raises(expected_error):
+        list_.merge(other, key=key)
+
+    assert sorted(map(str, list_)) == sorted(map(str, values + other_values))
+    assert_sorted_list(list_, list(list_))
+    assert_sorted_list(other, [])
+    if indexed:
+        assert_index(list_)
+        assert_index(other)
+
+
+def assert_index(list_):
+    """Check that the index of an indexed list matches its nodes."""
+    expected_index = {}
+    expected_previous = {}
+    previous = None
+    node = list_.head
+    while node is not None:
+        expected_index.setdefault(node.value, []).append(node)
+        expected_previous[node] = previous
+        previous = node
+        node = node.next_
+
+    index = {}
+    # pylint: disable=protected-access
+    for value, nodes in list_._index.items():
+        if isinstance(nodes, linked_list.Node):
+            index[value] = {id(nodes)}
+        else:
+            # Only values that are in the list more than once map to several nodes
+            assert len(nodes) > 1
+            index[value] = {id(node) for node in nodes}
+    assert index == {
+        value: {id(node) for node in nodes} for value, nodes in expected_index.items()
+    }
+    assert list_._previous == expected_previous
+    assert len(list_) == len(expected_previous)
+    assert list_.tail is previous
+
+
+def test_indexed_construct():
+    """
+    GIVEN
+    WHEN lists are constructed with and without an index
+    THEN indexed is set accordingly.
+    """
+    assert linked_list.LinkedList().indexed is False
+    assert linked_list.LinkedList(indexed=True).indexed is True
+    assert linked_list.LinkedList.from_iterable([], indexed=True).indexed is True
+
+
+def test_indexed_unhashable():
+    """
+    GIVEN indexed list
+    WHEN an unhashable value is added
+    THEN TypeError is raised and the list is unchanged.
+    """
+    list_ = linked_list.LinkedList.from_iterable(["value 1"], indexed=True)
+
+    with pytest.raises(TypeError):
+        list_.add_last(["value 2"])
+
+    assert list(iter(list_)) == ["value 1"]
+    assert_index(list_)
+
+
+@pytest.mark.parametrize("indexed", [False, True], ids=["not indexed", "indexed"])
+def test_unhashable_key(indexed):
+    """
+    GIVEN list
+    WHEN operations are called with an unhashable key
+    THEN the list is unchanged and search returns False.
+    """
+    list_ = linked_list.LinkedList.from_iterable(["value 1"], indexed)
+
+    list_.insert_after(["value 1"], "new")
+    list_.insert_before(["value 1"], "new")
+    list_.delete(["value 1"])
+
+    assert list_.search(["value 1"]) is False
+    assert_sorted_list(list_, ["value 1"])
+    if indexed:
+        assert_index(list_)
+
+
+@pytest.mark.parametrize(
+    "operation, args, expected_list",
+    [
+        ("search", ("value 1",), ["value 1", "value 2", "value 1"]),
+        ("insert_after", ("value 1", "new"), ["value 1", "new", "value 2", "value 1"]),
+        ("insert_before", ("value 1", "new"), ["new", "value 1", "value 2", "value 1"]),
+        ("delete", ("value 1",), ["value 2", "value 1"]),
+    ],
+    ids=["search", "insert_after", "insert_before", "delete"],
+)
+def test_indexed_duplicates(operation, args, expected_list):
+    """
+    GIVEN indexed list with a duplicate value added before the first occurrence was
+        indexed, operation and expected list
+    WHEN the operation is called with the duplicate value as key
+    THEN the first occurrence in the list is used.
+    """
+    list_ = linked_list.LinkedList.from_iterable(["value 2", "value 1"], indexed=True)
+    list_.add_first("value 1")
+
+    result = getattr(list_, operation)(*args)
+
+    assert list(iter(list_)) == expected_list
+    if operation == "search":
+        assert result is True
+    assert_index(list_)
+
+
+@pytest.mark.parametrize("indexed", [False, True], ids=["not indexed", "indexed"])
+def test_indexed_duplicates_delete(indexed):
+    """
+    GIVEN list with a value that is in the list several times
+    WHEN the value is deleted repeatedly
+    THEN the first occurrence is deleted each time and the index is kept up to date.
+    """
+    list_ = linked_list.LinkedList.from_iterable([1, 0, 1, 2, 1], indexed)
+
+    expected_lists = [[0, 1, 2, 1], [0, 2, 1], [0, 2]]
+    for expected_list in expected_lists:
+        list_.delete(1)
+
+        assert_sorted_list(list_, expected_list)
+        if indexed:
+            assert_index(list_)
+
+
+@pytest.mark.parametrize("indexed", [False, True], ids=["not indexed", "indexed"])
+def test_indexed_many_duplicates(indexed):
+    """
+    GIVEN list where most values are the same
+    WHEN the value is searched for, a value is inserted before it and it is removed
+    THEN the first occurrence is used and all occurrences are removed.
+    """
+    list_ = linked_list.LinkedList.from_iterable([2] + [0] * 1000 + [1], indexed)
+
+    assert list_.search(0) is True
+    list_.insert_before(0, 3)
+    count = list_.remove_all(0)
+
+    assert count == 1000
+    assert_sorted_list(list_, [2, 3, 1])
+    if indexed:
+        assert_index(list_)
+
+
+def test_indexed_not_found():
+    """
+    GIVEN indexed list
+    WHEN operations are called with a key that is not in the list
+    THEN the list is unchanged and search returns False.
+    """
+    list_ = linked_list.LinkedList.from_iterable(["value 1"], indexed=True)
+
+    list_.insert_after("value 2", "new")
+    list_.insert_before("value 2", "new")
+    list_.delete("value 2")
+
+    assert list_.search("value 2") is False
+    assert list(iter(list_)) == ["value 1"]
+    assert_index(list_)
+
+
+def test_indexed_clone_clear():
+    """
+    GIVEN indexed list
+    WHEN clone and clear are called
+    THEN the clone is indexed and both indexes match their lists.
+    """
+    list_ = linked_list.LinkedList.from_iterable(["value 1", "value 2"], indexed=True)
+
+    new_list = list_.clone()
+    list_.clear()
+
+    assert new_list.indexed is True
+    assert_index(new_list)
+    assert_index(list_)
+    assert list_.search("value 1") is False
+
+
+def test_indexed_random_operations():
+    """
+    GIVEN random operations
+    WHEN the operations are performed on an indexed list and a list without index
+    THEN the lists have the same values and the index matches the nodes.
+    """
+    generator = random.Random(0)
+    list_ = linked_list.LinkedList(indexed=True)
+    expected_list = linked_list.LinkedList()
+
+    for value in range(400):
+        operation = generator.choice(
+            [
+                "add_first",
+                "add_last",
+                "insert_after",
+                "insert_before",
+                "delete",
+                "search",
+                "extend",
+                "extend_left",
+                "cursor",
+                "sort",
+                "merge",
+            ]
+        )
+        key = generator.randrange(value + 1) // 2
+        if operation in ("add_first", "add_last"):
+            args = (key,)
+        elif operation in ("delete", "search"):
+            args = (key,)
+        elif operation in ("extend", "extend_left"):
+            args = ([key, value],)
+        elif operation == "cursor":
+            for target in (list_, expected_list):
+                list_cursor = target.cursor()
+                list_cursor.seek(len(target) // 2)
+                list_cursor.insert_before(key)
+                if not list_cursor.at_end():
+                    list_cursor.delete()
+            assert_index(list_)
+            continue
+        elif operation == "sort":
+            args = ()
+        elif operation == "merge":
+            for target in (list_, expected_list):
+                target.sort()
+                target.merge(linked_list.LinkedList.from_iterable([key, value]))
+            assert_index(list_)
+            continue
+        else:
+            args = (key, value)
+        result = getattr(list_, operation)(*args)
+        expected_result = getattr(expected_list, operation)(*args)
+
+        assert result == expected_result
+        assert list(iter(list_)) == list(iter(expected_list))
+        assert_index(list_)
+
+
+@pytest.mark.parametrize(
+    "value, expected_list",
+    [("value 1", ["value 2", "value 3"]), ("value 3", ["value 1", "value 2"])],
+    ids=["first", "last"],
+)
+def test_indexed_delete(value, expected_list):
+    """
+    GIVEN indexed list, value and expected list
+    WHEN delete is called with the value
+    THEN the list has the expected values and the index matches the nodes.
+    """
+    list_ = linked_list.LinkedList.from_iterable(
+        ["value 1", "value 2", "value 3"], indexed=True
+    )
+
+    list_.delete(value)
+
+    assert list(iter(list_)) == expected_list
+    assert_index(list_)
+
+
+@pytest.mark.parametrize("indexed", [False, True], ids=["not indexed", "indexed"])
+@pytest.mark.parametrize(
+    "values, expected_count, expected_list",
+    [
+        ([], 0, []),
+        ([1, 3, 5], 0, [1, 3, 5]),
+        ([2, 4], 2, []),
+        ([2, 1, 4, 3, 6], 3, [1, 3]),
+        ([1, 2, 3, 4], 2, [1, 3]),
+    ],
+    ids=["empty", "none", "all", "first", "last"],
+)
+def test_remove_if(indexed, values, expected_count, expected_list):
+    """
+    GIVEN list with values, expected count and expected list
+    WHEN remove_if is called with a predicate matching even values
+    THEN the expected count is returned and the list has the expected values.
+    """
+    list_ = linked_list.LinkedList.from_iterable(values, indexed)
+
+    count = list_.remove_if(lambda value: value % 2 == 0)
+
+    assert count == expected_count
+    assert_sorted_list(list_, expected_list)
+    if indexed:
+        assert_index(list_)
+
+
+def test_remove_if_long():
+    """
+    GIVEN list longer than the recursion limit
+    WHEN remove_if is called with a predicate that matches most values
+    THEN the matched values are removed.
+    """
+    list_ = linked_list.LinkedList.from_iterable(range(5000))
+
+    count = list_.remove_if(lambda value: value % 1000)
+
+    assert count == 4995
+    assert_sorted_list(list_, [0, 1000, 2000, 3000, 4000])
+
+
+def test_remove_all(duplicate_list):
+    """
+    GIVEN list with duplicate values
+    WHEN remove_all is called with the duplicated value
+    THEN all occurrences are removed and the count is returned.
+    """
+    duplicate_list.add_last("value 2")
+
+    count = duplicate_list.remove_all("value 1")
+
+    assert count == 2
+    assert_sorted_list(duplicate_list, ["value 2"])
+
+
+def test_retain_if():
+    """
+    GIVEN list with values
+    WHEN retain_if is called with a predicate matching even values
+    THEN the odd values are removed and their count is returned.
+    """
+    list_ = linked_list.LinkedList.from_iterable([1, 2, 3, 4, 5])
+
+    count = list_.retain_if(lambda value: value % 2 == 0)
+
+    assert count == 3
+    assert_sorted_list(list_, [2, 4])
+
+
+def test_remove_if_raises():
+    """
+    GIVEN list with values and predicate that raises for a value
+    WHEN remove_if is called with the predicate
+    THEN the exception is raised and the values before it have been removed.
+    """
+    list_ = linked_list.LinkedList.from_iterable([1, 2, None, 4])
+
+    with pytest.raises(TypeError):
+        list_.remove_if(lambda value: value % 2 == 0)
+
+    assert_sorted_list(list_, [1, None, 4])
+
+
+def test_organize_invalid():
+    """
+    GIVEN unknown self organizing mode
+    WHEN list is constructed with the mode
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        linked_list.LinkedList(organize="unknown")
+
+
+@pytest.mark.parametrize("indexed", [False, True], ids=["not indexed", "indexed"])
+@pytest.mark.parametrize(
+    "organize, value, expected_found, expected_list",
+    [
+        (None, 3, True, [1, 2, 3, 4]),
+        (linked_list.MOVE_TO_FRONT, 1, True, [1, 2, 3, 4]),
+        (linked_list.MOVE_TO_FRONT, 2, True, [2, 1, 3, 4]),
+        (linked_list.MOVE_TO_FRONT, 4, True, [4, 1, 2, 3]),
+        (linked_list.MOVE_TO_FRONT, 5, False, [1, 2, 3, 4]),
+        (linked_list.TRANSPOSE, 1, True, [1, 2, 3, 4]),
+        (linked_list.TRANSPOSE, 2, True, [2, 1, 3, 4]),
+        (linked_list.TRANSPOSE, 3, True, [1, 3, 2, 4]),
+        (linked_list.TRANSPOSE, 4, True, [1, 2, 4, 3]),
+        (linked_list.TRANSPOSE, 5, False, [1, 2, 3, 4]),
+    ],
+    ids=[
+        "static",
+        "move to front head",
+        "move to front second",
+        "move to front tail",
+        "move to front not found",
+        "transpose head",
+        "transpose second",
+        "transpose middle",
+        "transpose tail",
+        "transpose not found",
+    ],
+)
+def test_organize_search(indexed, organize, value, expected_found, expected_list):
+    """
+    GIVEN list with values, self organizing mode, value, expected found value and
+        expected list
+    WHEN search is called with the value
+    THEN the expected found value is returned and the list has the expected values.
+    """
+    list_ = linked_list.LinkedList.from_iterable([1, 2, 3, 4], indexed, organize)
+    nodes = {}
+    node = list_.head
+    while node is not None:
+        nodes[node.value] = node
+        node = node.next_
+
+    found = list_.search(value)
+
+    assert found is expected_found
+    assert_sorted_list(list_, expected_list)
+    if indexed:
+        assert_index(list_)
+    node = list_.head
+    while node is not None:
+        assert node is nodes[node.value]
+        node = node.next_
+
+
+@pytest.mark.parametrize("organize", [linked_list.MOVE_TO_FRONT, linked_list.TRANSPOSE])
+def test_organize_repeated(organize):
+    """
+    GIVEN self organizing list and value at the end
+    WHEN search is called repeatedly with the value
+    THEN the value ends up at the front.
+    """
+    list_ = linked_list.LinkedList.from_iterable(range(5), organize=organize)
+
+    for _ in range(4):
+        list_.search(4)
+
+    assert_sorted_list(list_, [4, 0, 1, 2, 3])
+
+
+def test_organize_clone():
+    """
+    GIVEN self organizing list
+    WHEN clone is called
+    THEN the new list has the same mode.
+    """
+    list_ = linked_list.LinkedList(organize=linked_list.TRANSPOSE)
+
+    assert list_.clone().organize == linked_list.TRANSPOSE
+
+
+def node_ids(*lists):
+    """Get the ids of the nodes of lists."""
+    ids = set()
+    for list_ in lists:
+        node = list_.head
+        while node is not None:
+            ids.add(id(node))
+            node = node.next_
+    return ids
+
+
+@pytest.mark.parametrize("indexed", [False, True], ids=["not indexed", "indexed"])
+@pytest.mark.parametrize(
+    "values, other_values, expected_list",
+    [
+        ([], [], []),
+        ([1, 2], [], [1, 2]),
+        ([], [1, 2], [1, 2]),
+        ([1, 2], [3, 1], [1, 2, 3, 1]),
+    ],
+    ids=["empty", "other empty", "list empty", "multiple"],
+)
+def test_concat(indexed, values, other_values, expected_list):
+    """
+    GIVEN list, other list and expected list
+    WHEN concat is called with the other list
+    THEN the list has the expected values with the same nodes and the other list is
+        empty.
+    """
+    list_ = linked_list.LinkedList.from_iterable(values, indexed)
+    other = linked_list.LinkedList.from_iterable(other_values, indexed)
+    nodes = node_ids(list_, other)
+
+    list_.concat(other)
+
+    assert_sorted_list(list_, expected_list)
+    assert_sorted_list(other, [])
+    assert node_ids(list_) == nodes
+    if indexed:
+        assert_index(list_)
+        assert_index(other)
+
+
+def test_concat_indexed_other_not_indexed():
+    """
+    GIVEN indexed list and list that is not indexed
+    WHEN concat is called with the list that is not indexed
+    THEN the values of the other list are indexed.
+    """
+    list_ = linked_list.LinkedList.from_iterable([1, 2], indexed=True)
+    other = linked_list.LinkedList.from_iterable([3, 4])
+
+    list_.concat(other)
+
+    assert_index(list_)
+    list_.delete(3)
+    assert_sorted_list(list_, [1, 2, 4])
+
+
+def test_concat_self(multiple_list):
+    """
+    GIVEN list
+    WHEN concat is called with the list itself
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        multiple_list.concat(multiple_list)
+
+
+@pytest.mark.parametrize("indexed", [False, True], ids=["not indexed", "indexed"])
+@pytest.mark.parametrize(
+    "values, index, expected_list, expected_rest",
+    [
+        ([], 0, [], []),
+        ([1, 2, 3], 0, [], [1, 2, 3]),
+        ([1, 2, 3], 1, [1], [2, 3]),
+        ([1, 2, 3], 2, [1, 2], [3]),
+        ([1, 2, 3], 3, [1, 2, 3], []),
+    ],
+    ids=["empty", "start", "first", "middle", "end"],
+)
+def test_split_at(indexed, values, index, expected_list, expected_rest):
+    """
+    GIVEN list, index and expected lists
+    WHEN split_at is called with the index
+    THEN the list and the returned list have the expected values with the same nodes.
+    """
+    list_ = linked_list.LinkedList.from_iterable(
+        values, indexed, linked_list.MOVE_TO_FRONT
+    )
+    nodes = node_ids(list_)
+
+    rest = list_.split_at(index)
+
+    assert_sorted_list(list_, expected_list)
+    assert_sorted_list(rest, expected_rest)
+    assert node_ids(list_, rest) == nodes
+    assert rest.indexed is indexed
+    assert rest.organize == linked_list.MOVE_TO_FRONT
+    if indexed:
+        assert_index(list_)
+        assert_index(rest)
+
+
+@pytest.mark.parametrize("index", [-1, 4], ids=["negative", "past end"])
+def test_split_at_out_of_range(multiple_list, index):
+    """
+    GIVEN list and index out of range
+    WHEN split_at is called with the index
+    THEN IndexError is raised.
+    """
+    with pytest.raises(IndexError):
+        multiple_list.split_at(index)
+
+
+@pytest.mark.parametrize("indexed", [False, True], ids=["not indexed", "indexed"])
+@pytest.mark.parametrize(
+    "values", [[], [1], [1, 2], [1, 2, 3, 1]], ids=["empty", "single", "two", "four"]
+)
+def test_reverse(indexed, values):
+    """
+    GIVEN list with values
+    WHEN reverse is called
+    THEN the list has the values in reverse order with the same nodes.
+    """
+    list_ = linked_list.LinkedList.from_iterable(values, indexed)
+    nodes = node_ids(list_)
+
+    list_.reverse()
+
+    assert_sorted_list(list_, values[::-1])
+    assert node_ids(list_) == nodes
+    if indexed:
+        assert_index(list_)
+
+
+def test_reverse_long():
+    """
+    GIVEN list longer than the recursion limit
+    WHEN reverse is called
+    THEN the list is reversed.
+    """
+    list_ = linked_list.LinkedList.from_iterable(range(5000))
+
+    list_.reverse()
+
+    assert_sorted_list(list_, list(range(4999, -1, -1)))
+
+
+@pytest.mark.parametrize("indexed", [False, True], ids=["not indexed", "indexed"])
+@pytest.mark.parametrize(
+    "values, steps, expected_list",
+    [
+        ([], 1, []),
+        ([1], 1, [1]),
+        ([1, 2, 3], 0, [1, 2, 3]),
+        ([1, 2, 3], 1, [3, 1, 2]),
+        ([1, 2, 3], 2, [2, 3, 1]),
+        ([1, 2, 3], 3, [1, 2, 3]),
+        ([1, 2, 3], 4, [3, 1, 2]),
+        ([1, 2, 3], -1, [2, 3, 1]),
+    ],
+    ids=["empty", "single", "zero", "one", "two", "full", "wrap", "left"],
+)
+def test_rotate(indexed, values, steps, expected_list):
+    """
+    GIVEN list with values, steps and expected list
+    WHEN rotate is called with the steps
+    THEN the list has the expected values with the same nodes.
+    """
+    list_ = linked_list.LinkedList.from_iterable(values, indexed)
+    nodes = node_ids(list_)
+
+    list_.rotate(steps)
+
+    assert_sorted_list(list_, expected_list)
+    assert node_ids(list_) == nodes
+    if indexed:
+        assert_index(list_)
+
+
+@pytest.mark.parametrize("indexed", [False, True], ids=["not indexed", "indexed"])
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda list_: list_.add_first(0),
+        lambda list_: list_.add_last(4),
+        lambda list_: list_.delete(2),
+        lambda list_: list_.extend([4]),
+        lambda list_: list_.extend_left([0]),
+        lambda list_: list_.search(3),
+        lambda list_: list_.sort(),
+        lambda list_: list_.merge(linked_list.LinkedList()),
+        lambda list_: list_.concat(linked_list.LinkedList.from_iterable([4])),
+        lambda list_: list_.split_at(1),
+        lambda list_: list_.reverse(),
+        lambda list_: list_.rotate(),
+        lambda list_: list_.clear(),
+    ],
+    ids=[
+        "add_first",
+        "add_last",
+        "delete",
+        "extend",
+        "extend_left",
+        "search",
+        "sort",
+        "merge",
+        "concat",
+        "split_at",
+        "reverse",
+        "rotate",
+        "clear",
+    ],
+)
+def test_version_changed(indexed, change):
+    """
+    GIVEN list
+    WHEN an operation that changes the nodes is called
+    THEN the version changes.
+    """
+    list_ = linked_list.LinkedList.from_iterable(
+        [1, 2, 3], indexed, linked_list.MOVE_TO_FRONT
+    )
+    version = list_.version
+
+    change(list_)
+
+    assert list_.version != version
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda list_: list_.search(1),
+        lambda list_: list_.search(4),
+        lambda list_: list_.concat(linked_list.LinkedList()),
+        lambda list_: list_.rotate(3),
+        lambda list_: list(list_),
+    ],
+    ids=["search front", "search not found", "concat empty", "rotate full", "iter"],
+)
+def test_version_unchanged(operation):
+    """
+    GIVEN list
+    WHEN an operation that does not change the nodes is called
+    THEN the version does not change.
+    """
+    list_ = linked_list.LinkedList.from_iterable(
+        [1, 2, 3], organize=linked_list.MOVE_TO_FRONT
+    )
+    version = list_.version
+
+    operation(list_)
+
+    assert list_.version == version
@@ -0,0 +1,316 @@
+"""Tests for array backed linked list."""
+# pylint: disable=protected-access
+
+import array
+import random
+from unittest import mock
+
+import pytest
+
+from library import linked_list
+from library.linked_list import array_backed
+
+TYPECODES = pytest.mark.parametrize("typecode", [None, "q"], ids=["list", "array"])
+
+
+def assert_values(list_, expected_values):
+    """Check the values, length and free slots of the list."""
+    assert list(iter(list_)) == expected_values
+    assert len(list_) == len(expected_values)
+    assert list_.is_empty() is (not expected_values)
+
+    # Every slot is either in the list or free
+    free_count = 0
+    index = list_._free
+    while index != array_backed._NONE:
+        free_count += 1
+        index = list_._next[index]
+    assert free_count + len(expected_values) == len(list_._next)
+    assert len(list_._values) == len(list_._next)
+    if expected_values:
+        assert list_._values[list_._tail] == expected_values[-1]
+    else:
+        assert list_._tail == array_backed._NONE
+
+
+def test_export():
+    """
+    GIVEN linked list package
+    WHEN ArrayLinkedList is accessed
+    THEN it is the array backed linked list.
+    """
+    assert linked_list.ArrayLinkedList is array_backed.ArrayLinkedList
+
+
+@pytest.mark.parametrize(
+    "typecode, expected_type", [(None, list), ("q", array.array)], ids=["list", "array"]
+)
+def test_construct(typecode, expected_type):
+    """
+    GIVEN typecode and expected type of the values buffer
+    WHEN the list is constructed with the typecode
+    THEN the list is empty and the values are stored in the expected type.
+    """
+    list_ = array_backed.ArrayLinkedList(typecode)
+
+    assert_values(list_, [])
+    assert isinstance(list_._values, expected_type)
+
+
+@TYPECODES
+def test_add(typecode):
+    """
+    GIVEN typecode
+    WHEN values are added with add_first and add_last
+    THEN the list has the values in the expected order.
+    """
+    list_ = array_backed.ArrayLinkedList(typecode)
+
+    list_.add_last(2)
+    list_.add_first(1)
+    list_.add_last(3)
+
+    assert_values(list_, [1, 2, 3])
+
+
+@TYPECODES
+@pytest.mark.parametrize(
+    "method, initial, expected_values",
+    [
+        ("extend", [], [1, 2]),
+        ("extend", [0], [0, 1, 2]),
+        ("extend_left", [], [2, 1]),
+        ("extend_left", [0], [2, 1, 0]),
+    ],
+    ids=["extend empty", "extend", "extend_left empty", "extend_left"],
+)
+def test_extend(typecode, method, initial, expected_values):
+    """
+    GIVEN typecode, extend method, initial values and expected values
+    WHEN the method is called with a generator of values
+    THEN the list has the expected values.
+    """
+    list_ = array_backed.ArrayLinkedList.from_iterable(initial, typecode)
+
+    getattr(list_, method)(value for value in [1, 2])
+
+    assert_values(list_, expected_values)
+
+
+@pytest.mark.parametrize(
+    "method, expected_values",
+    [("extend", [1, 2, 1, 2]), ("extend_left", [2, 1, 1, 2])],
+    ids=["extend", "extend_left"],
+)
+def test_extend_self(method, expected_values):
+    """
+    GIVEN list, extend method and expected values
+    WHEN the method is called with the list itself
+    THEN the list has the expected values.
+    """
+    list_ = array_backed.ArrayLinkedList.from_iterable([1, 2])
+
+    getattr(list_, method)(list_)
+
+    assert_values(list_, expected_values)
+
+
+@TYPECODES
+@pytest.mark.parametrize(
+    "key, expected_values",
+    [(4, [1, 2, 3]), (1, [1, 9, 2, 3]), (3, [1, 2, 3, 9])],
+    ids=["not in list", "first", "last"],
+)
+def test_insert_after(typecode, key, expected_values):
+    """
+    GIVEN typecode, key and expected values
+    WHEN insert_after is called with the key
+    THEN the list has the expected values.
+    """
+    list_ = array_backed.ArrayLinkedList.from_iterable([1, 2, 3], typecode)
+
+    list_.insert_after(key, 9)
+
+    assert_values(list_, expected_values)
+
+
+@TYPECODES
+@pytest.mark.parametrize(
+    "key, expected_values",
+    [(4, [1, 2, 3]), (1, [9, 1, 2, 3]), (3, [1, 2, 9, 3])],
+    ids=["not in list", "first", "last"],
+)
+def test_insert_before(typecode, key, expected_values):
+    """
+    GIVEN typecode, key and expected values
+    WHEN insert_before is called with the key
+    THEN the list has the expected values.
+    """
+    list_ = array_backed.ArrayLinkedList.from_iterable([1, 2, 3], typecode)
+
+    list_.insert_before(key, 9)
+
+    assert_values(list_, expected_values)
+
+
+@TYPECODES
+@pytest.mark.parametrize(
+    "value, expected_values",
+    [(4, [1, 2, 3]), (1, [2, 3]), (2, [1, 3]), (3, [1, 2])],
+    ids=["not in list", "first", "middle", "last"],
+)
+def test_delete(typecode, value, expected_values):
+    """
+    GIVEN typecode, value and expected values
+    WHEN delete is called with the value
+    THEN the list has the expected values.
+    """
+    list_ = array_backed.ArrayLinkedList.from_iterable([1, 2, 3], typecode)
+
+    list_.delete(value)
+
+    assert_values(list_, expected_values)
+
+
+def test_delete_releases_value():
+    """
+    GIVEN list with an object
+    WHEN the object is deleted
+    THEN the list no longer references the object.
+    """
+    value = object()
+    list_ = array_backed.ArrayLinkedList.from_iterable([value])
+
+    list_.delete(value)
+
+    assert value not in list_._values
+
+
+@TYPECODES
+def test_free_slots_reused(typecode):
+    """
+    GIVEN list with values of which some are deleted
+    WHEN new values are added
+    THEN the slots of the deleted values are reused.
+    """
+    list_ = array_backed.ArrayLinkedList.from_iterable([1, 2, 3, 4], typecode)
+    list_.delete(2)
+    list_.delete(4)
+
+    list_.add_first(5)
+    list_.add_last(6)
+
+    assert_values(list_, [5, 1, 3, 6])
+    assert len(list_._next) == 4
+
+
+@pytest.mark.parametrize(
+    "value, expected_error",
+    [("x", TypeError), (2**70, OverflowError)],
+    ids=["wrong type", "too large"],
+)
+@pytest.mark.parametrize("deleted", [[], [2]], ids=["no free slot", "free slot"])
+def test_add_rejected_value(value, expected_error, deleted):
+    """
+    GIVEN typed list with and without a free slot and a value the array rejects
+    WHEN the value is added
+    THEN the error is raised and the list is unchanged.
+    """
+    list_ = array_backed.ArrayLinkedList.from_iterable([1, 2, 3], "q")
+    for deleted_value in deleted:
+        list_.delete(deleted_value)
+    expected_values = list(list_)
+    free = list_._free
+
+    with pytest.raises(expected_error):
+        list_.add_last(value)
+
+    assert_values(list_, expected_values)
+    assert list_._free == free
+    assert len(list_._values) == len(list_._next) == 3
+
+    list_.add_last(4)
+
+    assert_values(list_, expected_values + [4])
+    assert len(list_._next) == 3 + (not deleted)
+
+
+@TYPECODES
+def test_traverse_search(typecode):
+    """
+    GIVEN typecode and list with values
+    WHEN traverse and search are called
+    THEN traverse calls the function with each value and search finds the values.
+    """
+    list_ = array_backed.ArrayLinkedList.from_iterable([1, 2], typecode)
+    func = mock.MagicMock()
+
+    list_.traverse(func)
+
+    assert [call.args[0] for call in func.call_args_list] == [1, 2]
+    assert list_.search(2) is True
+    assert list_.search(3) is False
+
+
+@TYPECODES
+def test_clone(typecode):
+    """
+    GIVEN typecode and list with values and a free slot
+    WHEN clone is called
+    THEN a compact list with the same values and typecode is returned.
+    """
+    list_ = array_backed.ArrayLinkedList.from_iterable([1, 2, 3], typecode)
+    list_.delete(2)
+
+    new_list = list_.clone()
+
+    assert_values(new_list, [1, 3])
+    assert new_list.typecode == typecode
+    assert len(new_list._next) == 2
+    new_list.add_last(4)
+    assert_values(list_, [1, 3])
+
+
+@TYPECODES
+def test_clear(typecode):
+    """
+    GIVEN typecode and list with values and a free slot
+    WHEN clear is called
+    THEN the list is empty and the buffers are released.
+    """
+    list_ = array_backed.ArrayLinkedList.from_iterable([1, 2, 3], typecode)
+    list_.delete(2)
+
+    list_.clear()
+
+    assert_values(list_, [])
+    assert len(list_._next) == 0
+    list_.add_last(1)
+    assert_values(list_, [1])
+
+
+@TYPECODES
+def test_random_operations(typecode):
+    """
+    GIVEN typecode and random operations
+    WHEN the operations are performed on an array backed list and a linked list
+    THEN the lists have the same values.
+    """
+    generator = random.Random(0)
+    list_ = array_backed.ArrayLinkedList(typecode)
+    expected_list = linked_list.LinkedList()
+
+    for value in range(300):
+        operation = generator.choice(
+            ["add_first", "add_last", "insert_after", "insert_before", "delete"]
+        )
+        if operation in ("add_first", "add_last"):
+            args = (value,)
+        elif operation == "delete":
+            args = (generator.randrange(value + 1),)
+        else:
+            args = (generator.randrange(value + 1), value)
+        getattr(list_, operation)(*args)
+        getattr(expected_list, operation)(*args)
+
+        assert_values(list_, list(iter(expected_list)))
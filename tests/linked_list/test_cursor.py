@@ -0,0 +1,314 @@
+"""Tests for the linked list cursor."""
+# pylint: disable=redefined-outer-name
+
+import pytest
+
+from library import linked_list
+from library.linked_list import cursor
+
+
+def assert_values(list_, expected_values):
+    """Check the values, length and tail of the list."""
+    assert list(iter(list_)) == expected_values
+    assert len(list_) == len(expected_values)
+    if expected_values:
+        assert list_.tail.value == expected_values[-1]
+        assert list_.tail.next_ is None
+    else:
+        assert list_.tail is None
+
+
+@pytest.fixture
+def multiple_list():
+    """Linked list with multiple values."""
+    return linked_list.LinkedList.from_iterable(["value 1", "value 2", "value 3"])
+
+
+def test_construct(multiple_list):
+    """
+    GIVEN list with multiple values
+    WHEN cursor is called
+    THEN a cursor on the first value is returned.
+    """
+    list_cursor = multiple_list.cursor()
+
+    assert isinstance(list_cursor, cursor.Cursor)
+    assert list_cursor.index == 0
+    assert list_cursor.at_end() is False
+    assert list_cursor.peek() == "value 1"
+
+
+def test_construct_empty():
+    """
+    GIVEN empty list
+    WHEN cursor is called
+    THEN a cursor at the end is returned.
+    """
+    list_cursor = linked_list.LinkedList().cursor()
+
+    assert list_cursor.at_end() is True
+    with pytest.raises(IndexError):
+        list_cursor.peek()
+
+
+@pytest.mark.parametrize(
+    "steps, expected_value",
+    [(0, "value 1"), (1, "value 2"), (2, "value 3")],
+    ids=["0", "1", "2"],
+)
+def test_advance(multiple_list, steps, expected_value):
+    """
+    GIVEN cursor on list with multiple values, steps and expected value
+    WHEN advance is called with the steps
+    THEN the cursor is on the expected value.
+    """
+    list_cursor = multiple_list.cursor()
+
+    list_cursor.advance(steps)
+
+    assert list_cursor.index == steps
+    assert list_cursor.peek() == expected_value
+
+
+def test_advance_end(multiple_list):
+    """
+    GIVEN cursor on list with multiple values
+    WHEN advance is called to the end and past the end
+    THEN the cursor is at the end and IndexError is raised when moving past it.
+    """
+    list_cursor = multiple_list.cursor()
+
+    list_cursor.advance(3)
+
+    assert list_cursor.at_end() is True
+    with pytest.raises(IndexError):
+        list_cursor.advance()
+    assert list_cursor.index == 3
+
+
+@pytest.mark.parametrize(
+    "start, index, expected_value",
+    [(0, 2, "value 3"), (2, 1, "value 2"), (1, 1, "value 2"), (2, 0, "value 1")],
+    ids=["forward", "backward", "same", "front"],
+)
+def test_seek(multiple_list, start, index, expected_value):
+    """
+    GIVEN cursor on list with multiple values at a start index, index and expected
+        value
+    WHEN seek is called with the index
+    THEN the cursor is on the expected value.
+    """
+    list_cursor = multiple_list.cursor()
+    list_cursor.advance(start)
+
+    list_cursor.seek(index)
+
+    assert list_cursor.index == index
+    assert list_cursor.peek() == expected_value
+
+
+@pytest.mark.parametrize("index", [-1, 4], ids=["negative", "past end"])
+def test_seek_invalid(multiple_list, index):
+    """
+    GIVEN cursor on list with multiple values and index out of range
+    WHEN seek is called with the index
+    THEN IndexError is raised.
+    """
+    list_cursor = multiple_list.cursor()
+
+    with pytest.raises(IndexError):
+        list_cursor.seek(index)
+
+
+@pytest.mark.parametrize(
+    "index, expected_values",
+    [
+        (0, ["new", "value 1", "value 2", "value 3"]),
+        (1, ["value 1", "new", "value 2", "value 3"]),
+        (3, ["value 1", "value 2", "value 3", "new"]),
+    ],
+    ids=["first", "middle", "end"],
+)
+def test_insert_before(multiple_list, index, expected_values):
+    """
+    GIVEN cursor on list with multiple values at an index and expected values
+    WHEN insert_before is called
+    THEN the list has the expected values and the cursor stays on the same value.
+    """
+    list_cursor = multiple_list.cursor()
+    list_cursor.seek(index)
+
+    list_cursor.insert_before("new")
+
+    assert_values(multiple_list, expected_values)
+    assert list_cursor.index == index + 1
+    if index < 3:
+        assert list_cursor.peek() == f"value {index + 1}"
+
+
+@pytest.mark.parametrize(
+    "index, expected_values",
+    [
+        (0, ["value 1", "new", "value 2", "value 3"]),
+        (2, ["value 1", "value 2", "value 3", "new"]),
+    ],
+    ids=["first", "last"],
+)
+def test_insert_after(multiple_list, index, expected_values):
+    """
+    GIVEN cursor on list with multiple values at an index and expected values
+    WHEN insert_after is called
+    THEN the list has the expected values and the cursor stays on the same value.
+    """
+    list_cursor = multiple_list.cursor()
+    list_cursor.seek(index)
+
+    list_cursor.insert_after("new")
+
+    assert_values(multiple_list, expected_values)
+    assert list_cursor.peek() == f"value {index + 1}"
+
+
+def test_insert_after_end(multiple_list):
+    """
+    GIVEN cursor at the end of a list
+    WHEN insert_after is called
+    THEN IndexError is raised.
+    """
+    list_cursor = multiple_list.cursor()
+    list_cursor.seek(3)
+
+    with pytest.raises(IndexError):
+        list_cursor.insert_after("new")
+
+
+@pytest.mark.parametrize(
+    "index, expected_values",
+    [
+        (0, ["value 2", "value 3"]),
+        (1, ["value 1", "value 3"]),
+        (2, ["value 1", "value 2"]),
+    ],
+    ids=["first", "middle", "last"],
+)
+def test_delete(multiple_list, index, expected_values):
+    """
+    GIVEN cursor on list with multiple values at an index and expected values
+    WHEN delete is called
+    THEN the value is returned, the list has the expected values and the cursor is on
+        the next value.
+    """
+    list_cursor = multiple_list.cursor()
+    list_cursor.seek(index)
+
+    value = list_cursor.delete()
+
+    assert value == f"value {index + 1}"
+    assert_values(multiple_list, expected_values)
+    assert list_cursor.index == index
+    if index < 2:
+        assert list_cursor.peek() == f"value {index + 2}"
+    else:
+        assert list_cursor.at_end() is True
+
+
+def test_delete_end(multiple_list):
+    """
+    GIVEN cursor at the end of a list
+    WHEN delete is called
+    THEN IndexError is raised.
+    """
+    list_cursor = multiple_list.cursor()
+    list_cursor.seek(3)
+
+    with pytest.raises(IndexError):
+        list_cursor.delete()
+
+
+def test_rewrite_pass():
+    """
+    GIVEN list with numbers
+    WHEN a single pass with a cursor deletes odd numbers and duplicates even numbers
+    THEN the list has the rewritten values.
+    """
+    list_ = linked_list.LinkedList.from_iterable(range(6))
+    list_cursor = list_.cursor()
+
+    while not list_cursor.at_end():
+        value = list_cursor.peek()
+        if value % 2:
+            list_cursor.delete()
+            continue
+        list_cursor.insert_after(value)
+        list_cursor.advance(2)
+
+    assert_values(list_, [0, 0, 2, 2, 4, 4])
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda list_: list_.delete(2),
+        lambda list_: list_.add_first(0),
+        lambda list_: list_.search(3),
+        lambda list_: list_.cursor().delete(),
+    ],
+    ids=["delete", "add_first", "self organizing search", "other cursor"],
+)
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda list_cursor: list_cursor.at_end(),
+        lambda list_cursor: list_cursor.seek(0),
+        lambda list_cursor: list_cursor.advance(),
+        lambda list_cursor: list_cursor.peek(),
+        lambda list_cursor: list_cursor.insert_before(9),
+        lambda list_cursor: list_cursor.insert_after(9),
+        lambda list_cursor: list_cursor.delete(),
+    ],
+    ids=[
+        "at_end",
+        "seek",
+        "advance",
+        "peek",
+        "insert_before",
+        "insert_after",
+        "delete",
+    ],
+)
+def test_list_changed(change, operation):
+    """
+    GIVEN cursor on a list that is then changed other than through the cursor
+    WHEN an operation is called on the cursor
+    THEN RuntimeError is raised and the list is not changed by the cursor.
+    """
+    list_ = linked_list.LinkedList.from_iterable(
+        [1, 2, 3], organize=linked_list.MOVE_TO_FRONT
+    )
+    list_cursor = list_.cursor()
+    list_cursor.seek(1)
+    change(list_)
+    expected_values = list(list_)
+
+    with pytest.raises(RuntimeError):
+        operation(list_cursor)
+
+    assert_values(list_, expected_values)
+
+
+def test_two_cursors_delete():
+    """
+    GIVEN two cursors on the same value of a list
+    WHEN both delete the value
+    THEN the first deletes the value and the second raises RuntimeError.
+    """
+    list_ = linked_list.LinkedList.from_iterable([1, 2, 3])
+    first, second = list_.cursor(), list_.cursor()
+    first.seek(1)
+    second.seek(1)
+
+    assert first.delete() == 2
+    with pytest.raises(RuntimeError):
+        second.delete()
+
+    assert_values(list_, [1, 3])
@@ -0,0 +1,297 @@
+"""Tests for doubly linked list."""
+# pylint: disable=redefined-outer-name
+
+import pytest
+
+from library import linked_list
+from library.linked_list import doubly
+
+
+def assert_values(list_, expected_values):
+    """Check the values of the list in both directions and the length."""
+    assert list(iter(list_)) == expected_values
+    assert list(reversed(list_)) == list(reversed(expected_values))
+    assert len(list_) == len(expected_values)
+    if expected_values:
+        assert list_.head.previous is None
+        assert list_.tail.next_ is None
+    else:
+        assert list_.head is None
+        assert list_.tail is None
+
+
+@pytest.fixture
+def empty_list():
+    """Doubly linked list with no values."""
+    return doubly.DoublyLinkedList()
+
+
+@pytest.fixture
+def multiple_list(empty_list):
+    """Doubly linked list with multiple values."""
+    for value in ("value 1", "value 2", "value 3"):
+        empty_list.add_last(value)
+    return empty_list
+
+
+def test_node_construct():
+    """
+    GIVEN value for node
+    WHEN node is constructed with the value
+    THEN the value is copied into the node and previous and next_ are None.
+    """
+    node = doubly.Node("value 1")
+
+    assert node.value == "value 1"
+    assert node.previous is None
+    assert node.next_ is None
+
+
+def test_node_slots():
+    """
+    GIVEN node
+    WHEN the attributes of the node are checked
+    THEN the node has no per instance dictionary.
+    """
+    node = doubly.Node("value 1")
+
+    assert not hasattr(node, "__dict__")
+
+
+def test_export():
+    """
+    GIVEN linked list package
+    WHEN DoublyLinkedList is accessed
+    THEN it is the doubly linked list.
+    """
+    assert linked_list.DoublyLinkedList is doubly.DoublyLinkedList
+
+
+def test_construct(empty_list):
+    """
+    GIVEN
+    WHEN doubly linked list is constructed
+    THEN it is empty.
+    """
+    assert_values(empty_list, [])
+    assert empty_list.is_empty() is True
+
+
+def test_add_first(empty_list):
+    """
+    GIVEN empty list
+    WHEN add_first is called with multiple values
+    THEN the values are in reverse order and the nodes with the values are returned.
+    """
+    node_1 = empty_list.add_first("value 1")
+    node_2 = empty_list.add_first("value 2")
+
+    assert_values(empty_list, ["value 2", "value 1"])
+    assert node_1.value == "value 1"
+    assert node_2.value == "value 2"
+    assert empty_list.head is node_2
+    assert empty_list.tail is node_1
+
+
+def test_add_last(empty_list):
+    """
+    GIVEN empty list
+    WHEN add_last is called with multiple values
+    THEN the values are in order and the nodes with the values are returned.
+    """
+    node_1 = empty_list.add_last("value 1")
+    node_2 = empty_list.add_last("value 2")
+
+    assert_values(empty_list, ["value 1", "value 2"])
+    assert empty_list.head is node_1
+    assert empty_list.tail is node_2
+
+
+@pytest.mark.parametrize(
+    "index, expected_values",
+    [
+        (0, ["value 1", "new", "value 2", "value 3"]),
+        (1, ["value 1", "value 2", "new", "value 3"]),
+        (2, ["value 1", "value 2", "value 3", "new"]),
+    ],
+    ids=["first", "middle", "last"],
+)
+def test_insert_after(multiple_list, index, expected_values):
+    """
+    GIVEN list with multiple values, index of a node and expected values
+    WHEN insert_after is called with the node at the index
+    THEN the list has the expected values and the new node is returned.
+    """
+    nodes = [multiple_list.head, multiple_list.head.next_, multiple_list.tail]
+
+    node = multiple_list.insert_after(nodes[index], "new")
+
+    assert_values(multiple_list, expected_values)
+    assert node.value == "new"
+    assert node.previous is nodes[index]
+
+
+@pytest.mark.parametrize(
+    "index, expected_values",
+    [
+        (0, ["new", "value 1", "value 2", "value 3"]),
+        (1, ["value 1", "new", "value 2", "value 3"]),
+        (2, ["value 1", "value 2", "new", "value 3"]),
+    ],
+    ids=["first", "middle", "last"],
+)
+def test_insert_before(multiple_list, index, expected_values):
+    """
+    GIVEN list with multiple values, index of a node and expected values
+    WHEN insert_before is called with the node at the index
+    THEN the list has the expected values and the new node is returned.
+    """
+    nodes = [multiple_list.head, multiple_list.head.next_, multiple_list.tail]
+
+    node = multiple_list.insert_before(nodes[index], "new")
+
+    assert_values(multiple_list, expected_values)
+    assert node.value == "new"
+    assert node.next_ is nodes[index]
+
+
+@pytest.mark.parametrize(
+    "index, expected_values",
+    [
+        (0, ["value 2", "value 3"]),
+        (1, ["value 1", "value 3"]),
+        (2, ["value 1", "value 2"]),
+    ],
+    ids=["first", "middle", "last"],
+)
+def test_remove(multiple_list, index, expected_values):
+    """
+    GIVEN list with multiple values, index of a node and expected values
+    WHEN remove is called with the node at the index
+    THEN the list has the expected values and the value of the node is returned.
+    """
+    nodes = [multiple_list.head, multiple_list.head.next_, multiple_list.tail]
+
+    value = multiple_list.remove(nodes[index])
+
+    assert_values(multiple_list, expected_values)
+    assert value == f"value {index + 1}"
+    assert nodes[index].previous is None
+    assert nodes[index].next_ is None
+
+
+def test_remove_single(empty_list):
+    """
+    GIVEN list with a single node
+    WHEN remove is called with the node
+    THEN the list is empty.
+    """
+    node = empty_list.add_last("value 1")
+
+    empty_list.remove(node)
+
+    assert_values(empty_list, [])
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda list_, node: list_.remove(node),
+        lambda list_, node: list_.move_to_front(node),
+        lambda list_, node: list_.insert_after(node, "value 4"),
+        lambda list_, node: list_.insert_before(node, "value 4"),
+    ],
+    ids=["remove", "move_to_front", "insert_after", "insert_before"],
+)
+@pytest.mark.parametrize("index", [0, 1, 2], ids=["first", "middle", "last"])
+def test_removed_node(multiple_list, index, operation):
+    """
+    GIVEN list with multiple values and a node that has been removed
+    WHEN an operation is called with the removed node
+    THEN ValueError is raised and the list is unchanged.
+    """
+    nodes = [multiple_list.head, multiple_list.head.next_, multiple_list.tail]
+    multiple_list.remove(nodes[index])
+    expected_values = list(multiple_list)
+
+    with pytest.raises(ValueError):
+        operation(multiple_list, nodes[index])
+
+    assert_values(multiple_list, expected_values)
+
+
+@pytest.mark.parametrize(
+    "index, expected_values",
+    [
+        (0, ["value 1", "value 2", "value 3"]),
+        (1, ["value 2", "value 1", "value 3"]),
+        (2, ["value 3", "value 1", "value 2"]),
+    ],
+    ids=["first", "middle", "last"],
+)
+def test_move_to_front(multiple_list, index, expected_values):
+    """
+    GIVEN list with multiple values, index of a node and expected values
+    WHEN move_to_front is called with the node at the index
+    THEN the list has the expected values and the node is the head.
+    """
+    nodes = [multiple_list.head, multiple_list.head.next_, multiple_list.tail]
+
+    multiple_list.move_to_front(nodes[index])
+
+    assert_values(multiple_list, expected_values)
+    assert multiple_list.head is nodes[index]
+
+
+@pytest.mark.parametrize(
+    "value, expected_index",
+    [("value 1", 0), ("value 3", 2), ("value 4", None)],
+    ids=["first", "last", "not in list"],
+)
+def test_find_search(multiple_list, value, expected_index):
+    """
+    GIVEN list with multiple values, value and index of the node expected to be found
+    WHEN find and search are called with the value
+    THEN find returns the expected node and search whether it was found.
+    """
+    nodes = [multiple_list.head, multiple_list.head.next_, multiple_list.tail]
+
+    node = multiple_list.find(value)
+    found = multiple_list.search(value)
+
+    if expected_index is None:
+        assert node is None
+        assert found is False
+    else:
+        assert node is nodes[expected_index]
+        assert found is True
+
+
+def test_clear(multiple_list):
+    """
+    GIVEN list with multiple values
+    WHEN clear is called
+    THEN the list is empty and values can be added again.
+    """
+    multiple_list.clear()
+
+    assert_values(multiple_list, [])
+    assert multiple_list.is_empty() is True
+    multiple_list.add_first("value 1")
+    assert_values(multiple_list, ["value 1"])
+
+
+def test_lru_usage(empty_list):
+    """
+    GIVEN list used as the recency order of a cache with a map to the nodes
+    WHEN values are used and the least recently used value is evicted
+    THEN the evicted value is the least recently used value.
+    """
+    nodes = {value: empty_list.add_first(value) for value in range(5)}
+
+    empty_list.move_to_front(nodes[0])
+    empty_list.move_to_front(nodes[1])
+    evicted = empty_list.remove(empty_list.tail)
+
+    assert evicted == 2
+    assert_values(empty_list, [1, 0, 4, 3])
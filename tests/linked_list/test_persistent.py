@@ -0,0 +1,138 @@
+"""Tests for persistent list."""
+
+import pytest
+
+from library import linked_list
+from library.linked_list import persistent
+
+
+def test_export():
+    """
+    GIVEN linked list package
+    WHEN PersistentList and ListEmptyError are accessed
+    THEN they are the persistent list and its error.
+    """
+    assert linked_list.PersistentList is persistent.PersistentList
+    assert linked_list.ListEmptyError is persistent.ListEmptyError
+
+
+def test_node_slots():
+    """
+    GIVEN nodes
+    WHEN the attributes of the nodes are checked
+    THEN the size counts the nodes and there is no per instance dictionary.
+    """
+    node = persistent.Node("value 2")
+    next_node = persistent.Node("value 1", node)
+
+    assert node.size == 1
+    assert next_node.size == 2
+    assert not hasattr(node, "__dict__")
+
+
+def test_construct():
+    """
+    GIVEN
+    WHEN the list is constructed
+    THEN it is empty.
+    """
+    list_ = persistent.PersistentList()
+
+    assert list(iter(list_)) == []
+    assert len(list_) == 0
+    assert list_.is_empty() is True
+
+
+@pytest.mark.parametrize(
+    "values",
+    [[], ["value 1"], ["value 1", "value 2", "value 3"]],
+    ids=["empty", "single", "multiple"],
+)
+def test_from_iterable(values):
+    """
+    GIVEN values
+    WHEN from_iterable is called with a generator of the values
+    THEN the list has the values in order.
+    """
+    list_ = persistent.PersistentList.from_iterable(value for value in values)
+
+    assert list(iter(list_)) == values
+    assert len(list_) == len(values)
+
+
+def test_cons():
+    """
+    GIVEN list with values
+    WHEN cons is called twice on the list
+    THEN the new lists have the values at the front, share the nodes of the list and
+        the list is unchanged.
+    """
+    list_ = persistent.PersistentList.from_iterable(["value 1", "value 2"])
+
+    list_a = list_.cons("value a")
+    list_b = list_.cons("value b")
+
+    assert list(iter(list_a)) == ["value a", "value 1", "value 2"]
+    assert list(iter(list_b)) == ["value b", "value 1", "value 2"]
+    assert len(list_a) == 3
+    assert list(iter(list_)) == ["value 1", "value 2"]
+    assert list_a.head.next_ is list_.head
+    assert list_b.head.next_ is list_.head
+
+
+def test_first_tail():
+    """
+    GIVEN list with values
+    WHEN first and tail are called
+    THEN the first value and a list sharing the remaining nodes are returned.
+    """
+    list_ = persistent.PersistentList.from_iterable(["value 1", "value 2"])
+
+    first = list_.first()
+    tail = list_.tail()
+
+    assert first == "value 1"
+    assert list(iter(tail)) == ["value 2"]
+    assert tail.head is list_.head.next_
+    assert list(iter(list_)) == ["value 1", "value 2"]
+    assert tail.tail().is_empty() is True
+
+
+@pytest.mark.parametrize("method", ["first", "tail"])
+def test_empty_raises(method):
+    """
+    GIVEN empty list and method
+    WHEN the method is called
+    THEN ListEmptyError is raised.
+    """
+    list_ = persistent.PersistentList()
+
+    with pytest.raises(persistent.ListEmptyError):
+        getattr(list_, method)()
+
+
+@pytest.mark.parametrize(
+    "value, expected_found",
+    [("value 1", True), ("value 2", True), ("value 3", False)],
+    ids=["first", "last", "not in list"],
+)
+def test_search(value, expected_found):
+    """
+    GIVEN list with values, value and expected found value
+    WHEN search is called with the value
+    THEN the expected found value is returned.
+    """
+    list_ = persistent.PersistentList.from_iterable(["value 1", "value 2"])
+
+    assert list_.search(value) == expected_found
+
+
+def test_clone():
+    """
+    GIVEN list with values
+    WHEN clone is called
+    THEN the list itself is returned.
+    """
+    list_ = persistent.PersistentList.from_iterable(["value 1", "value 2"])
+
+    assert list_.clone() is list_
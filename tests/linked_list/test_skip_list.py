@@ -0,0 +1,318 @@
+"""Tests for skip list."""
+# pylint: disable=protected-access
+
+import bisect
+import random
+
+import pytest
+
+from library import linked_list
+from library.linked_list import skip_list
+
+
+def assert_values(list_, expected_values):
+    """Check the values, length, levels and widths of the skip list."""
+    assert list(iter(list_)) == expected_values
+    assert len(list_) == len(expected_values)
+
+    # Calculating the position of each node
+    positions = {id(list_._head): 0}
+    node = list_._head.next_[0]
+    while node is not None:
+        positions[id(node)] = len(positions)
+        node = node.next_[0]
+
+    # Checking that each level is sorted and the widths match the positions
+    for level in range(list_._level):
+        node = list_._head
+        while node is not None:
+            next_ = node.next_[level]
+            next_position = len(expected_values) + 1
+            if next_ is not None:
+                assert node is list_._head or node.value <= next_.value
+                next_position = positions[id(next_)]
+            assert node.width[level] == next_position - positions[id(node)]
+            node = next_
+    assert list_._level == 1 or list_._head.next_[list_._level - 1] is not None
+
+
+def create_list(values):
+    """Create a skip list with the values."""
+    list_ = skip_list.SkipList(seed=1)
+    for value in values:
+        list_.insert(value)
+    return list_
+
+
+def test_export():
+    """
+    GIVEN linked list package
+    WHEN SkipList is accessed
+    THEN it is the skip list.
+    """
+    assert linked_list.SkipList is skip_list.SkipList
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"probability": 0}, {"probability": 1}, {"max_level": 0}],
+    ids=["probability 0", "probability 1", "max level 0"],
+)
+def test_construct_invalid(kwargs):
+    """
+    GIVEN invalid arguments for the skip list
+    WHEN the skip list is constructed
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        skip_list.SkipList(**kwargs)
+
+
+def test_construct():
+    """
+    GIVEN
+    WHEN the skip list is constructed
+    THEN it is empty.
+    """
+    list_ = skip_list.SkipList()
+
+    assert_values(list_, [])
+    assert list_.is_empty() is True
+
+
+@pytest.mark.parametrize(
+    "values",
+    [[1], [2, 1], [1, 2, 3], [3, 1, 2, 1, 3], list(range(100, 0, -1))],
+    ids=["single", "reversed", "sorted", "duplicates", "many"],
+)
+def test_insert(values):
+    """
+    GIVEN values
+    WHEN the values are inserted
+    THEN the skip list has the values in sorted order.
+    """
+    list_ = create_list(values)
+
+    assert_values(list_, sorted(values))
+    assert list_.is_empty() is False
+
+
+def test_insert_duplicates_order():
+    """
+    GIVEN values that are equal but distinguishable
+    WHEN the values are inserted
+    THEN the values are in insertion order.
+    """
+    values = [(1, "a"), (0, "b"), (1, "c"), (1, "d")]
+
+    class Key(tuple):
+        """Compares on the first element only."""
+
+        def __lt__(self, other):
+            return self[0] < other[0]
+
+        def __le__(self, other):
+            return self[0] <= other[0]
+
+    list_ = create_list(Key(value) for value in values)
+
+    assert [value[1] for value in list_] == ["b", "a", "c", "d"]
+
+
+def test_max_level():
+    """
+    GIVEN skip list with a maximum level of 1
+    WHEN values are inserted
+    THEN the skip list only uses a single level.
+    """
+    list_ = skip_list.SkipList(max_level=1)
+
+    for value in range(10):
+        list_.insert(value)
+
+    assert_values(list_, list(range(10)))
+    assert list_._level == 1
+
+
+@pytest.mark.parametrize(
+    "value, expected_value",
+    [(1, 1), (3, 3), (5, 5), (0, None), (4, None), (6, None)],
+    ids=["first", "middle", "last", "before", "between", "after"],
+)
+def test_search(value, expected_value):
+    """
+    GIVEN skip list with values, value and expected value
+    WHEN search is called with the value
+    THEN the expected value is returned.
+    """
+    list_ = create_list([5, 1, 3])
+
+    assert list_.search(value) == expected_value
+
+
+def test_search_empty():
+    """
+    GIVEN empty skip list
+    WHEN search is called
+    THEN None is returned.
+    """
+    assert skip_list.SkipList().search(1) is None
+
+
+@pytest.mark.parametrize(
+    "value, expected_values",
+    [(1, [3, 3, 5]), (3, [1, 3, 5]), (5, [1, 3, 3])],
+    ids=["first", "duplicate", "last"],
+)
+def test_delete(value, expected_values):
+    """
+    GIVEN skip list with values, value and expected values
+    WHEN delete is called with the value
+    THEN the skip list has the expected values.
+    """
+    list_ = create_list([5, 1, 3, 3])
+
+    list_.delete(value)
+
+    assert_values(list_, expected_values)
+
+
+@pytest.mark.parametrize(
+    "values, value",
+    [([], 1), ([1, 3], 2), ([1, 3], 4)],
+    ids=["empty", "between", "after"],
+)
+def test_delete_missing(values, value):
+    """
+    GIVEN skip list with values and value not in the skip list
+    WHEN delete is called with the value
+    THEN ValueError is raised.
+    """
+    list_ = create_list(values)
+
+    with pytest.raises(ValueError):
+        list_.delete(value)
+
+
+def test_delete_all():
+    """
+    GIVEN skip list with many values
+    WHEN all values are deleted
+    THEN the skip list is empty and uses a single level.
+    """
+    values = list(range(100))
+    list_ = create_list(values)
+
+    for value in values:
+        list_.delete(value)
+
+    assert_values(list_, [])
+    assert list_._level == 1
+
+
+@pytest.mark.parametrize(
+    "value, expected_rank",
+    [(0, 0), (1, 0), (2, 1), (3, 1), (4, 3), (5, 3), (6, 4)],
+    ids=["before", "first", "between", "duplicate", "after duplicate", "last", "end"],
+)
+def test_rank(value, expected_rank):
+    """
+    GIVEN skip list with values, value and expected rank
+    WHEN rank is called with the value
+    THEN the expected rank is returned.
+    """
+    list_ = create_list([5, 1, 3, 3])
+
+    assert list_.rank(value) == expected_rank
+
+
+@pytest.mark.parametrize(
+    "index, expected_value",
+    [(0, 1), (1, 3), (3, 5), (-1, 5), (-4, 1)],
+    ids=["first", "second", "last", "negative last", "negative first"],
+)
+def test_getitem(index, expected_value):
+    """
+    GIVEN skip list with values, index and expected value
+    WHEN the skip list is indexed with the index
+    THEN the expected value is returned.
+    """
+    list_ = create_list([5, 1, 3, 3])
+
+    assert list_[index] == expected_value
+
+
+@pytest.mark.parametrize("index", [4, -5], ids=["past end", "before start"])
+def test_getitem_invalid(index):
+    """
+    GIVEN skip list with values and index out of range
+    WHEN the skip list is indexed with the index
+    THEN IndexError is raised.
+    """
+    list_ = create_list([5, 1, 3, 3])
+
+    with pytest.raises(IndexError):
+        list_[index]  # pylint: disable=pointless-statement
+
+
+@pytest.mark.parametrize(
+    "start, stop, expected_values",
+    [
+        (None, None, [1, 3, 3, 5]),
+        (3, None, [3, 3, 5]),
+        (None, 5, [1, 3, 3]),
+        (2, 4, [3, 3]),
+        (3, 3, []),
+        (6, None, []),
+    ],
+    ids=["all", "start", "stop", "between", "empty range", "after"],
+)
+def test_range(start, stop, expected_values):
+    """
+    GIVEN skip list with values, start, stop and expected values
+    WHEN range is called with start and stop
+    THEN the expected values are returned.
+    """
+    list_ = create_list([5, 1, 3, 3])
+
+    assert list(list_.range(start, stop)) == expected_values
+
+
+def test_clear():
+    """
+    GIVEN skip list with values
+    WHEN clear is called
+    THEN the skip list is empty and values can be inserted again.
+    """
+    list_ = create_list(range(20))
+
+    list_.clear()
+
+    assert_values(list_, [])
+    list_.insert(1)
+    assert_values(list_, [1])
+
+
+def test_random_operations():
+    """
+    GIVEN random insert and delete operations
+    WHEN the operations are performed on a skip list and a sorted Python list
+    THEN the lists have the same values, ranks and values at each index.
+    """
+    generator = random.Random(0)
+    list_ = skip_list.SkipList(seed=0)
+    expected_values = []
+
+    for _ in range(500):
+        value = generator.randrange(50)
+        if generator.random() < 0.6:
+            list_.insert(value)
+            bisect.insort(expected_values, value)
+        elif value in expected_values:
+            list_.delete(value)
+            expected_values.remove(value)
+
+        assert_values(list_, expected_values)
+        assert list_.rank(value) == bisect.bisect_left(expected_values, value)
+        for index, expected_value in enumerate(expected_values):
+            assert list_[index] == expected_value
@@ -0,0 +1,326 @@
+"""Tests for unrolled linked list."""
+# pylint: disable=redefined-outer-name
+
+import random
+from unittest import mock
+
+import pytest
+
+from library import linked_list
+from library.linked_list import unrolled
+
+
+def assert_values(list_, expected_values):
+    """Check the values, length and node invariants of the list."""
+    assert list(iter(list_)) == expected_values
+    assert len(list_) == len(expected_values)
+    node = list_.head
+    last_node = None
+    while node is not None:
+        assert 0 < len(node.values) <= list_.chunk_size
+        last_node = node
+        node = node.next_
+    assert list_.tail is last_node
+
+
+def create_list(values, chunk_size=2):
+    """Create unrolled list with the values."""
+    list_ = unrolled.UnrolledLinkedList(chunk_size)
+    for value in values:
+        list_.add_last(value)
+    return list_
+
+
+@pytest.fixture
+def multiple_list():
+    """Unrolled list with multiple values over multiple nodes."""
+    return create_list([f"value {idx}" for idx in range(1, 6)])
+
+
+def test_export():
+    """
+    GIVEN linked list package
+    WHEN UnrolledLinkedList is accessed
+    THEN it is the unrolled linked list.
+    """
+    assert linked_list.UnrolledLinkedList is unrolled.UnrolledLinkedList
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1], ids=["zero", "negative"])
+def test_construct_invalid(chunk_size):
+    """
+    GIVEN chunk size less than 1
+    WHEN the list is constructed with the chunk size
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        unrolled.UnrolledLinkedList(chunk_size)
+
+
+def test_construct():
+    """
+    GIVEN
+    WHEN the list is constructed
+    THEN it is empty with the default chunk size.
+    """
+    list_ = unrolled.UnrolledLinkedList()
+
+    assert_values(list_, [])
+    assert list_.chunk_size == 64
+    assert list_.is_empty() is True
+
+
+@pytest.mark.parametrize(
+    "values, expected_nodes",
+    [([], 0), ([1], 1), ([1, 2], 1), ([1, 2, 3], 2), ([1, 2, 3, 4, 5], 3)],
+    ids=["empty", "single", "full node", "two nodes", "three nodes"],
+)
+def test_add_last(values, expected_nodes):
+    """
+    GIVEN values and expected number of nodes
+    WHEN add_last is called with each value
+    THEN the list has the values in the expected number of nodes.
+    """
+    list_ = create_list(values)
+
+    assert_values(list_, values)
+    node_count = 0
+    node = list_.head
+    while node is not None:
+        node_count += 1
+        node = node.next_
+    assert node_count == expected_nodes
+
+
+@pytest.mark.parametrize(
+    "values", [[1], [1, 2], [1, 2, 3]], ids=["single", "full node", "two nodes"]
+)
+def test_add_first(values):
+    """
+    GIVEN values
+    WHEN add_first is called with each value
+    THEN the list has the values in reverse order.
+    """
+    list_ = unrolled.UnrolledLinkedList(2)
+
+    for value in values:
+        list_.add_first(value)
+
+    assert_values(list_, list(reversed(values)))
+
+
+@pytest.mark.parametrize(
+    "key, expected_values",
+    [
+        ("value 6", ["value 1", "value 2", "value 3", "value 4", "value 5"]),
+        ("value 1", ["value 1", "new", "value 2", "value 3", "value 4", "value 5"]),
+        ("value 2", ["value 1", "value 2", "new", "value 3", "value 4", "value 5"]),
+        ("value 5", ["value 1", "value 2", "value 3", "value 4", "value 5", "new"]),
+    ],
+    ids=["not in list", "split node", "end of full node", "last"],
+)
+def test_insert_after(multiple_list, key, expected_values):
+    """
+    GIVEN list with values over multiple nodes, key and expected values
+    WHEN insert_after is called with the key
+    THEN the list has the expected values.
+    """
+    multiple_list.insert_after(key, "new")
+
+    assert_values(multiple_list, expected_values)
+
+
+@pytest.mark.parametrize(
+    "key, expected_values",
+    [
+        ("value 6", ["value 1", "value 2", "value 3", "value 4", "value 5"]),
+        ("value 1", ["new", "value 1", "value 2", "value 3", "value 4", "value 5"]),
+        ("value 4", ["value 1", "value 2", "value 3", "new", "value 4", "value 5"]),
+        ("value 5", ["value 1", "value 2", "value 3", "value 4", "new", "value 5"]),
+    ],
+    ids=["not in list", "first", "middle", "last"],
+)
+def test_insert_before(multiple_list, key, expected_values):
+    """
+    GIVEN list with values over multiple nodes, key and expected values
+    WHEN insert_before is called with the key
+    THEN the list has the expected values.
+    """
+    multiple_list.insert_before(key, "new")
+
+    assert_values(multiple_list, expected_values)
+
+
+def test_insert_split_tail():
+    """
+    GIVEN list with a single full node
+    WHEN insert_after is called with the first value
+    THEN the node is split and the tail is the new node.
+    """
+    list_ = create_list([1, 2])
+
+    list_.insert_after(1, 3)
+
+    assert_values(list_, [1, 3, 2])
+    assert list_.head is not list_.tail
+
+
+@pytest.mark.parametrize(
+    "value, expected_values",
+    [
+        ("value 6", ["value 1", "value 2", "value 3", "value 4", "value 5"]),
+        ("value 1", ["value 2", "value 3", "value 4", "value 5"]),
+        ("value 3", ["value 1", "value 2", "value 4", "value 5"]),
+        ("value 5", ["value 1", "value 2", "value 3", "value 4"]),
+    ],
+    ids=["not in list", "first", "middle", "last"],
+)
+def test_delete(multiple_list, value, expected_values):
+    """
+    GIVEN list with values over multiple nodes, value and expected values
+    WHEN delete is called with the value
+    THEN the list has the expected values.
+    """
+    multiple_list.delete(value)
+
+    assert_values(multiple_list, expected_values)
+
+
+def test_delete_merge():
+    """
+    GIVEN list with chunk size 4 with two nodes that fit into a single node after a
+        delete
+    WHEN delete is called
+    THEN the nodes are merged.
+    """
+    list_ = create_list([1, 2, 3, 4, 5], chunk_size=4)
+
+    list_.delete(1)
+    list_.delete(2)
+    list_.delete(3)
+
+    assert_values(list_, [4, 5])
+    assert list_.head is list_.tail
+
+
+def test_delete_no_merge():
+    """
+    GIVEN list with chunk size 4 with two nodes that would not fit into a single node
+    WHEN delete is called
+    THEN the nodes are not merged.
+    """
+    list_ = create_list([1, 2, 3, 4, 5, 6, 7, 8], chunk_size=4)
+
+    list_.delete(1)
+    list_.delete(2)
+    list_.delete(3)
+
+    assert_values(list_, [4, 5, 6, 7, 8])
+    assert list_.head.next_ is list_.tail
+
+
+def test_delete_all(multiple_list):
+    """
+    GIVEN list with values over multiple nodes
+    WHEN delete is called with every value
+    THEN the list is empty.
+    """
+    for idx in range(1, 6):
+        multiple_list.delete(f"value {idx}")
+
+    assert_values(multiple_list, [])
+    assert multiple_list.is_empty() is True
+
+
+def test_traverse(multiple_list):
+    """
+    GIVEN list with values over multiple nodes and mock function
+    WHEN traverse is called with the mock function
+    THEN the mock function is called with all values in order.
+    """
+    func = mock.MagicMock()
+
+    multiple_list.traverse(func)
+
+    assert [call.args[0] for call in func.call_args_list] == [
+        f"value {idx}" for idx in range(1, 6)
+    ]
+
+
+@pytest.mark.parametrize(
+    "value, expected_found",
+    [("value 1", True), ("value 5", True), ("value 6", False)],
+    ids=["first", "last", "not in list"],
+)
+def test_search(multiple_list, value, expected_found):
+    """
+    GIVEN list with values over multiple nodes, value and expected found value
+    WHEN search is called with the value
+    THEN the expected found value is returned.
+    """
+    assert multiple_list.search(value) == expected_found
+
+
+def test_clone(multiple_list):
+    """
+    GIVEN list with values over multiple nodes
+    WHEN clone is called
+    THEN a new list with the same values and no shared nodes is returned.
+    """
+    multiple_list.delete("value 2")
+
+    new_list = multiple_list.clone()
+
+    assert_values(new_list, list(iter(multiple_list)))
+    assert new_list.chunk_size == multiple_list.chunk_size
+    assert new_list.head is not multiple_list.head
+    assert new_list.head.values is not multiple_list.head.values
+
+
+def test_clear(multiple_list):
+    """
+    GIVEN list with values over multiple nodes
+    WHEN clear is called
+    THEN the list is empty.
+    """
+    multiple_list.clear()
+
+    assert_values(multiple_list, [])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 8], ids=["1", "3", "8"])
+def test_random_operations(chunk_size):
+    """
+    GIVEN chunk size and random operations
+    WHEN the operations are performed on an unrolled list and a Python list
+    THEN the lists have the same values.
+    """
+    generator = random.Random(chunk_size)
+    list_ = unrolled.UnrolledLinkedList(chunk_size)
+    expected_values = []
+
+    for value in range(500):
+        operation = generator.choice(
+            ["add_first", "add_last", "insert_after", "insert_before", "delete"]
+        )
+        key = generator.randrange(value + 1)
+        if operation == "add_first":
+            list_.add_first(value)
+            expected_values.insert(0, value)
+        elif operation == "add_last":
+            list_.add_last(value)
+            expected_values.append(value)
+        elif operation == "insert_after":
+            list_.insert_after(key, value)
+            if key in expected_values:
+                expected_values.insert(expected_values.index(key) + 1, value)
+        elif operation == "insert_before":
+            list_.insert_before(key, value)
+            if key in expected_values:
+                expected_values.insert(expected_values.index(key), value)
+        else:
+            list_.delete(key)
+            if key in expected_values:
+                expected_values.remove(key)
+
+        assert_values(list_, expected_values)
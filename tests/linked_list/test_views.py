@@ -0,0 +1,158 @@
+"""Tests for the linked list views."""
+
+import pytest
+
+from library import linked_list
+from library.linked_list import views
+
+
+@pytest.mark.parametrize(
+    "values, start, stop, expected_values",
+    [
+        ([], None, None, []),
+        ([1, 2, 3], None, None, [1, 2, 3]),
+        ([1, 2, 3], 1, None, [2, 3]),
+        ([1, 2, 3], None, 2, [1, 2]),
+        ([1, 2, 3, 4], 1, 3, [2, 3]),
+        ([1, 2, 3], 1, 1, []),
+        ([1, 2, 3], 2, 1, []),
+        ([1, 2, 3], 1, 10, [2, 3]),
+        ([1, 2, 3], 5, 10, []),
+        ([1, 2, 3, 4], -3, -1, [2, 3]),
+    ],
+    ids=[
+        "empty",
+        "all",
+        "start",
+        "stop",
+        "middle",
+        "equal",
+        "stop before start",
+        "stop past end",
+        "start past end",
+        "negative",
+    ],
+)
+def test_view(values, start, stop, expected_values):
+    """
+    GIVEN list with values, start and stop
+    WHEN view is called with the start and stop
+    THEN a view with the expected values and length is returned.
+    """
+    list_ = linked_list.LinkedList.from_iterable(values)
+
+    view = list_.view(start, stop)
+
+    assert isinstance(view, views.View)
+    assert list(view) == expected_values
+    assert len(view) == len(expected_values)
+
+
+def test_view_lazy():
+    """
+    GIVEN view of a list
+    WHEN the list is changed before the view is iterated over
+    THEN the view has the values of the changed list.
+    """
+    list_ = linked_list.LinkedList.from_iterable([1, 2, 3])
+    view = list_.view(1)
+
+    list_.add_first(0)
+
+    assert list(view) == [1, 2, 3]
+    assert list(view) == [1, 2, 3]
+
+
+def test_view_no_copy():
+    """
+    GIVEN list with values that are objects
+    WHEN view is iterated over
+    THEN the values of the list are returned rather than copies.
+    """
+    values = [[1], [2], [3]]
+    list_ = linked_list.LinkedList.from_iterable(values)
+
+    assert all(value is values[1] for value in list_.view(1, 2))
+
+
+@pytest.mark.parametrize(
+    "values, start, stop, expected_values",
+    [
+        ([], 1, 2, []),
+        ([1, 2, 3], 4, 2, []),
+        ([1, 2, 3], 1, 3, [1, 2]),
+        ([1, 2, 3, 4], 2, 4, [2, 3]),
+        ([1, 2, 3], 2, 4, [2, 3]),
+        ([1, 2, 1, 2], 1, 1, [1, 2]),
+        ([3, 2, 1, 2, 3, 2], 2, 3, [2, 1, 2]),
+    ],
+    ids=[
+        "empty",
+        "start not found",
+        "start first",
+        "middle",
+        "stop not found",
+        "same",
+        "stop before start",
+    ],
+)
+def test_between(values, start, stop, expected_values):
+    """
+    GIVEN list with values, start and stop values
+    WHEN between is called with the start and stop values
+    THEN a view with the expected values is returned.
+    """
+    list_ = linked_list.LinkedList.from_iterable(values)
+
+    view = list_.between(start, stop)
+
+    assert isinstance(view, views.Between)
+    assert list(view) == expected_values
+
+
+@pytest.mark.parametrize(
+    "create_view",
+    [
+        lambda list_: list_.view(),
+        lambda list_: list_.view(0, 3),
+        lambda list_: list_.between(1, 4),
+    ],
+    ids=["view", "view range", "between"],
+)
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda list_: list_.add_last(4),
+        lambda list_: list_.delete(2),
+        lambda list_: list_.reverse(),
+        lambda list_: list_.sort(reverse=True),
+        lambda list_: list_.clear(),
+    ],
+    ids=["add", "delete", "reverse", "sort", "clear"],
+)
+def test_change_during_iteration(create_view, change):
+    """
+    GIVEN view of a list that is being iterated over
+    WHEN the list is changed
+    THEN RuntimeError is raised on the next step.
+    """
+    list_ = linked_list.LinkedList.from_iterable([1, 2, 3])
+    iterator = iter(create_view(list_))
+    assert next(iterator) == 1
+
+    change(list_)
+
+    with pytest.raises(RuntimeError):
+        next(iterator)
+
+
+def test_extend_with_view():
+    """
+    GIVEN list
+    WHEN extend is called with a view of the list up to a value that is not found
+    THEN RuntimeError is raised rather than adding values endlessly.
+    """
+    list_ = linked_list.LinkedList.from_iterable([1, 2, 3])
+
+    with pytest.raises(RuntimeError):
+        list_.extend(list_.between(1, 4))
@@ -0,0 +1,274 @@
+"""Tests for the stack."""
+# pylint: disable=redefined-outer-name,protected-access
+
+import functools
+
+import pytest
+
+from library import stack
+
+
+@pytest.fixture(
+    params=[
+        stack.Stack,
+        stack.ArrayStack,
+        functools.partial(stack.ArrayStack, capacity=1, shrink=True),
+    ],
+    ids=["linked", "array", "array shrink"],
+)
+def stack_class(request):
+    """Class of the stacks with the same interface."""
+    return request.param
+
+
+def test_node_slots():
+    """
+    GIVEN node
+    WHEN the attributes of the node are checked
+    THEN the node has no per instance dictionary.
+    """
+    node = stack._Node("value 1")
+
+    assert not hasattr(node, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "values",
+    [[], ["value 1"], ["value 1", "value 2"]],
+    ids=["empty", "single", "multiple"],
+)
+def test_push_pop(values, stack_class):
+    """
+    GIVEN values
+    WHEN a stack is created, all values are added and then popped back
+    THEN values are returned in the first in last out order and StackEmptyError is
+        raised after all values are popped.
+    """
+    test_stack = stack_class()
+
+    for value in values:
+        test_stack.push(value)
+
+    for expected_value in reversed(values):
+        value = test_stack.pop()
+        assert value == expected_value
+
+    with pytest.raises(stack.StackEmptyError):
+        test_stack.pop()
+
+
+def test_peek_empty(stack_class):
+    """
+    GIVEN empty stack
+    WHEN peek is called
+    THEN StackEmptyError is raised.
+    """
+    test_stack = stack_class()
+
+    with pytest.raises(stack.StackEmptyError):
+        test_stack.peek()
+
+
+@pytest.mark.parametrize(
+    "values, expected_value",
+    [(["value 1"], "value 1"), (["value 1", "value 2"], "value 2")],
+    ids=["single", "multiple"],
+)
+def test_peek_single(values, expected_value, stack_class):
+    """
+    GIVEN values to push and expected value
+    WHEN values are pushed onto the stack and peek is called
+    THEN the expected value is returned and all values can still be popped from the
+        stack.
+    """
+    test_stack = stack_class()
+    for value in values:
+        test_stack.push(value)
+
+    returned_value = test_stack.peek()
+
+    assert returned_value == expected_value
+
+    for value in reversed(values):
+        assert test_stack.pop() == value
+
+
+@pytest.mark.parametrize(
+    "values, expected_result",
+    [([], True), (["value 1"], False), (["value 1", "value 2"], False)],
+    ids=["empty", "single", "multiple"],
+)
+def test_is_empty_single(values, expected_result, stack_class):
+    """
+    GIVEN values to push and expected empty test result
+    WHEN values are pushed onto the stack and is_empty is called
+    THEN the expected test result is returned.
+    """
+    test_stack = stack_class()
+    for value in values:
+        test_stack.push(value)
+
+    result = test_stack.is_empty()
+
+    assert result == expected_result
+
+
+@pytest.mark.parametrize(
+    "values, pushed, expected_values",
+    [
+        ([], [], []),
+        ([], [1, 2, 3], [3, 2, 1]),
+        ([1], [2, 3], [3, 2, 1]),
+        ([1, 2], [], [2, 1]),
+    ],
+    ids=["empty", "empty stack", "multiple", "nothing pushed"],
+)
+def test_push_many(values, pushed, expected_values, stack_class):
+    """
+    GIVEN stack with values and values to push
+    WHEN push_many is called with an iterator over the values to push
+    THEN the values are popped in the expected order and the length is updated.
+    """
+    test_stack = stack_class()
+    for value in values:
+        test_stack.push(value)
+
+    test_stack.push_many(iter(pushed))
+
+    assert len(test_stack) == len(expected_values)
+    assert [test_stack.pop() for _ in expected_values] == expected_values
+    assert test_stack.is_empty()
+
+
+def test_push_many_raises(stack_class):
+    """
+    GIVEN stack with a value and iterable that raises after some values
+    WHEN push_many is called with the iterable
+    THEN the error is raised and the stack is unchanged.
+    """
+    test_stack = stack_class()
+    test_stack.push(1)
+
+    def values():
+        """Generate values and then raise."""
+        yield 2
+        yield 3
+        raise KeyError
+
+    with pytest.raises(KeyError):
+        test_stack.push_many(values())
+
+    assert len(test_stack) == 1
+    assert test_stack.pop() == 1
+
+
+@pytest.mark.parametrize(
+    "count, expected_values, expected_remaining",
+    [(0, [], [3, 2, 1]), (2, [3, 2], [1]), (3, [3, 2, 1], [])],
+    ids=["none", "some", "all"],
+)
+def test_pop_many(count, expected_values, expected_remaining, stack_class):
+    """
+    GIVEN stack with values and count
+    WHEN pop_many is called with the count
+    THEN the top values are returned in last in first out order and the rest remain.
+    """
+    test_stack = stack_class()
+    test_stack.push_many([1, 2, 3])
+
+    values = test_stack.pop_many(count)
+
+    assert values == expected_values
+    assert len(test_stack) == len(expected_remaining)
+    assert test_stack.pop_many(len(expected_remaining)) == expected_remaining
+
+
+@pytest.mark.parametrize(
+    "count, expected_error",
+    [(4, stack.StackEmptyError), (-1, ValueError)],
+    ids=["too many", "negative"],
+)
+def test_pop_many_invalid(count, expected_error, stack_class):
+    """
+    GIVEN stack with values and invalid count
+    WHEN pop_many is called with the count
+    THEN the expected error is raised and the stack is unchanged.
+    """
+    test_stack = stack_class()
+    test_stack.push_many([1, 2, 3])
+
+    with pytest.raises(expected_error):
+        test_stack.pop_many(count)
+
+    assert test_stack.pop_many(3) == [3, 2, 1]
+
+
+def test_len(stack_class):
+    """
+    GIVEN stack
+    WHEN values are pushed and popped
+    THEN the length is the number of values on the stack.
+    """
+    test_stack = stack_class()
+    assert len(test_stack) == 0
+
+    test_stack.push(1)
+    test_stack.push(2)
+    assert len(test_stack) == 2
+
+    test_stack.pop()
+    assert len(test_stack) == 1
+
+
+@pytest.mark.parametrize(
+    "fork", [stack.Stack.fork, stack.Stack.snapshot], ids=["fork", "snapshot"]
+)
+def test_fork(fork):
+    """
+    GIVEN stack with values
+    WHEN the stack is forked and both stacks are pushed onto and popped from
+    THEN the stacks do not change each other.
+    """
+    test_stack = stack.Stack()
+    test_stack.push_many([1, 2, 3])
+
+    forked = fork(test_stack)
+    assert forked is not test_stack
+    assert len(forked) == 3
+    test_stack.push(4)
+    forked.pop()
+    forked.push(5)
+
+    assert test_stack.pop_many(4) == [4, 3, 2, 1]
+    assert forked.pop_many(3) == [5, 2, 1]
+    assert test_stack.is_empty() is True
+    assert forked.is_empty() is True
+
+
+def test_fork_shares_nodes():
+    """
+    GIVEN stack with values
+    WHEN the stack is forked
+    THEN the stacks share the top node.
+    """
+    test_stack = stack.Stack()
+    test_stack.push_many([1, 2])
+
+    forked = test_stack.fork()
+
+    assert forked._list.head is test_stack._list.head
+
+
+def test_fork_empty():
+    """
+    GIVEN empty stack
+    WHEN the stack is forked and a value is pushed onto the fork
+    THEN the stack is still empty.
+    """
+    test_stack = stack.Stack()
+
+    forked = test_stack.fork()
+    forked.push(1)
+
+    assert test_stack.is_empty() is True
+    assert len(forked) == 1
@@ -0,0 +1,92 @@
+"""Tests for the aggregate stack."""
+
+import operator
+
+import pytest
+
+from library import stack
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda test_stack: test_stack.pop(),
+        lambda test_stack: test_stack.peek(),
+        lambda test_stack: test_stack.minimum(),
+        lambda test_stack: test_stack.maximum(),
+        lambda test_stack: test_stack.aggregate(),
+    ],
+    ids=["pop", "peek", "minimum", "maximum", "aggregate"],
+)
+def test_empty(operation):
+    """
+    GIVEN empty aggregate stack
+    WHEN an operation that needs a value is called
+    THEN StackEmptyError is raised.
+    """
+    test_stack = stack.AggregateStack(operator.add)
+
+    assert test_stack.is_empty() is True
+    with pytest.raises(stack.StackEmptyError):
+        operation(test_stack)
+
+
+def test_push_pop():
+    """
+    GIVEN values
+    WHEN the values are pushed onto an aggregate stack and then popped
+    THEN after each operation the minimum, maximum and sum are of the values on the
+        stack.
+    """
+    values = [5, 3, 8, 3, 1, 9, 2]
+    test_stack = stack.AggregateStack(operator.add)
+
+    for index, value in enumerate(values):
+        test_stack.push(value)
+        on_stack = values[: index + 1]
+        assert test_stack.peek() == value
+        assert test_stack.minimum() == min(on_stack)
+        assert test_stack.maximum() == max(on_stack)
+        assert test_stack.aggregate() == sum(on_stack)
+        assert len(test_stack) == len(on_stack)
+
+    for index in range(len(values) - 1, 0, -1):
+        assert test_stack.pop() == values[index]
+        on_stack = values[:index]
+        assert test_stack.minimum() == min(on_stack)
+        assert test_stack.maximum() == max(on_stack)
+        assert test_stack.aggregate() == sum(on_stack)
+
+    assert test_stack.pop() == values[0]
+    assert test_stack.is_empty() is True
+
+
+def test_aggregate_order():
+    """
+    GIVEN aggregate stack with a function that is not commutative
+    WHEN values are pushed
+    THEN the aggregate combines the values from the bottom to the top.
+    """
+    test_stack = stack.AggregateStack(operator.add)
+
+    for value in ["a", "b", "c"]:
+        test_stack.push(value)
+
+    assert test_stack.aggregate() == "abc"
+
+
+def test_no_function():
+    """
+    GIVEN aggregate stack without a function with values
+    WHEN aggregate is called
+    THEN ValueError is raised and the minimum and maximum are still available.
+    """
+    test_stack = stack.AggregateStack()
+    test_stack.push(2)
+    test_stack.push(1)
+
+    with pytest.raises(ValueError):
+        test_stack.aggregate()
+
+    assert test_stack.minimum() == 1
+    assert test_stack.maximum() == 2
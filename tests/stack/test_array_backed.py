@@ -0,0 +1,130 @@
+"""Tests for the array backed stack."""
+
+import gc
+import weakref
+
+import pytest
+
+from library import stack
+
+
+@pytest.mark.parametrize("capacity", [0, -1], ids=["zero", "negative"])
+def test_construct_invalid_capacity(capacity):
+    """
+    GIVEN capacity less than 1
+    WHEN ArrayStack is constructed with the capacity
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        stack.ArrayStack(capacity)
+
+
+@pytest.mark.parametrize(
+    "count, expected_capacity",
+    [(0, 2), (2, 2), (3, 4), (5, 8)],
+    ids=["empty", "full", "grown", "grown twice"],
+)
+def test_push_grow(count, expected_capacity):
+    """
+    GIVEN stack with a capacity, number of values and expected capacity
+    WHEN the number of values are pushed
+    THEN the stack has the expected capacity and the values can be popped.
+    """
+    test_stack = stack.ArrayStack(capacity=2)
+
+    for value in range(count):
+        test_stack.push(value)
+
+    assert test_stack.capacity == expected_capacity
+    assert [test_stack.pop() for _ in range(count)] == list(range(count - 1, -1, -1))
+
+
+@pytest.mark.parametrize(
+    "shrink, pops, expected_capacity",
+    [
+        (False, 16, 16),
+        (True, 11, 16),
+        (True, 12, 8),
+        (True, 14, 4),
+        (True, 15, 2),
+        (True, 16, 2),
+    ],
+    ids=["no shrink", "above quarter", "quarter", "twice", "minimum", "empty"],
+)
+def test_pop_shrink(shrink, pops, expected_capacity):
+    """
+    GIVEN stack with an initial capacity grown by pushing and shrink setting
+    WHEN values are popped
+    THEN the stack has the expected capacity and the remaining values.
+    """
+    test_stack = stack.ArrayStack(capacity=2, shrink=shrink)
+    for value in range(16):
+        test_stack.push(value)
+
+    for _ in range(pops):
+        test_stack.pop()
+
+    assert test_stack.capacity == expected_capacity
+    remaining = []
+    while not test_stack.is_empty():
+        remaining.append(test_stack.pop())
+    assert remaining == list(range(15 - pops, -1, -1))
+
+
+def test_pop_releases_value():
+    """
+    GIVEN stack with a value that is only referenced by the stack
+    WHEN the value is popped and the returned reference is deleted
+    THEN the value is garbage collected.
+    """
+
+    class Value:  # pylint: disable=too-few-public-methods
+        """Value that can be weakly referenced."""
+
+    test_stack = stack.ArrayStack()
+    test_stack.push(Value())
+    reference = weakref.ref(test_stack.peek())
+
+    test_stack.pop()
+    gc.collect()
+
+    assert reference() is None
+
+
+@pytest.mark.parametrize(
+    "count, expected_capacity",
+    [(0, 2), (2, 2), (3, 4), (9, 16)],
+    ids=["empty", "full", "grown", "grown multiple times"],
+)
+def test_push_many_grow(count, expected_capacity):
+    """
+    GIVEN stack with a capacity, number of values and expected capacity
+    WHEN push_many is called with the number of values
+    THEN the stack has the expected capacity and the values.
+    """
+    test_stack = stack.ArrayStack(capacity=2)
+
+    test_stack.push_many(range(count))
+
+    assert test_stack.capacity == expected_capacity
+    assert test_stack.pop_many(count) == list(range(count - 1, -1, -1))
+
+
+@pytest.mark.parametrize(
+    "shrink, count, expected_capacity",
+    [(False, 16, 16), (True, 11, 16), (True, 12, 8), (True, 15, 2), (True, 16, 2)],
+    ids=["no shrink", "above quarter", "quarter", "multiple times", "empty"],
+)
+def test_pop_many_shrink(shrink, count, expected_capacity):
+    """
+    GIVEN stack with an initial capacity grown by pushing and shrink setting
+    WHEN pop_many is called with a count
+    THEN the stack has the expected capacity and the remaining values.
+    """
+    test_stack = stack.ArrayStack(capacity=2, shrink=shrink)
+    test_stack.push_many(range(16))
+
+    test_stack.pop_many(count)
+
+    assert test_stack.capacity == expected_capacity
+    assert test_stack.pop_many(16 - count) == list(range(15 - count, -1, -1))
@@ -0,0 +1,194 @@
+"""Tests for the blocking stack."""
+
+import threading
+import time
+
+import pytest
+
+from library import stack
+
+
+def start_thread(target):
+    """
+    Run a function in a new thread.
+
+    Args:
+        target: The function to run.
+
+    Returns:
+        The started thread and a list to which the return value is appended.
+
+    """
+    results = []
+    thread = threading.Thread(target=lambda: results.append(target()))
+    thread.start()
+    return thread, results
+
+
+def test_push_pop():
+    """
+    GIVEN blocking stack
+    WHEN values are pushed and popped
+    THEN the values are popped in last in first out order.
+    """
+    test_stack = stack.BlockingStack()
+
+    test_stack.push(1)
+    test_stack.push(2)
+
+    assert len(test_stack) == 2
+    assert test_stack.peek() == 2
+    assert test_stack.pop() == 2
+    assert test_stack.pop() == 1
+    assert test_stack.is_empty() is True
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"block": False}, {"timeout": 0.01}], ids=["no block", "timeout"]
+)
+def test_pop_empty(kwargs):
+    """
+    GIVEN empty blocking stack
+    WHEN pop is called without blocking or with a timeout
+    THEN StackEmptyError is raised.
+    """
+    test_stack = stack.BlockingStack()
+
+    with pytest.raises(stack.StackEmptyError):
+        test_stack.pop(**kwargs)
+
+
+def test_peek_empty():
+    """
+    GIVEN empty blocking stack
+    WHEN peek is called
+    THEN StackEmptyError is raised.
+    """
+    test_stack = stack.BlockingStack()
+
+    with pytest.raises(stack.StackEmptyError):
+        test_stack.peek()
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"block": False}, {"timeout": 0.01}], ids=["no block", "timeout"]
+)
+def test_push_full(kwargs):
+    """
+    GIVEN full blocking stack
+    WHEN push is called without blocking or with a timeout
+    THEN StackFullError is raised and the stack is unchanged.
+    """
+    test_stack = stack.BlockingStack(maxsize=1)
+    test_stack.push(1)
+
+    with pytest.raises(stack.StackFullError):
+        test_stack.push(2, **kwargs)
+
+    assert test_stack.is_full() is True
+    assert test_stack.pop() == 1
+
+
+@pytest.mark.parametrize("maxsize", [0, -1], ids=["zero", "negative"])
+def test_unbounded(maxsize):
+    """
+    GIVEN blocking stack with maxsize that is not positive
+    WHEN values are pushed without blocking
+    THEN the stack is never full.
+    """
+    test_stack = stack.BlockingStack(maxsize=maxsize)
+
+    for value in range(100):
+        test_stack.push(value, block=False)
+
+    assert test_stack.is_full() is False
+    assert len(test_stack) == 100
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda test_stack: test_stack.pop(timeout=-1),
+        lambda test_stack: test_stack.push(1, timeout=-1),
+    ],
+    ids=["pop", "push"],
+)
+def test_negative_timeout(operation):
+    """
+    GIVEN blocking stack
+    WHEN an operation is called with a negative timeout
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        operation(stack.BlockingStack())
+
+
+def test_pop_waits_for_push():
+    """
+    GIVEN thread waiting to pop from an empty blocking stack
+    WHEN a value is pushed
+    THEN the waiting thread pops the value.
+    """
+    test_stack = stack.BlockingStack()
+    thread, results = start_thread(lambda: test_stack.pop(timeout=10))
+    time.sleep(0.01)
+
+    test_stack.push(1)
+    thread.join()
+
+    assert results == [1]
+    assert test_stack.is_empty() is True
+
+
+def test_push_waits_for_pop():
+    """
+    GIVEN thread waiting to push onto a full blocking stack
+    WHEN a value is popped
+    THEN the waiting thread pushes its value.
+    """
+    test_stack = stack.BlockingStack(maxsize=1)
+    test_stack.push(1)
+    thread, _ = start_thread(lambda: test_stack.push(2, timeout=10))
+    time.sleep(0.01)
+
+    value = test_stack.pop()
+    thread.join()
+
+    assert value == 1
+    assert test_stack.pop(block=False) == 2
+
+
+def test_producers_consumers():
+    """
+    GIVEN bounded blocking stack
+    WHEN several threads push values and several threads pop values
+    THEN every value is popped exactly once.
+    """
+    test_stack = stack.BlockingStack(maxsize=4)
+    count = 1000
+
+    def produce(start):
+        """Push a range of values."""
+        for value in range(start, start + count):
+            test_stack.push(value, timeout=10)
+
+    def consume():
+        """Pop a number of values."""
+        return [test_stack.pop(timeout=10) for _ in range(count)]
+
+    producers = [
+        threading.Thread(target=produce, args=(start,))
+        for start in range(0, 3 * count, count)
+    ]
+    consumers = [start_thread(consume) for _ in range(3)]
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join()
+    popped = []
+    for consumer, results in consumers:
+        consumer.join()
+        popped.extend(results[0])
+
+    assert sorted(popped) == list(range(3 * count))
+    assert test_stack.is_empty() is True
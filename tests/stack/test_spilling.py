@@ -0,0 +1,187 @@
+"""Tests for the stack that spills to a file."""
+# pylint: disable=protected-access
+
+import os
+import threading
+
+import pytest
+
+from library import stack
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"segment_size": 0}, {"memory_segments": 0}],
+    ids=["segment size", "memory segments"],
+)
+def test_construct_invalid(kwargs):
+    """
+    GIVEN invalid arguments
+    WHEN SpillingStack is constructed with the arguments
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        stack.SpillingStack(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [lambda test_stack: test_stack.pop(), lambda test_stack: test_stack.peek()],
+    ids=["pop", "peek"],
+)
+def test_empty(operation):
+    """
+    GIVEN empty spilling stack
+    WHEN pop or peek is called
+    THEN StackEmptyError is raised.
+    """
+    with stack.SpillingStack() as test_stack:
+        assert test_stack.is_empty() is True
+        with pytest.raises(stack.StackEmptyError):
+            operation(test_stack)
+
+
+@pytest.mark.parametrize(
+    "count, expected_spilled",
+    [(0, 0), (4, 0), (6, 0), (7, 2), (11, 6), (12, 6)],
+    ids=["empty", "one segment", "memory full", "spilled", "spilled twice", "full"],
+)
+def test_push_spill(count, expected_spilled):
+    """
+    GIVEN spilling stack with a segment size and number of memory segments
+    WHEN a number of values are pushed
+    THEN the expected number of values are in the file and the values are popped in
+        last in first out order.
+    """
+    with stack.SpillingStack(segment_size=2, memory_segments=3) as test_stack:
+        for value in range(count):
+            test_stack.push(value)
+
+        assert test_stack.spilled == expected_spilled
+        assert len(test_stack) == count
+        values = []
+        while not test_stack.is_empty():
+            assert test_stack.peek() == count - 1 - len(values)
+            values.append(test_stack.pop())
+        assert values == list(range(count - 1, -1, -1))
+        assert test_stack.spilled == 0
+
+
+def test_interleaved():
+    """
+    GIVEN spilling stack with small segments
+    WHEN values are pushed and popped in an interleaved way
+    THEN the values are the same as for an array backed stack.
+    """
+    expected_stack = stack.ArrayStack()
+    with stack.SpillingStack(segment_size=3, memory_segments=1) as test_stack:
+        for round_ in range(20):
+            for value in range(round_ % 7 + 3):
+                test_stack.push((round_, value))
+                expected_stack.push((round_, value))
+            for _ in range(round_ % 5):
+                assert test_stack.pop() == expected_stack.pop()
+            assert len(test_stack) == len(expected_stack)
+
+        while not expected_stack.is_empty():
+            assert test_stack.pop() == expected_stack.pop()
+        assert test_stack.is_empty() is True
+
+
+def test_file_truncated(tmp_path):
+    """
+    GIVEN spilling stack with a directory and values that have been spilled
+    WHEN the spilled values are popped
+    THEN the file in the directory shrinks back to empty.
+    """
+    with stack.SpillingStack(
+        segment_size=2, memory_segments=1, directory=tmp_path
+    ) as test_stack:
+        for value in range(10):
+            test_stack.push(value)
+        file_size = os.fstat(test_stack._file.fileno()).st_size
+        assert file_size > 0
+
+        for _ in range(9):
+            test_stack.pop()
+
+        assert os.fstat(test_stack._file.fileno()).st_size == 0
+
+
+def test_spill_unpicklable():
+    """
+    GIVEN spilling stack with a value that cannot be pickled in the segment to spill
+    WHEN a value is pushed that needs the segment to be spilled
+    THEN the error is raised and the stack is unchanged.
+    """
+    lock = threading.Lock()
+    with stack.SpillingStack(segment_size=2, memory_segments=1) as test_stack:
+        test_stack.push(1)
+        test_stack.push(lock)
+
+        with pytest.raises(TypeError):
+            test_stack.push(3)
+
+        assert len(test_stack) == 2
+        assert test_stack.spilled == 0
+        assert test_stack.pop() is lock
+        assert test_stack.pop() == 1
+        assert test_stack.is_empty() is True
+
+
+class _FailingWriteFile:
+    """File that writes part of the data and then raises OSError."""
+
+    def __init__(self, file):
+        """Construct."""
+        self._file = file
+
+    def __getattr__(self, name):
+        """Use the attribute of the file."""
+        return getattr(self._file, name)
+
+    def write(self, data):
+        """Write the first byte of the data and raise OSError."""
+        self._file.write(data[:1])
+        raise OSError("No space left on device.")
+
+
+def test_spill_write_fails(tmp_path):
+    """
+    GIVEN spilling stack that has spilled values and a file that fails to write
+    WHEN a value is pushed that needs a segment to be spilled
+    THEN the error is raised, the file is truncated and the stack is unchanged.
+    """
+    with stack.SpillingStack(
+        segment_size=1, memory_segments=1, directory=tmp_path
+    ) as test_stack:
+        test_stack.push(1)
+        test_stack.push(2)
+        file_size = test_stack._file.seek(0, 2)
+        test_stack._file = _FailingWriteFile(test_stack._file)
+
+        with pytest.raises(OSError):
+            test_stack.push(3)
+
+        assert test_stack._file.seek(0, 2) == file_size
+        assert len(test_stack) == 2
+        assert test_stack.spilled == 1
+        assert [test_stack.pop(), test_stack.pop()] == [2, 1]
+        assert test_stack.is_empty() is True
+
+
+def test_close():
+    """
+    GIVEN spilling stack that has spilled values
+    WHEN close is called twice
+    THEN the file is closed.
+    """
+    test_stack = stack.SpillingStack(segment_size=1, memory_segments=1)
+    test_stack.push(1)
+    test_stack.push(2)
+    file = test_stack._file
+
+    test_stack.close()
+    test_stack.close()
+
+    assert file.closed is True
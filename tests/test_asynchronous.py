@@ -0,0 +1,212 @@
+"""Tests for the stack and queue for coroutines."""
+
+import asyncio
+
+import pytest
+
+from library import asynchronous
+from library import queue
+from library import stack
+
+
+def test_stack_push_pop():
+    """
+    GIVEN async stack
+    WHEN values are pushed and popped
+    THEN the values are popped in last in first out order.
+    """
+
+    async def run():
+        """Push and pop the values."""
+        test_stack = asynchronous.AsyncStack()
+        await test_stack.push(1)
+        test_stack.push_nowait(2)
+        assert len(test_stack) == 2
+        return [await test_stack.pop(), test_stack.pop_nowait()]
+
+    assert asyncio.run(run()) == [2, 1]
+
+
+def test_stack_nowait_errors():
+    """
+    GIVEN empty and full async stack
+    WHEN pop_nowait and push_nowait are called
+    THEN StackEmptyError and StackFullError are raised.
+    """
+    test_stack = asynchronous.AsyncStack(maxsize=1)
+
+    with pytest.raises(stack.StackEmptyError):
+        test_stack.pop_nowait()
+    test_stack.push_nowait(1)
+    with pytest.raises(stack.StackFullError):
+        test_stack.push_nowait(2)
+
+    assert test_stack.is_full() is True
+    assert test_stack.is_empty() is False
+
+
+@pytest.mark.parametrize("maxsize", [0, -1], ids=["zero", "negative"])
+def test_stack_unbounded(maxsize):
+    """
+    GIVEN async stack with maxsize that is not positive
+    WHEN values are pushed
+    THEN the stack is never full.
+    """
+    test_stack = asynchronous.AsyncStack(maxsize=maxsize)
+
+    for value in range(100):
+        test_stack.push_nowait(value)
+
+    assert test_stack.is_full() is False
+
+
+def test_stack_pop_waits_for_push():
+    """
+    GIVEN coroutines waiting to pop from an empty async stack
+    WHEN values are pushed
+    THEN the waiting coroutines are woken in the order that they waited.
+    """
+
+    async def run():
+        """Pop in tasks and then push."""
+        test_stack = asynchronous.AsyncStack()
+        tasks = [asyncio.create_task(test_stack.pop()) for _ in range(3)]
+        await asyncio.sleep(0)
+        for value in range(3):
+            await test_stack.push(value)
+            await asyncio.sleep(0)
+        return [await task for task in tasks]
+
+    assert asyncio.run(run()) == [0, 1, 2]
+
+
+def test_stack_push_waits_for_pop():
+    """
+    GIVEN coroutine waiting to push onto a full async stack
+    WHEN a value is popped
+    THEN the waiting coroutine pushes its value.
+    """
+
+    async def run():
+        """Push in a task and then pop."""
+        test_stack = asynchronous.AsyncStack(maxsize=1)
+        await test_stack.push(1)
+        task = asyncio.create_task(test_stack.push(2))
+        await asyncio.sleep(0)
+        assert task.done() is False
+        value = await test_stack.pop()
+        await task
+        return [value, await test_stack.pop()]
+
+    assert asyncio.run(run()) == [1, 2]
+
+
+def test_queue_enqueue_dequeue():
+    """
+    GIVEN async queue
+    WHEN values are enqueued and dequeued
+    THEN the values are dequeued in first in first out order.
+    """
+
+    async def run():
+        """Enqueue and dequeue the values."""
+        test_queue = asynchronous.AsyncQueue(length=2)
+        await test_queue.enqueue(1)
+        test_queue.enqueue_nowait(2)
+        assert len(test_queue) == 2
+        return [await test_queue.dequeue(), test_queue.dequeue_nowait()]
+
+    assert asyncio.run(run()) == [1, 2]
+
+
+def test_queue_nowait_errors():
+    """
+    GIVEN empty and full async queue
+    WHEN dequeue_nowait and enqueue_nowait are called
+    THEN QueueEmptyError and QueueFullError are raised.
+    """
+    test_queue = asynchronous.AsyncQueue(length=1)
+
+    with pytest.raises(queue.QueueEmptyError):
+        test_queue.dequeue_nowait()
+    test_queue.enqueue_nowait(1)
+    with pytest.raises(queue.QueueFullError):
+        test_queue.enqueue_nowait(2)
+
+    assert test_queue.is_full() is True
+    assert test_queue.is_empty() is False
+
+
+def test_queue_producer_consumer():
+    """
+    GIVEN small async queue
+    WHEN a producer enqueues more values than fit and a consumer dequeues them
+    THEN the consumer receives all the values in order.
+    """
+    count = 1000
+
+    async def run():
+        """Run the producer and consumer."""
+        test_queue = asynchronous.AsyncQueue(length=3)
+
+        async def produce():
+            """Enqueue the values."""
+            for value in range(count):
+                await test_queue.enqueue(value)
+
+        async def consume():
+            """Dequeue the values."""
+            return [await test_queue.dequeue() for _ in range(count)]
+
+        _, values = await asyncio.gather(produce(), consume())
+        return values
+
+    assert asyncio.run(run()) == list(range(count))
+
+
+def test_cancelled_waiter_skipped():
+    """
+    GIVEN two coroutines waiting to pop where the first has been cancelled
+    WHEN a value is pushed
+    THEN the second coroutine pops the value.
+    """
+
+    async def run():
+        """Cancel the first waiter and then push."""
+        test_stack = asynchronous.AsyncStack()
+        first = asyncio.create_task(test_stack.pop())
+        second = asyncio.create_task(test_stack.pop())
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+
+        await test_stack.push(1)
+
+        assert first.cancelled() is True
+        return await second
+
+    assert asyncio.run(run()) == 1
+
+
+def test_cancelled_after_wake_passes_on():
+    """
+    GIVEN two coroutines waiting to pop
+    WHEN a value is pushed and the woken coroutine is cancelled before it runs
+    THEN the wake up is passed on and the second coroutine pops the value.
+    """
+
+    async def run():
+        """Push and cancel the woken waiter in the same step."""
+        test_stack = asynchronous.AsyncStack()
+        first = asyncio.create_task(test_stack.pop())
+        second = asyncio.create_task(test_stack.pop())
+        await asyncio.sleep(0)
+
+        await test_stack.push(1)
+        first.cancel()
+
+        value = await second
+        assert first.cancelled() is True
+        return value
+
+    assert asyncio.run(run()) == 1
@@ -14,6 +14,15 @@ def leaf_node():
     return binary_tree.Node(0)
 
 
+def test_node_slots(leaf_node):
+    """
+    GIVEN leaf node
+    WHEN the attributes of the node are checked
+    THEN the node has no per instance dictionary.
+    """
+    assert not hasattr(leaf_node, "__dict__")
+
+
 def test_node_leaf_insert_less(leaf_node: binary_tree.Node):
     """
     GIVEN leaf node and value that is less than the node value
@@ -1,5 +1,7 @@
 """Tests for queue."""
-# pylint: disable=redefined-outer-name
+# pylint: disable=redefined-outer-name,protected-access
+
+import collections
 
 import pytest
 
@@ -168,3 +170,267 @@ def test_clear():
 
     assert test_queue.is_empty() is True
     test_queue.enqueue("value 2")
+
+
+@pytest.mark.parametrize("threshold", [-0.1, 0.5], ids=["negative", "half"])
+def test_invalid_shrink_threshold(threshold):
+    """
+    GIVEN shrink threshold that is negative or not less than a half
+    WHEN queue is constructed with the threshold
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        queue.Queue(shrink_threshold=threshold)
+
+
+@pytest.mark.parametrize(
+    "length, dequeued, count, expected_length",
+    [
+        (0, 0, 1, 1),
+        (2, 0, 2, 2),
+        (2, 0, 3, 4),
+        (2, 0, 5, 8),
+        (4, 3, 6, 8),
+    ],
+    ids=["zero length", "full", "grown", "grown twice", "wrapped"],
+)
+def test_grow(length, dequeued, count, expected_length):
+    """
+    GIVEN queue in growth mode with a length from which some values were dequeued
+    WHEN a number of values are enqueued
+    THEN the queue has the expected length and the values are dequeued in order.
+    """
+    test_queue = queue.Queue(length, grow=True, shrink_threshold=0)
+    for value in range(dequeued):
+        test_queue.enqueue(value)
+    for _ in range(dequeued):
+        test_queue.dequeue()
+
+    for value in range(count):
+        test_queue.enqueue(value)
+
+    assert test_queue.length == expected_length
+    assert test_queue.size == count
+    assert test_queue.get_front() == 0
+    assert [test_queue.dequeue() for _ in range(count)] == list(range(count))
+
+
+@pytest.mark.parametrize(
+    "threshold, dequeued, expected_length",
+    [(0, 15, 16), (0.25, 12, 16), (0.25, 13, 8), (0.25, 16, 2)],
+    ids=["no shrink", "at threshold", "below threshold", "minimum"],
+)
+def test_shrink(threshold, dequeued, expected_length):
+    """
+    GIVEN queue in growth mode that has grown and wrapped around and a threshold
+    WHEN a number of values are dequeued
+    THEN the queue has the expected length and the remaining values in order.
+    """
+    test_queue = queue.Queue(2, grow=True, shrink_threshold=threshold)
+    test_queue.enqueue(-1)
+    test_queue.dequeue()
+    for value in range(16):
+        test_queue.enqueue(value)
+
+    for value in range(dequeued):
+        assert test_queue.dequeue() == value
+
+    assert test_queue.length == expected_length
+    remaining = []
+    while not test_queue.is_empty():
+        remaining.append(test_queue.dequeue())
+    assert remaining == list(range(dequeued, 16))
+
+
+def test_grow_not_full():
+    """
+    GIVEN full queue in growth mode
+    WHEN a value is enqueued
+    THEN QueueFullError is not raised.
+    """
+    test_queue = queue.Queue(1, grow=True)
+    test_queue.enqueue("value 1")
+
+    test_queue.enqueue("value 2")
+
+    assert test_queue.size == 2
+
+
+def test_clear_grown():
+    """
+    GIVEN queue in growth mode that has grown
+    WHEN clear is called
+    THEN the queue is empty with its initial length.
+    """
+    test_queue = queue.Queue(2, grow=True)
+    for value in range(10):
+        test_queue.enqueue(value)
+
+    test_queue.clear()
+
+    assert test_queue.is_empty() is True
+    assert test_queue.length == 2
+    test_queue.enqueue("value 1")
+    assert test_queue.dequeue() == "value 1"
+
+
+@pytest.mark.parametrize(
+    "create_values",
+    [
+        lambda: [1, 2, 3],
+        lambda: (1, 2, 3),
+        lambda: range(1, 4),
+        lambda: iter([1, 2, 3]),
+        lambda: collections.deque([1, 2, 3]),
+    ],
+    ids=["list", "tuple", "range", "iterator", "deque"],
+)
+@pytest.mark.parametrize("offset", [0, 1, 2, 3], ids=["0", "1", "2", "3"])
+def test_enqueue_many(create_values, offset):
+    """
+    GIVEN queue with a value and the front moved by an offset and values
+    WHEN enqueue_many is called with the values
+    THEN the values are added after the value, wrapping around the end of the array.
+    """
+    test_queue = queue.Queue(4)
+    for _ in range(offset):
+        test_queue.enqueue(None)
+        test_queue.dequeue()
+    test_queue.enqueue(0)
+
+    test_queue.enqueue_many(create_values())
+
+    assert test_queue.size == 4
+    assert [test_queue.dequeue() for _ in range(4)] == [0, 1, 2, 3]
+    assert test_queue.is_empty() is True
+
+
+def test_enqueue_many_empty():
+    """
+    GIVEN queue with length 0
+    WHEN enqueue_many is called with no values
+    THEN the queue is still empty.
+    """
+    test_queue = queue.Queue(0)
+
+    test_queue.enqueue_many([])
+
+    assert test_queue.is_empty() is True
+
+
+def test_enqueue_many_full():
+    """
+    GIVEN queue with values
+    WHEN enqueue_many is called with more values than fit
+    THEN QueueFullError is raised and the queue is unchanged.
+    """
+    test_queue = queue.Queue(3)
+    test_queue.enqueue(0)
+
+    with pytest.raises(queue.QueueFullError):
+        test_queue.enqueue_many([1, 2, 3])
+
+    assert test_queue.size == 1
+    assert test_queue.dequeue() == 0
+
+
+@pytest.mark.parametrize(
+    "length, count, expected_length",
+    [(0, 3, 4), (2, 2, 2), (2, 3, 4), (2, 9, 16)],
+    ids=["zero length", "fits", "grown", "grown multiple times"],
+)
+def test_enqueue_many_grow(length, count, expected_length):
+    """
+    GIVEN queue in growth mode with a value that has wrapped around
+    WHEN enqueue_many is called with more values than fit
+    THEN the queue grows to the expected length and has all the values.
+    """
+    test_queue = queue.Queue(length, grow=True, shrink_threshold=0)
+    test_queue.enqueue(-1)
+    test_queue.dequeue()
+
+    test_queue.enqueue_many(range(count))
+
+    assert test_queue.length == expected_length
+    assert test_queue.drain() == list(range(count))
+
+
+@pytest.mark.parametrize("offset", [0, 1, 2, 3], ids=["0", "1", "2", "3"])
+@pytest.mark.parametrize("count", [0, 1, 3, 4], ids=["none", "one", "some", "all"])
+def test_dequeue_many(offset, count):
+    """
+    GIVEN full queue with the front moved by an offset and a count
+    WHEN dequeue_many is called with the count
+    THEN the values are returned from the front and the rest remain.
+    """
+    test_queue = queue.Queue(4)
+    for _ in range(offset):
+        test_queue.enqueue(None)
+        test_queue.dequeue()
+    test_queue.enqueue_many([0, 1, 2, 3])
+
+    values = test_queue.dequeue_many(count)
+
+    assert values == list(range(count))
+    assert test_queue.size == 4 - count
+    assert test_queue.drain() == list(range(count, 4))
+    assert test_queue.is_empty() is True
+    test_queue.enqueue_many([4, 5, 6, 7])
+    assert test_queue.drain() == [4, 5, 6, 7]
+
+
+@pytest.mark.parametrize(
+    "count, expected_error",
+    [(3, queue.QueueEmptyError), (-1, ValueError)],
+    ids=["too many", "negative"],
+)
+def test_dequeue_many_invalid(count, expected_error):
+    """
+    GIVEN queue with values and invalid count
+    WHEN dequeue_many is called with the count
+    THEN the expected error is raised and the queue is unchanged.
+    """
+    test_queue = queue.Queue(3)
+    test_queue.enqueue_many([1, 2])
+
+    with pytest.raises(expected_error):
+        test_queue.dequeue_many(count)
+
+    assert test_queue.drain() == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "threshold, count, expected_length",
+    [(0, 16, 16), (0.25, 12, 16), (0.25, 13, 8), (0.25, 15, 4), (0.25, 16, 2)],
+    ids=["no shrink", "at threshold", "below threshold", "multiple times", "all"],
+)
+def test_dequeue_many_shrink(threshold, count, expected_length):
+    """
+    GIVEN queue in growth mode that has grown and a threshold
+    WHEN dequeue_many is called with a count
+    THEN the queue has the expected length and the remaining values.
+    """
+    test_queue = queue.Queue(2, grow=True, shrink_threshold=threshold)
+    test_queue.enqueue_many(range(16))
+
+    values = test_queue.dequeue_many(count)
+
+    assert values == list(range(count))
+    assert test_queue.length == expected_length
+    assert test_queue.drain() == list(range(count, 16))
+
+
+def test_drain_releases_values():
+    """
+    GIVEN queue with values
+    WHEN drain is called
+    THEN the array of the queue no longer references the values.
+    """
+    test_queue = queue.Queue(3)
+    test_queue.enqueue("value 0")
+    test_queue.dequeue()
+    test_queue.enqueue_many(["value 1", "value 2", "value 3"])
+
+    assert test_queue.drain() == ["value 1", "value 2", "value 3"]
+
+    assert test_queue._list == [None, None, None]